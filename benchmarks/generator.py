@@ -0,0 +1,162 @@
+import random
+from datetime import date, timedelta
+from typing import List, Dict, Any, Optional
+
+MONTHS_GENITIVE = [
+    'января', 'февраля', 'марта', 'апреля', 'мая', 'июня',
+    'июля', 'августа', 'сентября', 'октября', 'ноября', 'декабря'
+]
+
+DESCRIPTIONS = [
+    'Оплата за хостинг PS.KZ', 'Получение зарплаты', 'Платеж поставщику', 'Комиссия банка',
+    'Возврат товара', 'Покупка продуктов METRO Cash & Carry', 'Перевод на карту', 'Снятие наличных',
+    'Оплата коммунальных услуг', 'Пополнение депозита', 'Kaspi магазин', 'Такси Yandex Go',
+    'Абонентская плата Beeline', 'Штраф ПДД', 'Аренда офиса №12', 'Зачисление кэшбэка'
+]
+
+TABLE_CONVENTIONS = [
+    {'date': '%d.%m.%Y', 'decimal': ',', 'thousands': ' ', 'currency': 'KZT', 'suffix': ' тг'},
+    {'date': '%Y-%m-%d', 'decimal': '.', 'thousands': ',', 'currency': 'USD', 'suffix': ''},
+    {'date': '%d/%m/%Y', 'decimal': ',', 'thousands': '.', 'currency': 'EUR', 'suffix': ' €'},
+    {'date': '%d.%m.%y', 'decimal': '.', 'thousands': '', 'currency': 'RUB', 'suffix': ' руб'},
+]
+
+TEXT_TEMPLATES = [
+    '{date} - {description} {amount} {currency}',
+    'Дата: {date}\n{description}\nИтого к оплате: {amount} {currency}',
+    '{date} {description} сумма {amount} {currency} списание',
+    '{date} поступление {amount} {currency} {description}',
+]
+
+TEXT_CURRENCIES = ['тг', 'тенге', '₸', 'руб', '$', 'евро']
+
+OCR_NOISE = [
+    'Чек No. {number}', 'Магазин: METRO Cash & Carry', 'Способ оплаты: Наличные',
+    'Кассир: Иванова А.', 'БИН 123456789012', 'Спасибо за покупку!', '-----------------'
+]
+
+
+class ParserOutputGenerator:
+    def __init__(self, seed: int = 42, start_date: date = date(2025, 1, 1)):
+        self.random = random.Random(seed)
+        self.start_date = start_date
+
+    def generate(self, files: int = 100, rows_per_table: int = 200,
+                 text_share: float = 0.3, error_share: float = 0.05,
+                 broken_row_share: float = 0.02) -> List[Dict[str, Any]]:
+        output = []
+        for i in range(files):
+            roll = self.random.random()
+            if roll < error_share:
+                output.append(self.error_file(i))
+            elif roll < error_share + text_share:
+                output.append(self.text_file(i, max(1, rows_per_table // 10)))
+            else:
+                output.append(self.table_file(i, rows_per_table, broken_row_share))
+        return output
+
+    def table_file(self, index: int, rows: int, broken_row_share: float = 0.02,
+                   convention: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        convention = convention or self.random.choice(TABLE_CONVENTIONS)
+        table = []
+        for _ in range(rows):
+            if self.random.random() < broken_row_share:
+                table.append(self.broken_row())
+                continue
+            amount = self.amount()
+            row = {
+                'transaction_date': self.date().strftime(convention['date']),
+                'description': self.description(),
+                'currency': convention['currency'] if self.random.random() < 0.7 else None
+            }
+            formatted = self.format_amount(amount, convention['decimal'], convention['thousands'])
+            layout = self.random.random()
+            if layout < 0.45:
+                row['debit'] = formatted + convention['suffix']
+                row['credit'] = None
+            elif layout < 0.8:
+                row['debit'] = None
+                row['credit'] = formatted + convention['suffix']
+            else:
+                row['amount'] = ('-' if self.random.random() < 0.5 else '') + formatted
+            table.append(row)
+        return {
+            'filename': f'statement_{index:05d}.csv',
+            'extracted_tables': [table],
+            'extracted_text': '',
+            'error': None
+        }
+
+    def text_file(self, index: int, operations: int) -> Dict[str, Any]:
+        lines = []
+        for _ in range(operations):
+            if self.random.random() < 0.3:
+                lines.append(self.random.choice(OCR_NOISE).format(number=self.random.randint(1000, 99999)))
+            transaction_date = self.date()
+            if self.random.random() < 0.2:
+                formatted_date = f'{transaction_date.day} {MONTHS_GENITIVE[transaction_date.month - 1]} {transaction_date.year}'
+            else:
+                formatted_date = transaction_date.strftime('%d.%m.%Y')
+            lines.append(self.random.choice(TEXT_TEMPLATES).format(
+                date=formatted_date,
+                description=self.description(),
+                amount=self.format_amount(self.amount(), ',', ' ') if self.random.random() < 0.5
+                else str(int(self.amount())),
+                currency=self.random.choice(TEXT_CURRENCIES)
+            ))
+        return {
+            'filename': f'scan_{index:05d}.pdf',
+            'extracted_tables': [],
+            'extracted_text': '\n'.join(self.ocr_noise(line) for line in lines),
+            'error': None
+        }
+
+    def error_file(self, index: int) -> Dict[str, Any]:
+        return {
+            'filename': f'corrupted_{index:05d}.xlsx',
+            'extracted_tables': [],
+            'extracted_text': '',
+            'error': 'Файл поврежден, не удается прочитать'
+        }
+
+    def broken_row(self) -> Dict[str, Any]:
+        return self.random.choice([
+            {'description': 'Нет даты', 'debit': '100'},
+            {'transaction_date': 'не указана', 'description': 'Плохая дата', 'debit': '100'},
+            {'transaction_date': '19.06.2025', 'description': 'Нет суммы', 'debit': None, 'credit': None},
+            {'transaction_date': '19.06.2025', 'description': 'Мусор', 'amount': 'abc'},
+            {'transaction_date': 20250619, 'description': 'Число вместо даты', 'debit': '100'},
+        ])
+
+    def date(self) -> date:
+        return self.start_date + timedelta(days=self.random.randint(0, 364))
+
+    def amount(self) -> float:
+        return round(self.random.lognormvariate(9, 1.5), 2)
+
+    def description(self) -> str:
+        description = self.random.choice(DESCRIPTIONS)
+        if self.random.random() < 0.3:
+            description += f' {self.random.randint(1, 9999)}'
+        if self.random.random() < 0.1:
+            description = '  ' + description + '\t'
+        return description
+
+    def format_amount(self, amount: float, decimal_separator: str, thousands_separator: str) -> str:
+        integer, fraction = f'{amount:.2f}'.split('.')
+        groups = []
+        while len(integer) > 3:
+            groups.insert(0, integer[-3:])
+            integer = integer[:-3]
+        groups.insert(0, integer)
+        formatted = thousands_separator.join(groups)
+        if fraction != '00' or self.random.random() < 0.5:
+            formatted += decimal_separator + fraction
+        return formatted
+
+    def ocr_noise(self, line: str) -> str:
+        if self.random.random() < 0.15:
+            line = '   ' + line
+        if self.random.random() < 0.05:
+            line = line.replace('о', '0', 1)
+        return line
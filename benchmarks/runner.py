@@ -0,0 +1,234 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Callable, Iterable, Optional
+from benchmarks.generator import ParserOutputGenerator
+from src.models.parser_models import ProcessingConfig
+from src.processors.main_processor import DataStandardizationService
+
+BENCHMARK_VERSION = 1
+
+DEFAULT_TOLERANCE = 0.3
+
+# sub-0.1ms per-item latencies are dominated by timer noise
+MIN_COMPARED_LATENCY_MS = 0.1
+
+HIGHER_IS_BETTER = ['rows_per_sec']
+
+LOWER_IS_BETTER = ['p50_ms', 'p99_ms', 'peak_memory_mb', 'import_ms', 'construct_ms', 'first_result_ms', 'total_ms']
+
+
+def percentile(values: List[float], share: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = share * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure(items: Iterable[Any], func: Callable[[Any], Any], repeat: int = 1) -> Dict[str, float]:
+    items = list(items)
+    best_seconds = None
+    best_latencies = []
+    for _ in range(repeat):
+        latencies = []
+        started = time.perf_counter()
+        for item in items:
+            item_started = time.perf_counter()
+            func(item)
+            latencies.append(time.perf_counter() - item_started)
+        seconds = time.perf_counter() - started
+        if best_seconds is None or seconds < best_seconds:
+            best_seconds = seconds
+            best_latencies = latencies
+    return {
+        'rows': len(items),
+        'seconds': best_seconds or 0.0,
+        'rows_per_sec': len(items) / best_seconds if best_seconds else 0.0,
+        'p50_ms': percentile(best_latencies, 0.5) * 1000,
+        'p99_ms': percentile(best_latencies, 0.99) * 1000
+    }
+
+
+def peak_memory_mb(func: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def table_rows(parser_output: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [row for file_data in parser_output for table in file_data['extracted_tables'] for row in table]
+
+
+class BenchmarkSuite:
+    def __init__(self, files: int = 200, rows_per_table: int = 200, seed: int = 42,
+                 processing_config: Optional[ProcessingConfig] = None, repeat: int = 3):
+        self.files = files
+        self.rows_per_table = rows_per_table
+        self.seed = seed
+        self.processing_config = processing_config or ProcessingConfig()
+        self.repeat = repeat
+        self.parser_output = ParserOutputGenerator(seed).generate(files, rows_per_table)
+        self.rows = table_rows(self.parser_output)
+
+    def new_service(self) -> DataStandardizationService:
+        return DataStandardizationService(processing_config=self.processing_config)
+
+    def run(self) -> Dict[str, Any]:
+        benchmarks = {
+            'date_processor': self.bench_date_processor(),
+            'amount_processor': self.bench_amount_processor(),
+            'currency': self.bench_currency(),
+            'text_processor': self.bench_text_processor(),
+            'text_extractor': self.bench_text_extractor(),
+            'end_to_end': self.bench_end_to_end()
+        }
+        return {
+            'meta': {
+                'version': BENCHMARK_VERSION,
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'seed': self.seed,
+                'files': self.files,
+                'rows_per_table': self.rows_per_table,
+                'table_rows': len(self.rows),
+                'processing_config': self.processing_config.model_dump()
+            },
+            'benchmarks': benchmarks
+        }
+
+    def bench_date_processor(self) -> Dict[str, float]:
+        dates = [row['transaction_date'] for row in self.rows if isinstance(row.get('transaction_date'), str)]
+        return self._bench_processor(dates, lambda service: service.date_processor.standardize_date)
+
+    def bench_amount_processor(self) -> Dict[str, float]:
+        amounts = [
+            row[column] for row in self.rows for column in ('debit', 'credit', 'amount') if row.get(column)
+        ]
+        return self._bench_processor(amounts, lambda service: service.amount_processor.clean_amount)
+
+    def bench_currency(self) -> Dict[str, float]:
+        pairs = [
+            (row.get('currency') or '', row.get('debit') or row.get('credit') or row.get('amount') or '')
+            for row in self.rows
+        ]
+        return self._bench_processor(
+            pairs, lambda service: lambda pair: service.amount_processor.standardize_currency(*pair)
+        )
+
+    def bench_text_processor(self) -> Dict[str, float]:
+        descriptions = [row['description'] for row in self.rows if row.get('description')]
+        return self._bench_processor(descriptions, lambda service: service.text_processor.clean_description)
+
+    def bench_text_extractor(self) -> Dict[str, float]:
+        texts = [file_data['extracted_text'] for file_data in self.parser_output if file_data['extracted_text']]
+        return self._bench_processor(
+            texts, lambda service: service.text_extractor.extract_transactions_from_text
+        )
+
+    def bench_end_to_end(self) -> Dict[str, float]:
+        def process_file(file_data):
+            service.process_parsed_file(service._parse_file_input(file_data))
+
+        best = None
+        for _ in range(self.repeat):
+            service = self.new_service()
+            result = measure(self.parser_output, process_file)
+            if best is None or result['seconds'] < best['seconds']:
+                best = result
+        service = self.new_service()
+        results = []
+        best['peak_memory_mb'] = peak_memory_mb(lambda: results.append(service.process_json_input(self.parser_output)))
+        best['files'] = best['rows']
+        best['rows'] = results[0].total_transactions
+        best['rows_per_sec'] = best['rows'] / best['seconds'] if best['seconds'] else 0.0
+        return best
+
+    def _bench_processor(self, items: List[Any], bind: Callable[[DataStandardizationService], Callable]) -> Dict[str, float]:
+        best = None
+        for _ in range(self.repeat):
+            result = measure(items, bind(self.new_service()))
+            if best is None or result['seconds'] < best['seconds']:
+                best = result
+        service = self.new_service()
+        func = bind(service)
+        best['peak_memory_mb'] = peak_memory_mb(lambda: [func(item) for item in items])
+        return best
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    regressions = []
+    for name, baseline_metrics in baseline.get('benchmarks', {}).items():
+        metrics = current.get('benchmarks', {}).get(name)
+        if metrics is None:
+            regressions.append(f"{name}: missing from current run")
+            continue
+        for metric in HIGHER_IS_BETTER:
+            if metric in baseline_metrics and metrics.get(metric, 0) < baseline_metrics[metric] * (1 - tolerance):
+                regressions.append(
+                    f"{name}.{metric}: {metrics.get(metric, 0):.2f} < baseline {baseline_metrics[metric]:.2f}"
+                )
+        for metric in LOWER_IS_BETTER:
+            if metric.endswith('_ms') and baseline_metrics.get(metric, 0) < MIN_COMPARED_LATENCY_MS:
+                continue
+            if metric in baseline_metrics and metrics.get(metric, 0) > baseline_metrics[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name}.{metric}: {metrics.get(metric, 0):.2f} > baseline {baseline_metrics[metric]:.2f}"
+                )
+    return regressions
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<18}{'rows':>9}{'rows/sec':>14}{'p50 ms':>10}{'p99 ms':>10}{'peak MB':>10}"]
+    for name, metrics in results['benchmarks'].items():
+        lines.append(
+            f"{name:<18}{metrics['rows']:>9}{metrics['rows_per_sec']:>14.0f}"
+            f"{metrics['p50_ms']:>10.3f}{metrics['p99_ms']:>10.3f}{metrics['peak_memory_mb']:>10.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки сервиса стандартизации")
+    parser.add_argument('--files', type=int, default=200)
+    parser.add_argument('--rows', type=int, default=200, help="строк в таблице")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--engine', choices=['row', 'columnar'], default='row')
+    parser.add_argument('--output', help="сохранить результаты в JSON")
+    parser.add_argument('--baseline', help="сравнить с сохраненным JSON")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+    suite = BenchmarkSuite(
+        args.files, args.rows, args.seed, ProcessingConfig(engine=args.engine), args.repeat
+    )
+    results = suite.run()
+    print(format_results(results))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+from benchmarks.runner import DEFAULT_TOLERANCE, compare_results
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ['pandas', 'numpy', 'dateutil']
+
+STARTUP_METRICS = ['import_ms', 'construct_ms', 'first_result_ms', 'total_ms']
+
+# runs in a fresh interpreter so every measurement is a real cold start
+STARTUP_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from src.api_interface import DataStandardizationAPI
+from src.models.parser_models import ProcessingConfig
+imported = time.perf_counter()
+api = DataStandardizationAPI(processing_config=ProcessingConfig(**json.loads(sys.argv[1])))
+constructed = time.perf_counter()
+response = api.process_parser_output(json.loads(sys.argv[2]))
+finished = time.perf_counter()
+print(json.dumps({
+    'status': response['status'],
+    'import_ms': (imported - started) * 1000,
+    'construct_ms': (constructed - imported) * 1000,
+    'first_result_ms': (finished - constructed) * 1000,
+    'total_ms': (finished - started) * 1000,
+    'loaded_modules': [name for name in json.loads(sys.argv[3]) if name in sys.modules]
+}))
+"""
+
+SAMPLE_INPUT = [{
+    "filename": "statement.pdf",
+    "extracted_tables": [[
+        {"transaction_date": "19.06.2025", "description": "Оплата за хостинг", "debit": "15 000 тг"},
+        {"transaction_date": "20.06.2025", "description": "Получение зарплаты", "credit": "500000 ₸"}
+    ]],
+    "extracted_text": "21 июня 2025 Перевод 2 500 тенге"
+}]
+
+
+def run_cold_start(processing_config: Dict[str, Any], parser_output: List[Dict[str, Any]]) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, '-c', STARTUP_SCRIPT,
+         json.dumps(processing_config), json.dumps(parser_output), json.dumps(HEAVY_MODULES)],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def measure_startup(runs: int = 5, processing_config: Optional[Dict[str, Any]] = None,
+                    parser_output: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    samples = [run_cold_start(processing_config or {}, parser_output or SAMPLE_INPUT) for _ in range(runs)]
+    result = {metric: statistics.median(sample[metric] for sample in samples) for metric in STARTUP_METRICS}
+    result['runs'] = runs
+    result['loaded_modules'] = samples[-1]['loaded_modules']
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Время холодного старта сервиса стандартизации")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--engine', choices=['row', 'columnar'], default='row')
+    parser.add_argument('--output', help="сохранить результаты в JSON")
+    parser.add_argument('--baseline', help="сравнить с сохраненным JSON")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+    processing_config = {'engine': args.engine}
+    startup = measure_startup(args.runs, processing_config)
+    results = {'meta': {'runs': args.runs, 'processing_config': processing_config}, 'benchmarks': {'startup': startup}}
+    for metric in STARTUP_METRICS:
+        print(f"{metric:<18}{startup[metric]:>10.1f}")
+    print(f"{'loaded_modules':<18}{', '.join(startup['loaded_modules']) or '-':>10}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
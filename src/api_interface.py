@@ -1,60 +1,146 @@
-from typing import List, Dict, Any
+import os
+from typing import List, Dict, Any, Optional, Union, Callable, IO
 from src.processors.main_processor import DataStandardizationService
-from src.models.parser_models import TransactionExtractionConfig
+from src.models.transaction_models import CompactTransactionBatch
+from src.utils.constants import RESPONSE_MEMORY_BUDGET, EXPORT_ROW_GROUP_SIZE
+from src.utils.response_writer import ResponseStreamWriter
+from src.models.parser_models import (
+    TransactionExtractionConfig, ProcessingConfig, BatchProcessingResult, FileProcessingResult
+)
 
 
 class DataStandardizationAPI:
-    def __init__(self, extraction_config: TransactionExtractionConfig = None):
-        self.service = DataStandardizationService(extraction_config)
+    def __init__(self, extraction_config: TransactionExtractionConfig = None,
+                 processing_config: ProcessingConfig = None):
+        self.service = DataStandardizationService(extraction_config, processing_config)
     
     def process_parser_output(self, parser_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         try:
-            result = self.service.process_json_input(parser_data)
-            response = {
+            return self._build_response(self.service.process_json_input(parser_data))
+        except Exception as e:
+            return self._build_error(e)
+    
+    def process_parser_output_stream(self, source: Union[str, os.PathLike, IO],
+                                     on_transactions: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+                                     ) -> Dict[str, Any]:
+        file_results = []
+        
+        def handle_file_result(file_result):
+            file_results.append(self._build_file_data(file_result))
+            if on_transactions is not None:
+                on_transactions(self._build_transactions_data(file_result))
+        
+        try:
+            result = self.service.process_json_stream(source, on_file_result=handle_file_result)
+            return {
                 "status": "success",
-                "summary": {
-                    "total_files": result.total_files,
-                    "successful_files": result.successful_files,
-                    "failed_files": result.failed_files,
-                    "total_transactions": result.total_transactions,
-                    "successful_transactions": result.successful_transactions,
-                    "processing_summary": result.processing_summary
-                },
-                "file_results": [],
-                "standardized_transactions": []
+                "summary": self._build_summary(result),
+                "file_results": file_results
             }
-            for file_result in result.file_results:
-                file_data = {
-                    "filename": file_result.filename,
-                    "source_type": file_result.source_type,
-                    "transaction_count": len(file_result.successful_transactions),
-                    "failed_count": len(file_result.failed_transactions),
-                    "original_error": file_result.original_error,
-                    "processing_summary": file_result.processing_summary
-                }
-                response["file_results"].append(file_data)
-            for file_result in result.file_results:
-                for transaction in file_result.successful_transactions:
-                    transaction_data = {
-                        "source_file": file_result.filename,
-                        "transaction_id": transaction.transaction_id,
-                        "transaction_date": transaction.transaction_date,
-                        "description_raw": transaction.description_raw,
-                        "description_clean": transaction.description_clean,
-                        "amount": transaction.amount,
-                        "currency": transaction.currency,
-                        "transaction_type": transaction.transaction_type.value,
-                        "source_account": transaction.source_account,
-                        "data_quality_flags": transaction.data_quality_flags
-                    }
-                    response["standardized_transactions"].append(transaction_data)
-            return response
         except Exception as e:
-            return {
-                "status": "error",
-                "error_message": str(e),
-                "error_type": type(e).__name__
+            return self._build_error(e)
+    
+    def write_parser_output(self, parser_data: Union[List[Dict[str, Any]], str, os.PathLike, IO],
+                            output: IO, mode: str = "json",
+                            memory_budget: int = RESPONSE_MEMORY_BUDGET) -> Dict[str, Any]:
+        writer = ResponseStreamWriter(output, mode, memory_budget)
+        
+        def handle_file_result(file_result):
+            started = self.service.metrics.clock()
+            writer.add_file(self._build_file_data(file_result), self._build_transactions_data(file_result))
+            self.service.metrics.observe('response_writing', started)
+        
+        try:
+            if isinstance(parser_data, list):
+                result = self.service.process_json_documents(parser_data, on_file_result=handle_file_result)
+            else:
+                result = self.service.process_json_stream(parser_data, on_file_result=handle_file_result)
+        except Exception as e:
+            error = self._build_error(e)
+            writer.fail(error)
+            return error
+        summary = self._build_summary(result)
+        writer.finish(summary)
+        return {"status": "success", "summary": summary, "spilled_shards": writer.spilled_shards}
+    
+    def export_parser_output(self, parser_data: Union[List[Dict[str, Any]], str, os.PathLike, IO],
+                             output: Union[str, os.PathLike, IO], export_format: str = "parquet",
+                             row_group_size: int = EXPORT_ROW_GROUP_SIZE) -> Dict[str, Any]:
+        try:
+            from src.utils.columnar_export import ColumnarExportWriter
+            with ColumnarExportWriter(output, export_format, row_group_size) as writer:
+                if isinstance(parser_data, list):
+                    result = self.service.process_json_documents(parser_data, on_file_result=writer.add_file)
+                else:
+                    result = self.service.process_json_stream(parser_data, on_file_result=writer.add_file)
+        except Exception as e:
+            return self._build_error(e)
+        return {
+            "status": "success",
+            "summary": self._build_summary(result),
+            "rows_written": writer.rows_written,
+            "row_groups": writer.row_groups
+        }
+    
+    def _build_response(self, result: BatchProcessingResult) -> Dict[str, Any]:
+        started = self.service.metrics.clock()
+        response = {
+            "status": "success",
+            "summary": self._build_summary(result),
+            "file_results": [self._build_file_data(file_result) for file_result in result.file_results],
+            "standardized_transactions": []
+        }
+        for file_result in result.file_results:
+            response["standardized_transactions"].extend(self._build_transactions_data(file_result))
+        self.service.metrics.observe('response_building', started)
+        return response
+    
+    def _build_summary(self, result: BatchProcessingResult) -> Dict[str, Any]:
+        return {
+            "total_files": result.total_files,
+            "successful_files": result.successful_files,
+            "failed_files": result.failed_files,
+            "total_transactions": result.total_transactions,
+            "successful_transactions": result.successful_transactions,
+            "processing_summary": result.processing_summary
+        }
+    
+    def _build_file_data(self, file_result: FileProcessingResult) -> Dict[str, Any]:
+        return {
+            "filename": file_result.filename,
+            "source_type": file_result.source_type,
+            "transaction_count": len(file_result.successful_transactions),
+            "failed_count": len(file_result.failed_transactions),
+            "original_error": file_result.original_error,
+            "processing_summary": file_result.processing_summary
+        }
+    
+    def _build_transactions_data(self, file_result: FileProcessingResult) -> List[Dict[str, Any]]:
+        transactions = file_result.successful_transactions
+        if isinstance(transactions, CompactTransactionBatch):
+            return [{"source_file": file_result.filename, **record} for record in transactions.iter_records()]
+        return [
+            {
+                "source_file": file_result.filename,
+                "transaction_id": transaction.transaction_id,
+                "transaction_date": transaction.transaction_date,
+                "description_raw": transaction.description_raw,
+                "description_clean": transaction.description_clean,
+                "amount": transaction.amount,
+                "currency": transaction.currency,
+                "transaction_type": transaction.transaction_type.value,
+                "source_account": transaction.source_account,
+                "data_quality_flags": transaction.data_quality_flags
             }
+            for transaction in transactions
+        ]
+    
+    def _build_error(self, error: Exception) -> Dict[str, Any]:
+        return {
+            "status": "error",
+            "error_message": str(error),
+            "error_type": type(error).__name__
+        }
     
     def process_single_file(self, file_data: Dict[str, Any]) -> Dict[str, Any]:
         return self.process_parser_output([file_data])
@@ -0,0 +1,113 @@
+import asyncio
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Dict, Any, Optional
+from src.api_interface import DataStandardizationAPI
+from src.models.parser_models import (
+    TransactionExtractionConfig, ProcessingConfig, ParsedFileResult, FileProcessingResult
+)
+from src.processors.parallel import _process_parsed_file, is_worker_executor
+
+
+class AsyncDataStandardizationAPI:
+    def __init__(self, extraction_config: TransactionExtractionConfig = None,
+                 processing_config: ProcessingConfig = None,
+                 executor: Optional[Executor] = None,
+                 max_concurrent_files: int = 4,
+                 timeout: Optional[float] = None):
+        if max_concurrent_files < 1:
+            raise ValueError("max_concurrent_files должен быть больше 0")
+        if isinstance(executor, ProcessPoolExecutor) and not is_worker_executor(executor):
+            raise ValueError(
+                "Пул процессов должен быть создан через service.parallel_processor.create_executor()"
+            )
+        self.api = DataStandardizationAPI(extraction_config, processing_config)
+        self.service = self.api.service
+        self.owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrent_files, thread_name_prefix="standardization"
+        )
+        self.max_concurrent_files = max_concurrent_files
+        self.timeout = timeout
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    async def process_parser_output(self, parser_data: List[Dict[str, Any]],
+                                    timeout: Optional[float] = None) -> Dict[str, Any]:
+        try:
+            result = await asyncio.wait_for(
+                self._process_files(parser_data), timeout if timeout is not None else self.timeout
+            )
+            return await asyncio.to_thread(self.api._build_response, result)
+        except Exception as e:
+            return self.api._build_error(e)
+
+    async def process_single_file(self, file_data: Dict[str, Any],
+                                  timeout: Optional[float] = None) -> Dict[str, Any]:
+        return await self.process_parser_output([file_data], timeout)
+
+    async def health_check(self) -> Dict[str, Any]:
+        health = self.api.health_check()
+        if health["status"] == "healthy":
+            health["service_info"]["async"] = {
+                "executor": type(self.executor).__name__,
+                "max_concurrent_files": self.max_concurrent_files,
+                "timeout": self.timeout
+            }
+        return health
+
+    def get_supported_formats(self) -> Dict[str, Any]:
+        return self.api.get_supported_formats()
+
+    def close(self) -> None:
+        if self.owns_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> 'AsyncDataStandardizationAPI':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    async def _process_files(self, parser_data: List[Dict[str, Any]]):
+        # parsing and accumulation are plain CPU work too, so they stay off the event loop
+        parsed_files = await asyncio.to_thread(self._parse_files, parser_data)
+        file_results = await asyncio.gather(*(self._process_file(parsed_file) for parsed_file in parsed_files))
+        return await asyncio.to_thread(self._accumulate, file_results)
+
+    def _parse_files(self, parser_data: List[Dict[str, Any]]) -> List[ParsedFileResult]:
+        return [self.service._parse_file_input(file_data) for file_data in parser_data]
+
+    def _accumulate(self, file_results: List[FileProcessingResult]):
+        accumulator = self.service.new_accumulator()
+        for file_result in file_results:
+            accumulator.add(file_result)
+        return accumulator.build()
+
+    async def _process_file(self, parsed_file: ParsedFileResult) -> FileProcessingResult:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent_files)
+        await semaphore.acquire()
+        try:
+            if isinstance(self.executor, ProcessPoolExecutor):
+                future = self.executor.submit(_process_parsed_file, parsed_file)
+            else:
+                future = self.executor.submit(self.service.process_parsed_file, parsed_file)
+        except BaseException:
+            semaphore.release()
+            raise
+        # a running file cannot be interrupted, so on timeout it keeps its slot until the worker is done
+        future.add_done_callback(_release_on_loop(loop, semaphore))
+        return await asyncio.wrap_future(future)
+
+
+def _release_on_loop(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore):
+    def release(_future) -> None:
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:
+            # the loop is closed, so nobody is waiting for the slot anymore
+            pass
+
+    return release
@@ -0,0 +1,222 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, IO
+from src.api_interface import DataStandardizationAPI
+from src.models.parser_models import ProcessingConfig
+
+INPUT_SUFFIXES = ('.json', '.ndjson', '.jsonl')
+
+COMPRESSION_SUFFIXES = ('', '.gz', '.bz2', '.xz')
+
+MANIFEST_NAME = '_manifest.json'
+
+OUTPUT_SUFFIX = '.golden.ndjson'
+
+_worker_api = None
+
+
+def find_input_files(input_dir: str, exclude_dir: Optional[str] = None) -> List[str]:
+    # the output directory may live inside the input one; its manifest and golden files are not inputs
+    excluded = os.path.realpath(exclude_dir) if exclude_dir else None
+    suffixes = tuple(suffix + compression for suffix in INPUT_SUFFIXES for compression in COMPRESSION_SUFFIXES)
+    found = []
+    for root, dirs, files in os.walk(input_dir):
+        dirs[:] = sorted(name for name in dirs if os.path.realpath(os.path.join(root, name)) != excluded)
+        for name in sorted(files):
+            if name.lower().endswith(suffixes):
+                found.append(os.path.relpath(os.path.join(root, name), input_dir))
+    return found
+
+
+def output_path_for(output_dir: str, relative_path: str) -> str:
+    base = relative_path
+    for compression in COMPRESSION_SUFFIXES[1:]:
+        if base.lower().endswith(compression):
+            base = base[:-len(compression)]
+    return os.path.join(output_dir, os.path.splitext(base)[0] + OUTPUT_SUFFIX)
+
+
+def _init_worker(processing_config: ProcessingConfig) -> None:
+    global _worker_api
+    _worker_api = DataStandardizationAPI(processing_config=processing_config)
+
+
+def process_input_file(input_path: str, output_path: str) -> Dict[str, Any]:
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    partial_path = output_path + '.part'
+    started = time.perf_counter()
+    with open(partial_path, 'wb') as output:
+        result = _worker_api.write_parser_output(input_path, output, mode='ndjson')
+    if result['status'] != 'success':
+        os.remove(partial_path)
+        return {'status': 'error', 'error': result['error_message'], 'seconds': time.perf_counter() - started}
+    os.replace(partial_path, output_path)
+    summary = result['summary']
+    return {
+        'status': 'done',
+        'output': output_path,
+        'total_files': summary['total_files'],
+        'failed_files': summary['failed_files'],
+        'total_transactions': summary['total_transactions'],
+        'successful_transactions': summary['successful_transactions'],
+        'seconds': time.perf_counter() - started
+    }
+
+
+class CheckpointManifest:
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.entries = json.load(f).get('files', {})
+
+    @staticmethod
+    def fingerprint(input_path: str) -> Dict[str, int]:
+        stat = os.stat(input_path)
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def is_done(self, relative_path: str, input_path: str) -> bool:
+        entry = self.entries.get(relative_path)
+        return (
+            entry is not None and entry.get('status') == 'done'
+            and entry.get('input') == self.fingerprint(input_path)
+            and os.path.exists(entry.get('output', ''))
+        )
+
+    def record(self, relative_path: str, input_path: str, result: Dict[str, Any]) -> None:
+        self.entries[relative_path] = {'input': self.fingerprint(input_path), **result}
+        self.save()
+
+    def save(self) -> None:
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'files': self.entries}, f, ensure_ascii=False, indent=1)
+        os.replace(temporary_path, self.path)
+
+
+class ProgressReporter:
+    def __init__(self, total_files: int, total_bytes: int, stream: IO = sys.stderr, interval: float = 1.0):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.stream = stream
+        self.interval = interval
+        self.started = time.monotonic()
+        self.last_report = 0.0
+        self.files = 0
+        self.bytes = 0
+        self.transactions = 0
+
+    def update(self, input_bytes: int, transactions: int) -> None:
+        self.files += 1
+        self.bytes += input_bytes
+        self.transactions += transactions
+        now = time.monotonic()
+        if now - self.last_report >= self.interval or self.files == self.total_files:
+            self.last_report = now
+            self.stream.write(self.format_line(now) + '\n')
+            self.stream.flush()
+
+    def format_line(self, now: float) -> str:
+        elapsed = max(now - self.started, 1e-9)
+        rate = self.bytes / elapsed
+        remaining = (self.total_bytes - self.bytes) / rate if rate > 0 else 0.0
+        return (
+            f"[{self.files}/{self.total_files}] {self.transactions / elapsed:,.0f} транз/с, "
+            f"{rate / (1024 * 1024):.1f} МБ/с, осталось ~{format_duration(remaining)}"
+        )
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+
+def run(input_dir: str, output_dir: str, workers: int = 1, processing_config: Optional[ProcessingConfig] = None,
+        max_failure_rate: float = 0.05, resume: bool = True, stream: IO = sys.stderr) -> int:
+    processing_config = processing_config or ProcessingConfig()
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = CheckpointManifest(os.path.join(output_dir, MANIFEST_NAME))
+    if not resume:
+        manifest.entries = {}
+    pending = []
+    input_files = find_input_files(input_dir, output_dir)
+    for relative_path in input_files:
+        input_path = os.path.join(input_dir, relative_path)
+        if not manifest.is_done(relative_path, input_path):
+            pending.append((relative_path, input_path, output_path_for(output_dir, relative_path)))
+    stream.write(f"Входных файлов к обработке: {len(pending)}, уже обработано: {len(input_files) - len(pending)}\n")
+    progress = ProgressReporter(len(pending), sum(os.path.getsize(path) for _, path, _ in pending), stream)
+
+    def handle(relative_path, input_path, result):
+        manifest.record(relative_path, input_path, result)
+        progress.update(os.path.getsize(input_path), result.get('total_transactions', 0))
+        if result['status'] == 'error':
+            stream.write(f"Ошибка в {relative_path}: {result['error']}\n")
+
+    if workers == 1:
+        _init_worker(processing_config)
+        for relative_path, input_path, output_path in pending:
+            handle(relative_path, input_path, process_input_file(input_path, output_path))
+    else:
+        with ProcessPoolExecutor(max_workers=workers or None, initializer=_init_worker,
+                                 initargs=(processing_config,)) as executor:
+            futures = {
+                executor.submit(process_input_file, input_path, output_path): (relative_path, input_path)
+                for relative_path, input_path, output_path in pending
+            }
+            for future in as_completed(futures):
+                relative_path, input_path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+                handle(relative_path, input_path, result)
+    return report(manifest, max_failure_rate, stream)
+
+
+def report(manifest: CheckpointManifest, max_failure_rate: float, stream: IO) -> int:
+    entries = list(manifest.entries.values())
+    failed_inputs = sum(1 for entry in entries if entry['status'] == 'error')
+    total_transactions = sum(entry.get('total_transactions', 0) for entry in entries)
+    successful_transactions = sum(entry.get('successful_transactions', 0) for entry in entries)
+    transaction_failure_rate = (
+        1 - successful_transactions / total_transactions if total_transactions else 0.0
+    )
+    input_failure_rate = failed_inputs / len(entries) if entries else 0.0
+    stream.write(
+        f"Итого: входных файлов {len(entries)} (с ошибкой {failed_inputs}), "
+        f"транзакций {total_transactions}, успешно {successful_transactions}, "
+        f"доля ошибок {transaction_failure_rate:.2%}\n"
+    )
+    if transaction_failure_rate > max_failure_rate or input_failure_rate > max_failure_rate:
+        stream.write(f"Доля ошибок превышает порог {max_failure_rate:.2%}\n")
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Пакетная стандартизация каталога с выходом движка парсинга")
+    parser.add_argument('input_dir')
+    parser.add_argument('output_dir')
+    parser.add_argument('--workers', type=int, default=1, help="число процессов, 0 — по числу ядер")
+    parser.add_argument('--engine', choices=['row', 'columnar'], default='row')
+    parser.add_argument('--max-failure-rate', type=float, default=0.05)
+    parser.add_argument('--no-resume', action='store_true', help="игнорировать манифест и обработать все заново")
+    args = parser.parse_args(argv)
+    if not os.path.isdir(args.input_dir):
+        parser.error(f"каталог не найден: {args.input_dir}")
+    return run(
+        args.input_dir, args.output_dir, args.workers, ProcessingConfig(engine=args.engine),
+        args.max_failure_rate, not args.no_resume
+    )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
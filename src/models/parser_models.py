@@ -1,10 +1,23 @@
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+import os
+from typing import List, Optional, Dict, Any, Literal, Union, IO, TYPE_CHECKING
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer
+from src.models.transaction_models import CompactTransactionBatch, serialize_failed_transactions
+from src.models.statistics_models import ProcessingStatistics
+from src.models.table_models import ColumnarTable
+from src.utils.constants import (
+    DEFAULT_CACHE_SIZE, FORMAT_INFERENCE_SAMPLE_SIZE, CURRENCY_MAPPING,
+    DEBIT_KEYWORDS, CREDIT_KEYWORDS, PARALLEL_CHUNK_SIZE, PARALLEL_MIN_FILES,
+    PROFILE_TOP_N, DEDUP_BLOOM_THRESHOLD, DEDUP_FALSE_POSITIVE_RATE,
+    FUZZY_SIMILARITY_THRESHOLD, FUZZY_BUCKET_LIMIT, RESULT_CACHE_MAX_BYTES
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class ParsedFileResult(BaseModel):
     filename: str = Field(...)
-    extracted_tables: List[List[Dict[str, Any]]] = Field(default_factory=list)
+    extracted_tables: List[Union[ColumnarTable, List[Dict[str, Any]]]] = Field(default_factory=list)
     extracted_text: str = Field(default="")
     error: Optional[str] = Field(None)
 
@@ -16,10 +29,19 @@ class ParsedBatchResult(BaseModel):
 class FileProcessingResult(BaseModel):
     filename: str = Field(...)
     source_type: str = Field(...)
-    successful_transactions: List = Field(default_factory=list)
+    successful_transactions: Union[CompactTransactionBatch, List] = Field(
+        default_factory=list, union_mode='left_to_right'
+    )
     failed_transactions: List[Dict[str, Any]] = Field(default_factory=list)
     processing_summary: Dict[str, Any] = Field(default_factory=dict)
     original_error: Optional[str] = Field(None)
+    statistics: ProcessingStatistics = Field(default_factory=ProcessingStatistics)
+    _segment_starts: List[int] = PrivateAttr(default_factory=list)
+    _today_dependent: bool = PrivateAttr(default=False)
+
+    @field_serializer('failed_transactions')
+    def _serialize_failed_transactions(self, failed_transactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return serialize_failed_transactions(failed_transactions)
 
 
 class BatchProcessingResult(BaseModel):
@@ -30,6 +52,19 @@ class BatchProcessingResult(BaseModel):
     successful_transactions: int = Field(...)
     file_results: List[FileProcessingResult] = Field(...)
     processing_summary: Dict[str, Any] = Field(default_factory=dict)
+    statistics: ProcessingStatistics = Field(default_factory=ProcessingStatistics)
+
+    def to_dataframe(self) -> 'pd.DataFrame':
+        from src.utils.columnar_export import transactions_frame
+        return transactions_frame(self.file_results)
+
+    def to_csv(self, output: Union[str, os.PathLike, IO], row_group_size: Optional[int] = None) -> int:
+        from src.utils.columnar_export import export_transactions
+        return export_transactions(self.file_results, output, "csv", row_group_size).rows_written
+
+    def to_parquet(self, output: Union[str, os.PathLike, IO], row_group_size: Optional[int] = None) -> int:
+        from src.utils.columnar_export import export_transactions
+        return export_transactions(self.file_results, output, "parquet", row_group_size).rows_written
 
 
 class TransactionExtractionConfig(BaseModel):
@@ -44,5 +79,45 @@ class TransactionExtractionConfig(BaseModel):
         "описание", "комментарий", "назначение", "за что", "детали",
         "магазин", "услуга", "товар", "покупка"
     ])
+    debit_keywords: List[str] = Field(default_factory=lambda: list(DEBIT_KEYWORDS))
+    credit_keywords: List[str] = Field(default_factory=lambda: list(CREDIT_KEYWORDS))
+    currency_aliases: Dict[str, str] = Field(default_factory=lambda: dict(CURRENCY_MAPPING))
     min_description_length: int = Field(default=3)
     extract_from_text: bool = Field(default=True)
+
+
+class ProcessingConfig(BaseModel):
+    engine: Literal["row", "columnar"] = Field(default="row")
+    cache_size: int = Field(default=DEFAULT_CACHE_SIZE, ge=0)
+    infer_table_formats: bool = Field(default=True)
+    inference_sample_size: int = Field(default=FORMAT_INFERENCE_SAMPLE_SIZE, gt=0)
+    workers: int = Field(default=1, ge=0)
+    parallel_chunk_size: int = Field(default=PARALLEL_CHUNK_SIZE, gt=0)
+    parallel_min_files: int = Field(default=PARALLEL_MIN_FILES, ge=1)
+    compact_results: bool = Field(default=False)
+    collect_metrics: bool = Field(default=False)
+    profile_slow_inputs: bool = Field(default=False)
+    profile_top_n: int = Field(default=PROFILE_TOP_N, ge=0)
+    profile_threshold_seconds: Optional[float] = Field(None, gt=0)
+    profile_output_dir: Optional[str] = Field(None)
+    deterministic_ids: bool = Field(default=False)
+    deduplicate: Literal["off", "flag", "drop"] = Field(default="off")
+    dedup_index: Literal["auto", "hash", "bloom"] = Field(default="auto")
+    dedup_bloom_threshold: int = Field(default=DEDUP_BLOOM_THRESHOLD, gt=0)
+    dedup_expected_transactions: int = Field(default=DEDUP_BLOOM_THRESHOLD, gt=0)
+    dedup_false_positive_rate: float = Field(default=DEDUP_FALSE_POSITIVE_RATE, gt=0, lt=1)
+    fuzzy_deduplicate: bool = Field(default=False)
+    fuzzy_similarity_threshold: float = Field(default=FUZZY_SIMILARITY_THRESHOLD, gt=0, le=1)
+    fuzzy_bucket_limit: int = Field(default=FUZZY_BUCKET_LIMIT, gt=0)
+    validation_mode: Literal["exceptions", "codes"] = Field(default="exceptions")
+    result_cache_size: int = Field(default=0, ge=0)
+    result_cache_path: Optional[str] = Field(None)
+    result_cache_max_bytes: int = Field(default=RESULT_CACHE_MAX_BYTES, gt=0)
+
+
+class TableFormatProfile(BaseModel):
+    date_format: Optional[str] = Field(None)
+    decimal_separator: Optional[str] = Field(None)
+    thousands_separator: Optional[str] = Field(None)
+    default_currency: Optional[str] = Field(None)
+    sample_size: int = Field(default=0)
@@ -0,0 +1,121 @@
+from typing import Dict, Any, Optional, Iterable
+from pydantic import BaseModel, Field
+
+
+class AmountStatistics(BaseModel):
+    count: int = Field(default=0)
+    total: float = Field(default=0.0)
+    min: Optional[float] = Field(None)
+    max: Optional[float] = Field(None)
+
+    def add(self, amount: float) -> None:
+        self.count += 1
+        self.total += amount
+        if self.min is None or amount < self.min:
+            self.min = amount
+        if self.max is None or amount > self.max:
+            self.max = amount
+
+    def merge(self, other: 'AmountStatistics') -> None:
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+
+def _merge_counts(target: Dict[str, int], source: Dict[str, int]) -> None:
+    for key, count in source.items():
+        target[key] = target.get(key, 0) + count
+
+
+class ProcessingStatistics(BaseModel):
+    total_files: int = Field(default=0)
+    total_transactions: int = Field(default=0)
+    successful_transactions: int = Field(default=0)
+    source_type_distribution: Dict[str, int] = Field(default_factory=dict)
+    quality_flags_distribution: Dict[str, int] = Field(default_factory=dict)
+    transaction_types_distribution: Dict[str, int] = Field(default_factory=lambda: {'DEBIT': 0, 'CREDIT': 0})
+    currency_distribution: Dict[str, int] = Field(default_factory=dict)
+    amount_statistics: Dict[str, AmountStatistics] = Field(default_factory=dict)
+    date_min: Optional[str] = Field(None)
+    date_max: Optional[str] = Field(None)
+
+    def add_transaction(self, transaction_date: str, amount: float, currency: str,
+                        transaction_type: str, data_quality_flags: Iterable[str]) -> None:
+        self.successful_transactions += 1
+        for flag in data_quality_flags:
+            self.quality_flags_distribution[flag] = self.quality_flags_distribution.get(flag, 0) + 1
+        self.transaction_types_distribution[transaction_type] = (
+            self.transaction_types_distribution.get(transaction_type, 0) + 1
+        )
+        self.currency_distribution[currency] = self.currency_distribution.get(currency, 0) + 1
+        amount_statistics = self.amount_statistics.get(currency)
+        if amount_statistics is None:
+            amount_statistics = self.amount_statistics[currency] = AmountStatistics()
+        amount_statistics.add(amount)
+        if self.date_min is None or transaction_date < self.date_min:
+            self.date_min = transaction_date
+        if self.date_max is None or transaction_date > self.date_max:
+            self.date_max = transaction_date
+
+    def add_transactions(self, transactions: Iterable[Any]) -> None:
+        iter_records = getattr(transactions, 'iter_records', None)
+        if iter_records is not None:
+            for record in iter_records():
+                self.add_transaction(
+                    record['transaction_date'], record['amount'], record['currency'],
+                    record['transaction_type'], record['data_quality_flags']
+                )
+            return
+        for transaction in transactions:
+            self.add_transaction(
+                transaction.transaction_date, transaction.amount, transaction.currency,
+                transaction.transaction_type.value, transaction.data_quality_flags
+            )
+
+    def add_file(self, source_type: str, total_transactions: int) -> None:
+        self.total_files += 1
+        self.total_transactions += total_transactions
+        self.source_type_distribution[source_type] = self.source_type_distribution.get(source_type, 0) + 1
+
+    def merge(self, other: 'ProcessingStatistics') -> None:
+        self.total_files += other.total_files
+        self.total_transactions += other.total_transactions
+        self.successful_transactions += other.successful_transactions
+        _merge_counts(self.source_type_distribution, other.source_type_distribution)
+        _merge_counts(self.quality_flags_distribution, other.quality_flags_distribution)
+        _merge_counts(self.transaction_types_distribution, other.transaction_types_distribution)
+        _merge_counts(self.currency_distribution, other.currency_distribution)
+        for currency, amount_statistics in other.amount_statistics.items():
+            self.amount_statistics.setdefault(currency, AmountStatistics()).merge(amount_statistics)
+        if other.date_min is not None and (self.date_min is None or other.date_min < self.date_min):
+            self.date_min = other.date_min
+        if other.date_max is not None and (self.date_max is None or other.date_max > self.date_max):
+            self.date_max = other.date_max
+
+    def to_report(self) -> Dict[str, Any]:
+        return {
+            'quality_flags_distribution': dict(self.quality_flags_distribution),
+            'quality_flags_rates': {
+                flag: count / self.successful_transactions * 100
+                for flag, count in self.quality_flags_distribution.items()
+            } if self.successful_transactions else {},
+            'transaction_types_distribution': dict(self.transaction_types_distribution),
+            'currency_distribution': dict(self.currency_distribution),
+            'amount_statistics': {
+                currency: amount_statistics.model_dump()
+                for currency, amount_statistics in self.amount_statistics.items()
+            },
+            'date_range': {'min': self.date_min, 'max': self.date_max},
+            'average_transactions_per_file': (
+                self.total_transactions / self.total_files if self.total_files > 0 else 0
+            ),
+            'files_with_text_extraction': sum(
+                self.source_type_distribution.get(source_type, 0) for source_type in ['text', 'mixed']
+            ),
+            'files_with_table_data': sum(
+                self.source_type_distribution.get(source_type, 0) for source_type in ['table', 'mixed']
+            )
+        }
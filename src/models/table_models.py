@@ -0,0 +1,97 @@
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List, Optional
+from pydantic import BaseModel, Field, model_validator
+
+
+class TableRow(Mapping):
+    # read-only view of one row of a columnar table; no per-row dict is built
+    __slots__ = ('_index', '_values', '_row')
+
+    def __init__(self, index: Dict[str, int], values: List[Sequence], row: int):
+        self._index = index
+        self._values = values
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._index[key]][self._row]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def get(self, key: str, default: Any = None) -> Any:
+        position = self._index.get(key)
+        return default if position is None else self._values[position][self._row]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {column: self._values[position][self._row] for column, position in self._index.items()}
+
+    def __repr__(self) -> str:
+        return f"TableRow({self.to_dict()!r})"
+
+
+class TableRows(Sequence):
+    def __init__(self, columns: List[str], values: List[Sequence], length: int):
+        self.columns = columns
+        self.values = values
+        self.index = {column: position for position, column in enumerate(columns)}
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [TableRow(self.index, self.values, row) for row in range(*item.indices(self._length))]
+        if item < 0:
+            item += self._length
+        if not 0 <= item < self._length:
+            raise IndexError(item)
+        return TableRow(self.index, self.values, item)
+
+    def column(self, name: str) -> Optional[Sequence]:
+        position = self.index.get(name)
+        return None if position is None else self.values[position]
+
+
+class ColumnarTable(BaseModel):
+    columns: List[str] = Field(...)
+    data: Optional[List[List[Any]]] = Field(None)
+    rows: Optional[List[List[Any]]] = Field(None)
+
+    @model_validator(mode='after')
+    def _check_shape(self) -> 'ColumnarTable':
+        if len(set(self.columns)) != len(self.columns):
+            raise ValueError("Повторяющиеся названия колонок в таблице")
+        if (self.data is None) == (self.rows is None):
+            raise ValueError("Таблица должна содержать либо data (колонки), либо rows (строки)")
+        width = len(self.columns)
+        if self.data is not None:
+            if len(self.data) != width:
+                raise ValueError(f"Ожидалось {width} колонок, получено {len(self.data)}")
+            if len({len(values) for values in self.data}) > 1:
+                raise ValueError("Колонки таблицы имеют разную длину")
+        elif any(len(row) != width for row in self.rows):
+            raise ValueError(f"Каждая строка таблицы должна содержать {width} значений")
+        return self
+
+    def __len__(self) -> int:
+        if self.rows is not None:
+            return len(self.rows)
+        return len(self.data[0]) if self.data else 0
+
+    def row_view(self) -> TableRows:
+        if self.data is not None:
+            return TableRows(self.columns, self.data, len(self))
+        values = list(zip(*self.rows)) if self.rows else [() for _ in self.columns]
+        return TableRows(self.columns, values, len(self.rows))
+
+
+def original_row(raw_data: Any) -> Any:
+    # failed rows keep a plain dict so results stay serializable and picklable
+    return raw_data.to_dict() if isinstance(raw_data, TableRow) else raw_data
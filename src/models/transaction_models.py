@@ -1,7 +1,13 @@
-from typing import Optional, List, Union
-from pydantic import BaseModel, Field
+import math
+import re
+from array import array
+from collections.abc import Sequence
+from typing import Optional, List, Union, Dict, Any, Iterator, Iterable
+from pydantic import BaseModel, Field, field_serializer
+from pydantic_core import core_schema
 from datetime import datetime
 from enum import Enum
+from src.utils.constants import VALIDATION_ERROR_MESSAGES
 
 
 class TransactionType(str, Enum):
@@ -30,7 +36,174 @@ class StandardizedTransaction(BaseModel):
     data_quality_flags: List[str] = Field(default_factory=list)
 
 
+GENERATED_ID_PATTERN = re.compile(r'gen_uuid_([0-9a-f]{8})')
+
+MAX_MINOR_AMOUNT = 1e15
+
+TRANSACTION_TYPES = (TransactionType.DEBIT, TransactionType.CREDIT)
+
+
+class CompactTransactionBatch(Sequence):
+    def __init__(self, transactions: Iterable[StandardizedTransaction] = ()):
+        self._ids = array('I')
+        self._custom_ids = {}
+        self._dates = []
+        self._descriptions_raw = []
+        self._descriptions_clean = []
+        self._amounts = array('q')
+        self._exact_amounts = {}
+        self._currencies = []
+        self._types = array('b')
+        self._accounts = []
+        self._flags = []
+        self._interned = {}
+        for transaction in transactions:
+            self.append(transaction)
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('transaction index out of range')
+        return StandardizedTransaction.model_construct(**self._record(index, TRANSACTION_TYPES))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (CompactTransactionBatch, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def append(self, transaction: StandardizedTransaction) -> None:
+        self.append_values(
+            transaction.transaction_id, transaction.transaction_date, transaction.description_raw,
+            transaction.description_clean, transaction.amount, transaction.currency,
+            transaction.transaction_type, transaction.source_account, transaction.data_quality_flags
+        )
+
+    def append_values(self, transaction_id: str, transaction_date: str, description_raw: str,
+                      description_clean: str, amount: float, currency: str, transaction_type: str,
+                      source_account: str = "Unknown", data_quality_flags: Iterable[str] = ()) -> None:
+        index = len(self)
+        match = GENERATED_ID_PATTERN.fullmatch(transaction_id)
+        if match:
+            self._ids.append(int(match.group(1), 16))
+        else:
+            self._ids.append(0)
+            self._custom_ids[index] = transaction_id
+        minor_units = round(amount * 100) if math.isfinite(amount) and abs(amount) < MAX_MINOR_AMOUNT else 0
+        if minor_units / 100 != amount:
+            self._exact_amounts[index] = amount
+        self._amounts.append(minor_units)
+        self._types.append(1 if transaction_type == TransactionType.CREDIT else 0)
+        intern = self._intern
+        self._dates.append(intern(transaction_date))
+        self._descriptions_raw.append(description_raw)
+        self._descriptions_clean.append(description_clean)
+        self._currencies.append(intern(currency))
+        self._accounts.append(intern(source_account))
+        self._flags.append(intern(tuple(data_quality_flags)))
+
+    def extend(self, transactions: Iterable[StandardizedTransaction]) -> None:
+        if not isinstance(transactions, CompactTransactionBatch):
+            for transaction in transactions:
+                self.append(transaction)
+            return
+        offset = len(self)
+        self._ids.extend(transactions._ids)
+        self._custom_ids.update((index + offset, value) for index, value in transactions._custom_ids.items())
+        self._amounts.extend(transactions._amounts)
+        self._exact_amounts.update((index + offset, value) for index, value in transactions._exact_amounts.items())
+        self._types.extend(transactions._types)
+        intern = self._intern
+        self._dates.extend(intern(value) for value in transactions._dates)
+        self._descriptions_raw.extend(transactions._descriptions_raw)
+        self._descriptions_clean.extend(transactions._descriptions_clean)
+        self._currencies.extend(intern(value) for value in transactions._currencies)
+        self._accounts.extend(intern(value) for value in transactions._accounts)
+        self._flags.extend(intern(value) for value in transactions._flags)
+
+    def set_transaction_id(self, index: int, transaction_id: str) -> None:
+        match = GENERATED_ID_PATTERN.fullmatch(transaction_id)
+        if match:
+            self._ids[index] = int(match.group(1), 16)
+            self._custom_ids.pop(index, None)
+        else:
+            self._ids[index] = 0
+            self._custom_ids[index] = transaction_id
+
+    def add_flag(self, index: int, flag: str) -> None:
+        if flag not in self._flags[index]:
+            self._flags[index] = self._intern(self._flags[index] + (flag,))
+
+    def iter_transaction_ids(self) -> Iterator[str]:
+        custom_ids = self._custom_ids
+        for index, value in enumerate(self._ids):
+            transaction_id = custom_ids.get(index)
+            yield transaction_id if transaction_id is not None else f"gen_uuid_{value:08x}"
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        type_values = tuple(transaction_type.value for transaction_type in TRANSACTION_TYPES)
+        for index in range(len(self)):
+            yield self._record(index, type_values)
+
+    def _record(self, index: int, type_values: tuple) -> Dict[str, Any]:
+        transaction_id = self._custom_ids.get(index)
+        if transaction_id is None:
+            transaction_id = f"gen_uuid_{self._ids[index]:08x}"
+        amount = self._exact_amounts.get(index)
+        if amount is None:
+            amount = self._amounts[index] / 100
+        return {
+            'transaction_id': transaction_id,
+            'transaction_date': self._dates[index],
+            'description_raw': self._descriptions_raw[index],
+            'description_clean': self._descriptions_clean[index],
+            'amount': amount,
+            'currency': self._currencies[index],
+            'transaction_type': type_values[self._types[index]],
+            'source_account': self._accounts[index],
+            'data_quality_flags': list(self._flags[index])
+        }
+
+    def _intern(self, value):
+        return self._interned.setdefault(value, value)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler) -> core_schema.CoreSchema:
+        return core_schema.is_instance_schema(
+            cls, serialization=core_schema.plain_serializer_function_ser_schema(lambda batch: list(batch))
+        )
+
+
+TransactionList = Union[CompactTransactionBatch, List[StandardizedTransaction]]
+
+
+def format_validation_error(error_code: str, field: Optional[str], raw_data: Any) -> str:
+    value = raw_data.get(field) if field and isinstance(raw_data, dict) else raw_data
+    detail = VALIDATION_ERROR_MESSAGES[error_code].format(field=field, value_type=type(value).__name__)
+    return f"Неверный формат входных данных: {detail}"
+
+
+def serialize_failed_transactions(failed_transactions: List[dict]) -> List[dict]:
+    # code-based validation stores only error_code/error_field, the message is built on serialization
+    return [
+        failed if 'error' in failed or 'error_code' not in failed else {
+            **failed,
+            'error': format_validation_error(failed['error_code'], failed['error_field'], failed['original_data'])
+        }
+        for failed in failed_transactions
+    ]
+
+
 class ProcessingResult(BaseModel):
-    successful_transactions: List[StandardizedTransaction]
+    successful_transactions: TransactionList = Field(union_mode='left_to_right')
     failed_transactions: List[dict]
     processing_summary: dict
+
+    @field_serializer('failed_transactions')
+    def _serialize_failed_transactions(self, failed_transactions: List[dict]) -> List[dict]:
+        return serialize_failed_transactions(failed_transactions)
@@ -1,28 +1,55 @@
 import re
-from typing import Tuple, List, Union, Optional
-from src.utils.constants import CURRENCY_MAPPING, SUPPORTED_CURRENCIES, NUMERIC_CLEANUP_CHARS
+from typing import Tuple, List, Union, Optional, Dict
+from src.utils.constants import (
+    CURRENCY_MAPPING, SUPPORTED_CURRENCIES, NUMERIC_CLEANUP_CHARS, DEBIT_KEYWORDS, CREDIT_KEYWORDS
+)
+from src.utils.cache import LRUCache
+from src.utils.keyword_automaton import KeywordAutomaton, build_keyword_automaton
 
 
 class AmountProcessor:
-    def __init__(self):
-        self.currency_mapping = CURRENCY_MAPPING
-        self.supported_currencies = SUPPORTED_CURRENCIES
+    def __init__(self, cache: Optional[LRUCache] = None, keyword_automaton: Optional[KeywordAutomaton] = None,
+                 currency_mapping: Optional[Dict[str, str]] = None):
+        self.currency_mapping = currency_mapping or CURRENCY_MAPPING
+        self.keyword_automaton = keyword_automaton or build_keyword_automaton(
+            DEBIT_KEYWORDS, CREDIT_KEYWORDS, self.currency_mapping
+        )
+        self.supported_currencies = SUPPORTED_CURRENCIES + sorted(
+            set(self.currency_mapping.values()) - set(SUPPORTED_CURRENCIES)
+        )
         self.cleanup_chars = NUMERIC_CLEANUP_CHARS
+        self.cache = cache
+        self.convention_patterns = {
+            '.': re.compile(r'-?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?'),
+            ',': re.compile(r'-?(?:\d{1,3}(?:\.\d{3})+|\d+)(?:,\d+)?'),
+        }
 
-    def clean_amount(self, amount_str: Union[str, float, int]) -> Tuple[float, List[str]]:
-        quality_flags = []
-
+    def clean_amount(self, amount_str: Union[str, float, int], decimal_separator: Optional[str] = None) -> Tuple[float, List[str]]:
         if isinstance(amount_str, (int, float)):
-            return float(amount_str), quality_flags
+            return float(amount_str), []
 
         if not amount_str or amount_str in ['', 'null', 'None']:
             return 0.0, ['missing_required_field']
 
+        if self.cache is None or not isinstance(amount_str, str):
+            return self._clean_amount(amount_str, decimal_separator)
+        cache_key = ('amount', amount_str, decimal_separator)
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            cached = self._clean_amount(amount_str, decimal_separator)
+            self.cache.put(cache_key, (cached[0], tuple(cached[1])))
+        return cached[0], list(cached[1])
+
+    def _clean_amount(self, amount_str: Union[str, float, int], decimal_separator: Optional[str] = None) -> Tuple[float, List[str]]:
+        quality_flags = []
         amount_str = str(amount_str).strip()
         is_negative = amount_str.startswith('-')
         cleaned = re.sub(r'[^\d.,\-]', '', amount_str)
 
-        if ',' in cleaned and '.' in cleaned:
+        if decimal_separator in self.convention_patterns and self.convention_patterns[decimal_separator].fullmatch(cleaned):
+            thousands_separator = ',' if decimal_separator == '.' else '.'
+            cleaned = cleaned.replace(thousands_separator, '').replace(decimal_separator, '.')
+        elif ',' in cleaned and '.' in cleaned:
             if cleaned.rfind(',') > cleaned.rfind('.'):
                 cleaned = cleaned.replace('.', '').replace(',', '.')
             else:
@@ -45,41 +72,59 @@ class AmountProcessor:
             quality_flags.append('amount_format_unclear')
             return 0.0, quality_flags
 
-    def standardize_currency(self, currency_str: Optional[str], amount_str: str = "") -> Tuple[str, List[str]]:
+    def standardize_currency(self, currency_str: Optional[str], amount_str: str = "",
+                             default_currency: str = 'KZT') -> Tuple[str, List[str]]:
+        if self.cache is None or not isinstance(amount_str, str) or not isinstance(currency_str, (str, type(None))):
+            return self._standardize_currency(currency_str, amount_str, default_currency)
+        cache_key = ('currency', currency_str, amount_str, default_currency)
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            cached = self._standardize_currency(currency_str, amount_str, default_currency)
+            self.cache.put(cache_key, (cached[0], tuple(cached[1])))
+        return cached[0], list(cached[1])
+
+    def _standardize_currency(self, currency_str: Optional[str], amount_str: str = "",
+                              default_currency: str = 'KZT') -> Tuple[str, List[str]]:
         quality_flags = []
 
         if currency_str:
-            currency_clean = currency_str.strip().lower()
-            if currency_clean in self.currency_mapping:
-                return self.currency_mapping[currency_clean], quality_flags
-            elif currency_clean.upper() in self.supported_currencies:
-                return currency_clean.upper(), quality_flags
+            code = self.resolve_currency_code(currency_str)
+            if code:
+                return code, quality_flags
 
         if amount_str:
-            amount_lower = str(amount_str).lower()
-            for symbol, code in self.currency_mapping.items():
-                if symbol in amount_lower:
-                    if not currency_str:
-                        quality_flags.append('currency_assumed')
-                    return code, quality_flags
+            code = self.keyword_automaton.first(str(amount_str), 'currency')
+            if code:
+                if not currency_str:
+                    quality_flags.append('currency_assumed')
+                return code, quality_flags
 
         quality_flags.append('currency_assumed')
-        return 'KZT', quality_flags
-
-    def process_debit_credit_format(self, debit: Union[str, float, None], credit: Union[str, float, None]) -> Tuple[float, str, List[str]]:
+        return default_currency, quality_flags
+
+    def resolve_currency_code(self, currency_str: str) -> Optional[str]:
+        currency_clean = currency_str.strip().lower()
+        if currency_clean in self.currency_mapping:
+            return self.currency_mapping[currency_clean]
+        if currency_clean.upper() in self.supported_currencies:
+            return currency_clean.upper()
+        return None
+
+    def process_debit_credit_format(self, debit: Union[str, float, None], credit: Union[str, float, None],
+                                    decimal_separator: Optional[str] = None) -> Tuple[float, str, List[str]]:
         quality_flags = []
 
         if debit and (not credit or credit == 0):
-            amount, amount_flags = self.clean_amount(debit)
+            amount, amount_flags = self.clean_amount(debit, decimal_separator)
             quality_flags.extend(amount_flags)
             return amount, 'DEBIT', quality_flags
         elif credit and (not debit or debit == 0):
-            amount, amount_flags = self.clean_amount(credit)
+            amount, amount_flags = self.clean_amount(credit, decimal_separator)
             quality_flags.extend(amount_flags)
             return amount, 'CREDIT', quality_flags
         elif debit and credit:
-            debit_amount, _ = self.clean_amount(debit)
-            credit_amount, _ = self.clean_amount(credit)
+            debit_amount, _ = self.clean_amount(debit, decimal_separator)
+            credit_amount, _ = self.clean_amount(credit, decimal_separator)
             if debit_amount >= credit_amount:
                 return debit_amount, 'DEBIT', quality_flags
             else:
@@ -88,7 +133,8 @@ class AmountProcessor:
             quality_flags.append('missing_required_field')
             return 0.0, 'DEBIT', quality_flags
 
-    def process_single_amount_format(self, amount: Union[str, float]) -> Tuple[float, str, List[str]]:
+    def process_single_amount_format(self, amount: Union[str, float],
+                                     decimal_separator: Optional[str] = None) -> Tuple[float, str, List[str]]:
         quality_flags = []
 
         if not amount:
@@ -96,7 +142,7 @@ class AmountProcessor:
             return 0.0, 'DEBIT', quality_flags
 
         is_negative = str(amount).strip().startswith('-')
-        cleaned_amount, amount_flags = self.clean_amount(amount)
+        cleaned_amount, amount_flags = self.clean_amount(amount, decimal_separator)
         quality_flags.extend(amount_flags)
 
         transaction_type = 'DEBIT' if is_negative else 'CREDIT'
@@ -0,0 +1,96 @@
+from typing import Dict, Any, Iterable, Optional
+from src.models.parser_models import FileProcessingResult, BatchProcessingResult
+from src.models.statistics_models import ProcessingStatistics
+from src.processors.deduplication import TransactionDeduplicator, FuzzyDuplicateDetector
+from src.utils.metrics import merge_snapshots
+from src.utils.result_cache import ResultCache
+
+
+class BatchResultAccumulator:
+    def __init__(self, keep_results: bool = True, deduplicator: Optional[TransactionDeduplicator] = None,
+                 fuzzy_detector: Optional[FuzzyDuplicateDetector] = None,
+                 result_cache: Optional[ResultCache] = None):
+        self.keep_results = keep_results
+        self.deduplicator = deduplicator
+        self.fuzzy_detector = fuzzy_detector
+        self.result_cache = result_cache
+        self.result_cache_start = result_cache.snapshot() if result_cache is not None else None
+        self.file_results = []
+        self.total_files = 0
+        self.successful_files = 0
+        self.failed_files = 0
+        self.total_transactions = 0
+        self.successful_transactions = 0
+        self.statistics = ProcessingStatistics()
+        self.metrics = None
+
+    def add(self, file_result: FileProcessingResult) -> None:
+        if self.deduplicator is not None:
+            self.deduplicator.apply(file_result)
+        if self.fuzzy_detector is not None:
+            self.fuzzy_detector.apply(file_result)
+        self.total_files += 1
+        self.total_transactions += file_result.processing_summary.get('total_transactions', 0)
+        self.successful_transactions += file_result.processing_summary.get('successful_count', 0)
+        if file_result.original_error:
+            self.failed_files += 1
+        else:
+            self.successful_files += 1
+        self.statistics.merge(self.file_statistics(file_result))
+        if 'metrics' in file_result.processing_summary:
+            self.metrics = merge_snapshots(self.metrics, file_result.processing_summary['metrics'])
+        if self.keep_results:
+            self.file_results.append(file_result)
+
+    def processing_summary(self) -> Dict[str, Any]:
+        summary = {
+            'total_files': self.total_files,
+            'successful_files': self.successful_files,
+            'failed_files': self.failed_files,
+            'total_transactions': self.total_transactions,
+            'successful_transactions': self.successful_transactions,
+            'file_success_rate': (self.successful_files / self.total_files * 100) if self.total_files else 0,
+            'transaction_success_rate': (
+                self.successful_transactions / self.total_transactions * 100
+            ) if self.total_transactions else 0,
+            'source_type_distribution': dict(self.statistics.source_type_distribution)
+        }
+        if self.deduplicator is not None:
+            summary['duplicate_transactions'] = self.deduplicator.duplicates
+            summary['deduplication'] = self.deduplicator.summary()
+        if self.fuzzy_detector is not None:
+            summary['suspected_duplicates'] = self.fuzzy_detector.suspected
+            summary['fuzzy_deduplication'] = self.fuzzy_detector.summary()
+        if self.result_cache is not None:
+            summary['result_cache'] = self.result_cache.summary(self.result_cache_start)
+        if self.metrics is not None:
+            summary['metrics'] = self.metrics
+        return summary
+
+    def build(self) -> BatchProcessingResult:
+        return BatchProcessingResult(
+            total_files=self.total_files,
+            successful_files=self.successful_files,
+            failed_files=self.failed_files,
+            total_transactions=self.total_transactions,
+            successful_transactions=self.successful_transactions,
+            file_results=self.file_results,
+            processing_summary=self.processing_summary(),
+            statistics=self.statistics
+        )
+
+    @staticmethod
+    def file_statistics(file_result: FileProcessingResult) -> ProcessingStatistics:
+        if file_result.statistics.total_files:
+            return file_result.statistics
+        statistics = ProcessingStatistics()
+        statistics.add_file(file_result.source_type, file_result.processing_summary.get('total_transactions', 0))
+        statistics.add_transactions(file_result.successful_transactions)
+        return statistics
+
+    @classmethod
+    def collect_statistics(cls, file_results: Iterable[FileProcessingResult]) -> ProcessingStatistics:
+        statistics = ProcessingStatistics()
+        for file_result in file_results:
+            statistics.merge(cls.file_statistics(file_result))
+        return statistics
@@ -0,0 +1,317 @@
+import os
+from typing import List, Dict, Any, Tuple, Callable, Optional, Iterator
+import numpy as np
+import pandas as pd
+from src.models.transaction_models import (
+    StandardizedTransaction, TransactionType, CompactTransactionBatch, TransactionList
+)
+from src.models.parser_models import TableFormatProfile
+from src.models.table_models import TableRow, TableRows, original_row
+from src.processors.date_processor import DateProcessor
+from src.processors.amount_processor import AmountProcessor
+from src.processors.text_processor import TextProcessor
+from src.processors.validation import validate_raw_transaction, validation_failure
+from src.utils.constants import DATE_FORMATS
+
+RAW_COLUMNS = ['transaction_date', 'description', 'debit', 'credit', 'amount', 'currency']
+
+ISO_OUTPUT_FORMAT = '%Y-%m-%dT00:00:00Z'
+
+CONTROL_CHARS_PATTERN = r'[\x00-\x1f\x7f-\x9f]'
+PROBLEMATIC_CHARS_PATTERN = r'[^\w\s\-.,!?()№/\\]'
+
+
+class ColumnarBatchProcessor:
+    def __init__(self, date_processor: DateProcessor, amount_processor: AmountProcessor,
+                 text_processor: TextProcessor):
+        self.date_processor = date_processor
+        self.amount_processor = amount_processor
+        self.text_processor = text_processor
+
+    def process_rows(self, raw_transactions: List[Dict[str, Any]],
+                     fallback: Callable[..., StandardizedTransaction],
+                     format_profile: Optional[TableFormatProfile] = None,
+                     transactions: Optional[TransactionList] = None,
+                     validate_codes: bool = False) -> Tuple[TransactionList, List]:
+        if isinstance(raw_transactions, TableRows):
+            fast_indices, fallback_indices, frame = self._split_table(raw_transactions)
+        else:
+            fast_indices, fallback_indices, frame = self._split_rows(raw_transactions)
+        standardized = {}
+        if fast_indices:
+            for i, values in zip(fast_indices, self._iter_frame_values(frame, format_profile)):
+                standardized[i] = values
+        failed_transactions = []
+        for i in fallback_indices:
+            if validate_codes:
+                _, error_code, error_field = validate_raw_transaction(raw_transactions[i])
+                if error_code is not None:
+                    failed_transactions.append(validation_failure(i, raw_transactions[i], error_code, error_field))
+                    continue
+            try:
+                standardized[i] = fallback(raw_transactions[i], format_profile)
+            except Exception as e:
+                failed_transactions.append({
+                    'index': i,
+                    'original_data': original_row(raw_transactions[i]),
+                    'error': str(e),
+                    'error_type': type(e).__name__
+                })
+        if transactions is None:
+            transactions = []
+        for i in sorted(standardized):
+            item = standardized[i]
+            if isinstance(item, StandardizedTransaction):
+                transactions.append(item)
+            elif isinstance(transactions, CompactTransactionBatch):
+                transactions.append_values(**item)
+            else:
+                transactions.append(StandardizedTransaction.model_construct(**item))
+        return transactions, failed_transactions
+
+    def process_frame(self, frame: pd.DataFrame,
+                      format_profile: Optional[TableFormatProfile] = None) -> List[StandardizedTransaction]:
+        return [
+            StandardizedTransaction.model_construct(**values)
+            for values in self._iter_frame_values(frame, format_profile)
+        ]
+
+    def _iter_frame_values(self, frame: pd.DataFrame,
+                           format_profile: Optional[TableFormatProfile] = None) -> Iterator[Dict[str, Any]]:
+        profile = format_profile or TableFormatProfile()
+        dates, date_flags = self._standardize_dates(frame['transaction_date'], profile.date_format)
+        descriptions_clean, description_flags = self._clean_descriptions(frame['description'])
+        amounts, transaction_types, amount_flags = self._process_amounts(frame, profile.decimal_separator)
+        currencies, currency_flags = self._standardize_currencies(frame, profile.default_currency or 'KZT')
+        id_suffixes = os.urandom(4 * len(frame)).hex()
+        rows = zip(
+            range(0, len(id_suffixes), 8), dates, frame['description'], descriptions_clean, amounts, currencies, transaction_types,
+            date_flags, description_flags, amount_flags, currency_flags
+        )
+        for id_offset, date, raw, clean, amount, currency, transaction_type, *flag_groups in rows:
+            quality_flags = [flag for flags in flag_groups for flag in flags]
+            yield dict(
+                transaction_id=f"gen_uuid_{id_suffixes[id_offset:id_offset + 8]}",
+                transaction_date=date,
+                description_raw=raw,
+                description_clean=clean,
+                amount=float(amount),
+                currency=currency,
+                transaction_type=TransactionType(transaction_type),
+                source_account="Unknown",
+                data_quality_flags=list(set(quality_flags))
+            )
+
+    def _split_rows(self, raw_transactions: List[Dict[str, Any]]) -> Tuple[List[int], List[int], pd.DataFrame]:
+        fast_indices = []
+        fallback_indices = []
+        for i, raw_data in enumerate(raw_transactions):
+            if self._is_fast_path_row(raw_data):
+                fast_indices.append(i)
+            else:
+                fallback_indices.append(i)
+        frame = pd.DataFrame(
+            [[raw_transactions[i].get(column) for column in RAW_COLUMNS] for i in fast_indices],
+            columns=RAW_COLUMNS,
+            dtype=object
+        )
+        return fast_indices, fallback_indices, frame
+
+    def _split_table(self, table: TableRows) -> Tuple[List[int], List[int], pd.DataFrame]:
+        # the frame is built straight from the column arrays, rows never become dicts
+        size = len(table)
+        columns = [table.column(name) for name in RAW_COLUMNS]
+        columns = [[None] * size if values is None else values for values in columns]
+        fast_indices = []
+        fallback_indices = []
+        for i, values in enumerate(zip(*columns)):
+            if self._is_fast_path_values(*values):
+                fast_indices.append(i)
+            else:
+                fallback_indices.append(i)
+        if len(fast_indices) < size:
+            columns = [[values[i] for i in fast_indices] for values in columns]
+        frame = pd.DataFrame(dict(zip(RAW_COLUMNS, columns)), columns=RAW_COLUMNS, dtype=object)
+        return fast_indices, fallback_indices, frame
+
+    def _is_fast_path_row(self, raw_data: Any) -> bool:
+        if not isinstance(raw_data, (dict, TableRow)):
+            return False
+        get = raw_data.get
+        return self._is_fast_path_values(
+            get('transaction_date'), get('description'), get('debit'), get('credit'), get('amount'), get('currency')
+        )
+
+    def _is_fast_path_values(self, transaction_date: Any, description: Any, debit: Any, credit: Any,
+                             amount: Any, currency: Any) -> bool:
+        if not isinstance(transaction_date, str) or not isinstance(description, str):
+            return False
+        for value in (debit, credit, amount):
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (str, int, float))):
+                return False
+        return currency is None or isinstance(currency, str)
+
+    def _standardize_dates(self, column: pd.Series,
+                           preferred_format: Optional[str] = None) -> Tuple[List[str], List[List[str]]]:
+        codes, uniques = pd.factorize(column)
+        stripped = pd.Series(uniques, dtype=object).str.strip()
+        parsed = pd.Series(None, index=stripped.index, dtype=object)
+        pending = stripped != ''
+        date_formats = DATE_FORMATS
+        if preferred_format:
+            date_formats = [preferred_format] + [f for f in DATE_FORMATS if f != preferred_format]
+        for date_format in date_formats:
+            if not pending.any():
+                break
+            candidates = pd.to_datetime(stripped[pending], format=date_format, errors='coerce')
+            matched = candidates.notna()
+            if matched.any():
+                matched_index = candidates.index[matched]
+                parsed[matched_index] = candidates[matched].dt.strftime(ISO_OUTPUT_FORMAT)
+                pending[matched_index] = False
+        unique_flags = [[] for _ in range(len(uniques))]
+        for position in np.flatnonzero(parsed.isna().to_numpy()):
+            parsed.iat[position], unique_flags[position] = self.date_processor.standardize_date(uniques[position])
+        values = parsed.to_numpy()
+        return [values[code] for code in codes], [unique_flags[code] for code in codes]
+
+    def _clean_descriptions(self, column: pd.Series) -> Tuple[List[str], List[List[str]]]:
+        codes, uniques = pd.factorize(column)
+        descriptions = pd.Series(uniques, dtype=object)
+        cleaned = descriptions.str.strip()
+        has_control = cleaned.str.contains(CONTROL_CHARS_PATTERN, regex=True)
+        cleaned = cleaned.str.replace(CONTROL_CHARS_PATTERN, ' ', regex=True)
+        cleaned = cleaned.str.replace(r'\s+', ' ', regex=True)
+        has_special = cleaned.str.contains(PROBLEMATIC_CHARS_PATTERN, regex=True)
+        cleaned = cleaned.str.lower().str.strip().tolist()
+        unique_flags = []
+        for description, control, special in zip(uniques, has_control.to_numpy(), has_special.to_numpy()):
+            if description == '':
+                unique_flags.append(['missing_required_field'])
+                continue
+            row_flags = []
+            if control:
+                row_flags.append('description_contains_special_chars')
+            if special:
+                row_flags.append('description_contains_special_chars')
+            unique_flags.append(row_flags)
+        return [cleaned[code] for code in codes], [unique_flags[code] for code in codes]
+
+    def _process_amounts(self, frame: pd.DataFrame,
+                         decimal_separator: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray, List[List[str]]]:
+        size = len(frame)
+        amounts = np.zeros(size, dtype=float)
+        transaction_types = np.full(size, 'DEBIT', dtype=object)
+        missing = np.zeros(size, dtype=bool)
+        unclear = np.zeros(size, dtype=bool)
+
+        single = frame['amount'].map(lambda value: value is not None).to_numpy(dtype=bool)
+        if single.any():
+            column = frame['amount'][single]
+            values, value_missing, value_unclear = self._clean_amount_values(column, decimal_separator)
+            present = self._truthy(column)
+            negative = column.map(lambda value: str(value).strip().startswith('-')).to_numpy(dtype=bool)
+            amounts[single] = np.where(present, values, 0.0)
+            transaction_types[single] = np.where(present & ~negative, 'CREDIT', 'DEBIT')
+            missing[single] = ~present | value_missing
+            unclear[single] = present & value_unclear
+
+        split = ~single
+        if split.any():
+            debit = frame['debit'][split]
+            credit = frame['credit'][split]
+            debit_values, debit_missing, debit_unclear = self._clean_amount_values(debit, decimal_separator)
+            credit_values, credit_missing, credit_unclear = self._clean_amount_values(credit, decimal_separator)
+            has_debit = self._truthy(debit)
+            has_credit = self._truthy(credit)
+            only_debit = has_debit & ~has_credit
+            only_credit = has_credit & ~has_debit
+            both = has_debit & has_credit
+            debit_wins = both & (debit_values >= credit_values)
+            amounts[split] = np.select(
+                [only_debit, only_credit, debit_wins, both],
+                [debit_values, credit_values, debit_values, credit_values],
+                0.0
+            )
+            transaction_types[split] = np.where(only_credit | (both & ~debit_wins), 'CREDIT', 'DEBIT')
+            missing[split] = (only_debit & debit_missing) | (only_credit & credit_missing) | ~(has_debit | has_credit)
+            unclear[split] = (only_debit & debit_unclear) | (only_credit & credit_unclear)
+
+        flags = []
+        for is_missing, is_unclear in zip(missing, unclear):
+            row_flags = []
+            if is_missing:
+                row_flags.append('missing_required_field')
+            if is_unclear:
+                row_flags.append('amount_format_unclear')
+            flags.append(row_flags)
+        return amounts, transaction_types, flags
+
+    def _clean_amount_values(self, column: pd.Series,
+                             decimal_separator: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        size = len(column)
+        values = np.zeros(size, dtype=float)
+        missing = np.zeros(size, dtype=bool)
+        unclear = np.zeros(size, dtype=bool)
+        is_text = column.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+        is_number = column.map(lambda value: value is not None).to_numpy(dtype=bool) & ~is_text
+        if is_number.any():
+            values[is_number] = column[is_number].astype(float).to_numpy()
+        if is_text.any():
+            codes, uniques = pd.factorize(column[is_text])
+            text = pd.Series(uniques, dtype=object)
+            text_missing = text.isin(['', 'null', 'None']).to_numpy()
+            cleaned = text.str.strip().str.replace(r'[^\d.,\-]', '', regex=True)
+            has_comma = cleaned.str.contains(',', regex=False)
+            has_dot = cleaned.str.contains('.', regex=False)
+            last_comma = cleaned.str.rfind(',')
+            decimal_comma = (
+                (has_comma & has_dot & (last_comma > cleaned.str.rfind('.')))
+                | (has_comma & ~has_dot & (cleaned.str.count(',') == 1)
+                   & (cleaned.str.len() - last_comma - 1 <= 2))
+            )
+            if decimal_separator in self.amount_processor.convention_patterns:
+                pattern = self.amount_processor.convention_patterns[decimal_separator].pattern
+                follows_convention = cleaned.str.fullmatch(pattern)
+                decimal_comma = decimal_comma.where(~follows_convention, decimal_separator == ',')
+            cleaned = cleaned.where(
+                ~decimal_comma,
+                cleaned.str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+            )
+            cleaned = cleaned.where(decimal_comma | ~has_comma, cleaned.str.replace(',', '', regex=False))
+            cleaned = cleaned.str.replace(r'-+', '-', regex=True)
+            parsed = pd.to_numeric(cleaned, errors='coerce').astype(float).to_numpy()
+            text_unclear = np.isnan(parsed) & ~text_missing
+            text_values = np.where(text_missing | text_unclear, 0.0, np.abs(parsed))
+            values[is_text] = text_values[codes]
+            missing[is_text] = text_missing[codes]
+            unclear[is_text] = text_unclear[codes]
+        return values, missing, unclear
+
+    def _truthy(self, column: pd.Series) -> np.ndarray:
+        return column.map(lambda value: bool(value)).to_numpy(dtype=bool)
+
+    def _standardize_currencies(self, frame: pd.DataFrame,
+                                default_currency: str = 'KZT') -> Tuple[List[str], List[List[str]]]:
+        column = frame['currency']
+        keys = column.where(column.notna(), '').str.strip().str.lower()
+        mapped = keys.map(self.amount_processor.currency_mapping)
+        upper = keys.str.upper()
+        supported = upper.isin(self.amount_processor.supported_currencies) & mapped.isna()
+        mapped = mapped.where(~supported, upper)
+        currencies = mapped.tolist()
+        flags = [[] for _ in range(len(frame))]
+        unresolved = np.flatnonzero(mapped.isna().to_numpy() | (keys == '').to_numpy())
+        if len(unresolved):
+            resolved = {}
+            columns = [frame[name].to_numpy() for name in ('currency', 'debit', 'credit', 'amount')]
+            for position in unresolved:
+                currency, debit, credit, amount = (values[position] for values in columns)
+                currency_source = currency or str(debit or credit or amount or "")
+                key = (currency, currency_source)
+                if key not in resolved:
+                    resolved[key] = self.amount_processor.standardize_currency(
+                        currency, currency_source, default_currency
+                    )
+                currencies[position], flags[position] = resolved[key]
+        return currencies, flags
@@ -1,37 +1,88 @@
-from datetime import datetime
-from dateutil import parser as date_parser
-from typing import Tuple, List
+import threading
+from datetime import datetime, date
+from typing import Tuple, List, Optional
 from src.utils.constants import DATE_FORMATS
+from src.utils.cache import LRUCache
+from src.utils.date_tokenizer import DateTokenizer
+from src.utils.metrics import MetricsRecorder, NULL_METRICS
 
 
 class DateProcessor:
-    def __init__(self):
+    def __init__(self, cache: Optional[LRUCache] = None, metrics: MetricsRecorder = NULL_METRICS):
         self.date_formats = DATE_FORMATS
+        self.tokenizer = DateTokenizer(self.date_formats)
+        self._strptime_formats = [f for f in self.date_formats if f not in self.tokenizer.formats]
+        self.cache = cache
+        self.metrics = metrics
+        self._state = threading.local()
 
-    def standardize_date(self, date_str: str) -> Tuple[str, List[str]]:
-        quality_flags = []
+    def reset_today_dependent(self) -> None:
+        self._state.today_dependent = False
+
+    def today_dependent(self) -> bool:
+        # set when a date since the last reset fell back to today or was completed from today's date
+        return getattr(self._state, 'today_dependent', False)
 
+    def standardize_date(self, date_str: str, date_format: Optional[str] = None) -> Tuple[str, List[str]]:
         if not date_str or not isinstance(date_str, str):
-            quality_flags.append('original_date_ambiguous')
+            self.metrics.increment('date_now_fallback')
+            self._state.today_dependent = True
+            return datetime.now().strftime('%Y-%m-%dT00:00:00Z'), ['original_date_ambiguous']
+
+        cache_key = ('date', date_str, date_format)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None and (cached[2] is None or cached[2] == date.today()):
+                if cached[2] is not None:
+                    self._state.today_dependent = True
+                return cached[0], list(cached[1])
+
+        standardized, quality_flags, valid_on = self._parse_date(date_str.strip(), date_format)
+        if standardized is None:
+            self.metrics.increment('date_now_fallback')
+            self._state.today_dependent = True
             return datetime.now().strftime('%Y-%m-%dT00:00:00Z'), quality_flags
+        if valid_on is not None:
+            self._state.today_dependent = True
+        if self.cache is not None:
+            self.cache.put(cache_key, (standardized, tuple(quality_flags), valid_on))
+        return standardized, quality_flags
 
-        date_str = date_str.strip()
+    def _parse_date(self, date_str: str, preferred_format: Optional[str] = None) -> Tuple[Optional[str], List[str], Optional[date]]:
+        quality_flags = []
 
-        for date_format in self.date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str, date_format)
-                return parsed_date.strftime('%Y-%m-%dT00:00:00Z'), quality_flags
-            except ValueError:
-                continue
+        # DATE_FORMATS never match the same string, so only a format the tokenizer does not know
+        # has to be tried first to keep the table's preference
+        if preferred_format and preferred_format not in self.tokenizer.formats:
+            standardized = self._strptime(date_str, preferred_format)
+            if standardized is not None:
+                return standardized, quality_flags, None
+        parts = self.tokenizer.parse(date_str)
+        if parts is not None:
+            return parts.isoformat(), quality_flags, None
+        for date_format in self._strptime_formats:
+            standardized = self._strptime(date_str, date_format)
+            if standardized is not None:
+                return standardized, quality_flags, None
 
+        # dateutil fills missing fields from today's date, so the result is only valid until midnight
+        self.metrics.increment('date_dateutil_fallback')
+        from dateutil import parser as date_parser
         try:
+            parsed_on = date.today()
             parsed_date = date_parser.parse(date_str, dayfirst=True)
             if parsed_date.year < 100:
                 quality_flags.append('original_date_ambiguous')
-            return parsed_date.strftime('%Y-%m-%dT00:00:00Z'), quality_flags
+            return parsed_date.strftime('%Y-%m-%dT00:00:00Z'), quality_flags, parsed_on
         except (ValueError, TypeError):
             quality_flags.append('original_date_ambiguous')
-            return datetime.now().strftime('%Y-%m-%dT00:00:00Z'), quality_flags
+            return None, quality_flags, None
+
+    def _strptime(self, date_str: str, date_format: str) -> Optional[str]:
+        try:
+            return datetime.strptime(date_str, date_format).strftime('%Y-%m-%dT00:00:00Z')
+        except ValueError:
+            return None
 
     def validate_date(self, date_str: str) -> bool:
         try:
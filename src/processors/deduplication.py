@@ -0,0 +1,282 @@
+import bisect
+import math
+import uuid
+from typing import Dict, List, Optional, FrozenSet
+from src.models.parser_models import FileProcessingResult, ProcessingConfig
+from src.models.statistics_models import ProcessingStatistics
+from src.models.transaction_models import CompactTransactionBatch, TransactionList
+
+TRANSACTION_ID_NAMESPACE = uuid.UUID('6f1c2a52-8d0e-5b7f-9a43-2c1e7d5b0f61')
+
+DETERMINISTIC_ID_PREFIX = 'txn_'
+
+DUPLICATE_FLAG = 'duplicate_transaction'
+
+SUSPECTED_DUPLICATE_FLAG = 'suspected_duplicate'
+
+
+def transaction_content_key(transaction_date: str, amount: float, currency: str, transaction_type: str,
+                            description_clean: str, source_account: str, occurrence: int) -> str:
+    return '\x1f'.join((
+        transaction_date, f'{amount:.2f}', currency, transaction_type,
+        description_clean, source_account, str(occurrence)
+    ))
+
+
+def deterministic_transaction_id(content_key: str) -> str:
+    return DETERMINISTIC_ID_PREFIX + uuid.uuid5(TRANSACTION_ID_NAMESPACE, content_key).hex
+
+
+def assign_deterministic_ids(transactions: TransactionList) -> None:
+    # identical rows inside one table or text block are told apart by their occurrence number,
+    # so a statement uploaded twice repeats the same ids while genuine repeats stay distinct
+    occurrences = {}
+    for index, transaction in enumerate(transactions):
+        content = (
+            transaction.transaction_date, transaction.amount, transaction.currency,
+            transaction.transaction_type.value, transaction.description_clean, transaction.source_account
+        )
+        occurrence = occurrences.get(content, 0)
+        occurrences[content] = occurrence + 1
+        transaction_id = deterministic_transaction_id(transaction_content_key(*content, occurrence))
+        if isinstance(transactions, CompactTransactionBatch):
+            transactions.set_transaction_id(index, transaction_id)
+        else:
+            transaction.transaction_id = transaction_id
+
+
+def transaction_digest(transaction_id: str) -> bytes:
+    if transaction_id.startswith(DETERMINISTIC_ID_PREFIX):
+        return bytes.fromhex(transaction_id[len(DETERMINISTIC_ID_PREFIX):])
+    return uuid.uuid5(TRANSACTION_ID_NAMESPACE, transaction_id).bytes
+
+
+class HashSetIndex:
+    kind = 'hash'
+
+    def __init__(self):
+        self.digests = set()
+
+    def __len__(self) -> int:
+        return len(self.digests)
+
+    def add(self, digest: bytes) -> bool:
+        if digest in self.digests:
+            return False
+        self.digests.add(digest)
+        return True
+
+
+class BloomFilterIndex:
+    kind = 'bloom'
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        self.capacity = max(capacity, 1)
+        self.false_positive_rate = false_positive_rate
+        self.size = max(8, math.ceil(-self.capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, digest: bytes) -> bool:
+        # double hashing over the two halves of the 128-bit digest
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:16], 'little') | 1
+        bits = self.bits
+        size = self.size
+        present = True
+        for i in range(self.hash_count):
+            position = (first + i * second) % size
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                present = False
+                bits[position >> 3] |= mask
+        if not present:
+            self.count += 1
+        return not present
+
+
+class AdaptiveDedupIndex:
+    def __init__(self, bloom_threshold: int, capacity: int, false_positive_rate: float):
+        self.bloom_threshold = bloom_threshold
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.index = HashSetIndex()
+
+    @property
+    def kind(self) -> str:
+        return self.index.kind
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def add(self, digest: bytes) -> bool:
+        added = self.index.add(digest)
+        if added and isinstance(self.index, HashSetIndex) and len(self.index) >= self.bloom_threshold:
+            bloom = BloomFilterIndex(max(self.capacity, 2 * self.bloom_threshold), self.false_positive_rate)
+            for known in self.index.digests:
+                bloom.add(known)
+            self.index = bloom
+        return added
+
+
+def build_dedup_index(config: ProcessingConfig):
+    if config.dedup_index == 'hash':
+        return HashSetIndex()
+    if config.dedup_index == 'bloom':
+        return BloomFilterIndex(config.dedup_expected_transactions, config.dedup_false_positive_rate)
+    return AdaptiveDedupIndex(
+        config.dedup_bloom_threshold, config.dedup_expected_transactions, config.dedup_false_positive_rate
+    )
+
+
+class TransactionDeduplicator:
+    def __init__(self, mode: str, index):
+        self.mode = mode
+        self.index = index
+        self.duplicates = 0
+
+    def apply(self, file_result: FileProcessingResult) -> int:
+        transactions = file_result.successful_transactions
+        if isinstance(transactions, CompactTransactionBatch):
+            transaction_ids = transactions.iter_transaction_ids()
+        else:
+            transaction_ids = (transaction.transaction_id for transaction in transactions)
+        duplicate_indices = [
+            index for index, transaction_id in enumerate(transaction_ids)
+            if not self.index.add(transaction_digest(transaction_id))
+        ]
+        if not duplicate_indices:
+            return 0
+        self.duplicates += len(duplicate_indices)
+        file_result.processing_summary['duplicate_count'] = len(duplicate_indices)
+        if self.mode == 'drop':
+            drop_transactions(file_result, duplicate_indices)
+        else:
+            flag_transactions(file_result, duplicate_indices, DUPLICATE_FLAG)
+        return len(duplicate_indices)
+
+    def summary(self) -> Dict[str, object]:
+        return {'mode': self.mode, 'index': self.index.kind, 'indexed': len(self.index), 'duplicates': self.duplicates}
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    text = f'  {" ".join(text.lower().split())} '
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+
+def trigram_similarity(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    if not first or not second:
+        return 1.0 if first == second else 0.0
+    return 2 * len(first & second) / (len(first) + len(second))
+
+
+class FuzzyDuplicateDetector:
+    # blocking on (date, amount, currency) keeps comparisons inside small buckets, so the pass is
+    # near-linear; rows of the same table or text block are never compared with each other because
+    # repeated rows inside one statement are real transactions
+    def __init__(self, threshold: float, bucket_limit: int):
+        self.threshold = threshold
+        self.bucket_limit = bucket_limit
+        self.buckets = {}
+        self.files = 0
+        self.suspected = 0
+        self.comparisons = 0
+
+    def apply(self, file_result: FileProcessingResult) -> int:
+        transactions = file_result.successful_transactions
+        if not transactions:
+            return 0
+        self.files += 1
+        segment_starts = file_result._segment_starts or [0]
+        segment = 0
+        suspected_indices = []
+        if isinstance(transactions, CompactTransactionBatch):
+            records = (
+                (record['transaction_date'], record['amount'], record['currency'],
+                 record['description_clean'], record['data_quality_flags'])
+                for record in transactions.iter_records()
+            )
+        else:
+            records = (
+                (transaction.transaction_date, transaction.amount, transaction.currency,
+                 transaction.description_clean, transaction.data_quality_flags)
+                for transaction in transactions
+            )
+        for index, (transaction_date, amount, currency, description, flags) in enumerate(records):
+            while segment + 1 < len(segment_starts) and segment_starts[segment + 1] <= index:
+                segment += 1
+            if DUPLICATE_FLAG in flags:
+                continue
+            key = (transaction_date, round(amount * 100), currency)
+            origin = (self.files, segment)
+            grams = trigrams(description)
+            bucket = self.buckets.setdefault(key, [])
+            for candidate_origin, candidate_grams in bucket[-self.bucket_limit:]:
+                if candidate_origin == origin:
+                    continue
+                self.comparisons += 1
+                if trigram_similarity(grams, candidate_grams) >= self.threshold:
+                    suspected_indices.append(index)
+                    break
+            bucket.append((origin, grams))
+        if suspected_indices:
+            self.suspected += len(suspected_indices)
+            file_result.processing_summary['suspected_duplicate_count'] = len(suspected_indices)
+            flag_transactions(file_result, suspected_indices, SUSPECTED_DUPLICATE_FLAG)
+        return len(suspected_indices)
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            'threshold': self.threshold, 'buckets': len(self.buckets),
+            'comparisons': self.comparisons, 'suspected': self.suspected
+        }
+
+
+def flag_transactions(file_result: FileProcessingResult, indices: List[int], flag: str) -> None:
+    transactions = file_result.successful_transactions
+    for index in indices:
+        if isinstance(transactions, CompactTransactionBatch):
+            transactions.add_flag(index, flag)
+        elif flag not in transactions[index].data_quality_flags:
+            transactions[index].data_quality_flags.append(flag)
+    flags = file_result.statistics.quality_flags_distribution
+    flags[flag] = flags.get(flag, 0) + len(indices)
+
+
+def drop_transactions(file_result: FileProcessingResult, indices: List[int]) -> None:
+    transactions = file_result.successful_transactions
+    dropped = set(indices)
+    kept = CompactTransactionBatch() if isinstance(transactions, CompactTransactionBatch) else []
+    for index, transaction in enumerate(transactions):
+        if index not in dropped:
+            kept.append(transaction)
+    file_result.successful_transactions = kept
+    file_result._segment_starts = [
+        start - bisect.bisect_left(indices, start) for start in file_result._segment_starts
+    ]
+    # dropped duplicates leave every count, so successful + failed still adds up to total
+    summary = file_result.processing_summary
+    total = max(summary.get('total_transactions', 0) - len(dropped), 0)
+    summary['total_transactions'] = total
+    summary['successful_count'] = len(kept)
+    summary['success_rate'] = len(kept) / total * 100 if total else 0
+    statistics = ProcessingStatistics()
+    statistics.add_file(file_result.source_type, total)
+    statistics.add_transactions(kept)
+    file_result.statistics = statistics
+
+
+def build_deduplicator(config: ProcessingConfig) -> Optional[TransactionDeduplicator]:
+    if config.deduplicate == 'off':
+        return None
+    return TransactionDeduplicator(config.deduplicate, build_dedup_index(config))
+
+
+def build_fuzzy_detector(config: ProcessingConfig) -> Optional[FuzzyDuplicateDetector]:
+    if not config.fuzzy_deduplicate:
+        return None
+    return FuzzyDuplicateDetector(config.fuzzy_similarity_threshold, config.fuzzy_bucket_limit)
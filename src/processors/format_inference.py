@@ -0,0 +1,97 @@
+import re
+from collections import Counter
+from typing import List, Dict, Any, Optional, Mapping, Sequence
+from src.models.parser_models import TableFormatProfile
+from src.models.table_models import TableRow
+from src.processors.amount_processor import AmountProcessor
+from src.utils.date_tokenizer import DateTokenizer
+from src.utils.constants import (
+    DATE_FORMATS, FORMAT_INFERENCE_SAMPLE_SIZE, FORMAT_INFERENCE_MIN_SHARE
+)
+
+AMOUNT_COLUMNS = ('debit', 'credit', 'amount')
+
+
+class TableFormatInferrer:
+    def __init__(self, sample_size: int = FORMAT_INFERENCE_SAMPLE_SIZE,
+                 min_share: float = FORMAT_INFERENCE_MIN_SHARE,
+                 amount_processor: Optional[AmountProcessor] = None):
+        self.sample_size = sample_size
+        self.min_share = min_share
+        self.amount_processor = amount_processor or AmountProcessor()
+        self.date_tokenizer = DateTokenizer(DATE_FORMATS)
+        self.non_numeric = re.compile(r'[^\d.,\-]')
+        self.thousands_groups = re.compile(r'^-?\d{1,3}(?:([.,])\d{3})+$')
+
+    def infer(self, table: Sequence[Mapping[str, Any]]) -> TableFormatProfile:
+        sample = [row for row in table[:self.sample_size] if isinstance(row, (dict, TableRow))]
+        decimal_separator = self._infer_decimal_separator(sample)
+        thousands_separator = None
+        if decimal_separator:
+            thousands_separator = ',' if decimal_separator == '.' else '.'
+        return TableFormatProfile(
+            date_format=self._infer_date_format(sample),
+            decimal_separator=decimal_separator,
+            thousands_separator=thousands_separator,
+            default_currency=self._infer_default_currency(sample),
+            sample_size=len(sample)
+        )
+
+    def _infer_date_format(self, sample: List[Dict[str, Any]]) -> Optional[str]:
+        values = [
+            row['transaction_date'].strip() for row in sample
+            if isinstance(row.get('transaction_date'), str) and row['transaction_date'].strip()
+        ]
+        if not values:
+            return None
+        votes = Counter()
+        for value in values:
+            date_format = self.date_tokenizer.detect_format(value)
+            if date_format is not None:
+                votes[date_format] += 1
+        return self._winner(votes, len(values))
+
+    def _infer_decimal_separator(self, sample: List[Dict[str, Any]]) -> Optional[str]:
+        votes = Counter()
+        for row in sample:
+            for column in AMOUNT_COLUMNS:
+                value = row.get(column)
+                if not isinstance(value, str):
+                    continue
+                separator = self._decimal_evidence(self.non_numeric.sub('', value))
+                if separator:
+                    votes[separator] += 1
+        return self._winner(votes, sum(votes.values()))
+
+    def _decimal_evidence(self, cleaned: str) -> Optional[str]:
+        last_comma = cleaned.rfind(',')
+        last_dot = cleaned.rfind('.')
+        if last_comma >= 0 and last_dot >= 0:
+            return ',' if last_comma > last_dot else '.'
+        grouped = self.thousands_groups.match(cleaned)
+        if grouped and cleaned.count(grouped.group(1)) > 1:
+            return '.' if grouped.group(1) == ',' else ','
+        separator = ',' if last_comma >= 0 else '.' if last_dot >= 0 else None
+        if separator and cleaned.count(separator) == 1 and len(cleaned) - cleaned.rfind(separator) - 1 <= 2:
+            return separator
+        return None
+
+    def _infer_default_currency(self, sample: List[Dict[str, Any]]) -> Optional[str]:
+        votes = Counter()
+        for row in sample:
+            currency = row.get('currency')
+            if not isinstance(currency, str) or not currency.strip():
+                continue
+            # same resolution as AmountProcessor.standardize_currency, so configured aliases count too
+            code = self.amount_processor.resolve_currency_code(currency)
+            if code is None:
+                code = self.amount_processor.keyword_automaton.first(currency, 'currency')
+            if code:
+                votes[code] += 1
+        return self._winner(votes, sum(votes.values()))
+
+    def _winner(self, votes: Counter, total: int) -> Optional[str]:
+        if not votes:
+            return None
+        value, count = votes.most_common(1)[0]
+        return value if count >= total * self.min_share else None
@@ -1,57 +1,147 @@
+import os
+import threading
 import uuid
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable, Iterable, IO, TYPE_CHECKING
 from src.models.transaction_models import (
     RawTransactionInput, 
     StandardizedTransaction, 
     ProcessingResult,
-    TransactionType
+    TransactionType,
+    CompactTransactionBatch,
+    TransactionList
 )
+from src.models.statistics_models import ProcessingStatistics
 from src.models.parser_models import (
     ParsedFileResult, FileProcessingResult, 
-    BatchProcessingResult, TransactionExtractionConfig
+    BatchProcessingResult, TransactionExtractionConfig, ProcessingConfig,
+    TableFormatProfile
 )
+from src.models.table_models import ColumnarTable, TableRow, original_row
 from src.processors.date_processor import DateProcessor
 from src.processors.amount_processor import AmountProcessor
 from src.processors.text_processor import TextProcessor
 from src.processors.text_extractor import TextTransactionExtractor
+from src.processors.format_inference import TableFormatInferrer
+from src.processors.batch_accumulator import BatchResultAccumulator
+from src.processors.parallel import ParallelBatchProcessor
+from src.processors.validation import validate_raw_transaction, validation_failure
+from src.processors.deduplication import (
+    assign_deterministic_ids, build_deduplicator, build_fuzzy_detector
+)
+from src.utils.cache import LRUCache
+from src.utils.metrics import MetricsRecorder, NULL_METRICS, diff_snapshots
+from src.utils.profiler import SlowInputProfiler
+from src.utils.json_stream import iter_json_documents
+from src.utils.result_cache import ResultCache, content_key
+
+if TYPE_CHECKING:
+    import cProfile
+    from src.processors.columnar_processor import ColumnarBatchProcessor
+
+
+# settings that change how a file is processed, not what the result is
+RESULT_CACHE_IGNORED_FIELDS = {
+    'cache_size', 'workers', 'parallel_chunk_size', 'parallel_min_files', 'collect_metrics',
+    'profile_slow_inputs', 'profile_top_n', 'profile_threshold_seconds', 'profile_output_dir',
+    'result_cache_size', 'result_cache_path', 'result_cache_max_bytes'
+}
 
 
 class DataStandardizationService:
-    def __init__(self, extraction_config: Optional[TransactionExtractionConfig] = None):
-        self.date_processor = DateProcessor()
-        self.amount_processor = AmountProcessor()
-        self.text_processor = TextProcessor()
-        self.text_extractor = TextTransactionExtractor(extraction_config)
+    def __init__(self, extraction_config: Optional[TransactionExtractionConfig] = None,
+                 processing_config: Optional[ProcessingConfig] = None):
+        self.processing_config = processing_config or ProcessingConfig()
+        config = self.processing_config
+        self.metrics = MetricsRecorder() if config.collect_metrics or config.profile_slow_inputs else NULL_METRICS
+        self.profiler = SlowInputProfiler(
+            config.profile_top_n, config.profile_threshold_seconds, config.profile_output_dir
+        ) if config.profile_slow_inputs else None
+        self._profiling_context = threading.local()
+        self.cache = LRUCache(self.processing_config.cache_size)
+        self.text_extractor = TextTransactionExtractor(extraction_config, self.metrics)
+        self.result_cache = None
+        if config.result_cache_size or config.result_cache_path:
+            self.result_cache = ResultCache(
+                config.result_cache_size, config.result_cache_path, config.result_cache_max_bytes
+            )
+        self._result_cache_namespace = content_key(
+            self.text_extractor.config.model_dump_json(),
+            config.model_dump_json(exclude=RESULT_CACHE_IGNORED_FIELDS)
+        )
+        self.date_processor = DateProcessor(self.cache, self.metrics)
+        self.amount_processor = AmountProcessor(
+            self.cache, self.text_extractor.keyword_automaton, self.text_extractor.config.currency_aliases
+        )
+        self.text_processor = TextProcessor(self.cache)
+        self._columnar_processor = None
+        self.format_inferrer = TableFormatInferrer(
+            self.processing_config.inference_sample_size, amount_processor=self.amount_processor
+        )
+        self.parallel_processor = ParallelBatchProcessor(self.text_extractor.config, self.processing_config)
+    
+    @property
+    def columnar_processor(self) -> 'ColumnarBatchProcessor':
+        # pandas and numpy are imported only when the columnar engine is actually used
+        if self._columnar_processor is None:
+            from src.processors.columnar_processor import ColumnarBatchProcessor
+            self._columnar_processor = ColumnarBatchProcessor(
+                self.date_processor, self.amount_processor, self.text_processor
+            )
+        return self._columnar_processor
     
-    def process_transaction(self, raw_data: Dict[str, Any]) -> StandardizedTransaction:
+    def process_transaction(self, raw_data: Dict[str, Any],
+                            format_profile: Optional[TableFormatProfile] = None) -> StandardizedTransaction:
+        return self._process_transaction(raw_data, format_profile, self.metrics)
+    
+    def _process_transaction(self, raw_data: Dict[str, Any], format_profile: Optional[TableFormatProfile],
+                             metrics: MetricsRecorder,
+                             raw_transaction: Optional[RawTransactionInput] = None) -> StandardizedTransaction:
+        timed = metrics.enabled
+        if timed:
+            started = metrics.clock()
+        profile = format_profile or TableFormatProfile()
         quality_flags = []
-        try:
-            raw_transaction = RawTransactionInput(**raw_data)
-        except Exception as e:
-            raise ValueError(f"Неверный формат входных данных: {e}")
+        if raw_transaction is None:
+            try:
+                if isinstance(raw_data, TableRow):
+                    raw_transaction = RawTransactionInput.model_validate(raw_data)
+                else:
+                    raw_transaction = RawTransactionInput(**raw_data)
+            except Exception as e:
+                raise ValueError(f"Неверный формат входных данных: {e}")
+        if timed:
+            started = metrics.lap('validation', started)
         transaction_id = f"gen_uuid_{uuid.uuid4().hex[:8]}"
         standardized_date, date_flags = self.date_processor.standardize_date(
-            raw_transaction.transaction_date
+            raw_transaction.transaction_date, profile.date_format
         )
         quality_flags.extend(date_flags)
+        if timed:
+            started = metrics.lap('date', started)
         description_raw, description_clean, text_flags = self.text_processor.clean_description(
             raw_transaction.description
         )
         quality_flags.extend(text_flags)
+        if timed:
+            started = metrics.lap('description', started)
         if raw_transaction.amount is not None:
             amount, transaction_type, amount_flags = self.amount_processor.process_single_amount_format(
-                raw_transaction.amount
+                raw_transaction.amount, profile.decimal_separator
             )
         else:
             amount, transaction_type, amount_flags = self.amount_processor.process_debit_credit_format(
-                raw_transaction.debit, raw_transaction.credit
+                raw_transaction.debit, raw_transaction.credit, profile.decimal_separator
             )
         quality_flags.extend(amount_flags)
+        if timed:
+            started = metrics.lap('amount', started)
         currency_source = raw_transaction.currency or str(raw_transaction.debit or raw_transaction.credit or raw_transaction.amount or "")
         currency, currency_flags = self.amount_processor.standardize_currency(
-            raw_transaction.currency, currency_source
+            raw_transaction.currency, currency_source, profile.default_currency or 'KZT'
         )
         quality_flags.extend(currency_flags)
+        if timed:
+            started = metrics.lap('currency', started)
         standardized_transaction = StandardizedTransaction(
             transaction_id=transaction_id,
             transaction_date=standardized_date,
@@ -63,35 +153,149 @@ class DataStandardizationService:
             source_account="Unknown",
             data_quality_flags=list(set(quality_flags))
         )
+        if timed:
+            metrics.lap('model', started)
         return standardized_transaction
     
-    def process_batch(self, raw_transactions: List[Dict[str, Any]]) -> ProcessingResult:
-        successful_transactions = []
+    def process_batch(self, raw_transactions: List[Dict[str, Any]],
+                      format_profile: Optional[TableFormatProfile] = None) -> ProcessingResult:
+        started = self.metrics.clock()
+        if self.processing_config.engine == "columnar":
+            successful_transactions, failed_transactions = self.columnar_processor.process_rows(
+                raw_transactions, self.process_transaction, format_profile, self._new_transaction_list(),
+                self.processing_config.validation_mode == "codes"
+            )
+        else:
+            successful_transactions, failed_transactions = self._process_rows(raw_transactions, format_profile)
+        if self.processing_config.deterministic_ids or self.processing_config.deduplicate != "off":
+            assign_deterministic_ids(successful_transactions)
+        if self.metrics.enabled:
+            self.metrics.observe(f'{self.processing_config.engine}_batch', started)
+            self.metrics.increment('rows_processed', len(raw_transactions))
+            if failed_transactions:
+                self.metrics.increment('rows_failed', len(failed_transactions))
+        return self._build_processing_result(len(raw_transactions), successful_transactions, failed_transactions)
+    
+    def _new_transaction_list(self) -> TransactionList:
+        return CompactTransactionBatch() if self.processing_config.compact_results else []
+    
+    def _build_processing_result(self, total: int, successful_transactions: TransactionList,
+                                 failed_transactions: List[Dict[str, Any]]) -> ProcessingResult:
+        processing_summary = {
+            'total_transactions': total,
+            'successful_count': len(successful_transactions),
+            'failed_count': len(failed_transactions),
+            'success_rate': len(successful_transactions) / total * 100 if total else 0
+        }
+        return ProcessingResult(
+            successful_transactions=successful_transactions,
+            failed_transactions=failed_transactions,
+            processing_summary=processing_summary
+        )
+    
+    def _process_rows(self, raw_transactions: List[Dict[str, Any]],
+                      format_profile: Optional[TableFormatProfile] = None) -> Tuple[TransactionList, List]:
+        successful_transactions = self._new_transaction_list()
         failed_transactions = []
+        validate_codes = self.processing_config.validation_mode == "codes"
+        raw_transaction = None
         for i, raw_data in enumerate(raw_transactions):
+            if validate_codes:
+                raw_transaction, error_code, error_field = validate_raw_transaction(raw_data)
+                if error_code is not None:
+                    failed_transactions.append(validation_failure(i, raw_data, error_code, error_field))
+                    continue
             try:
-                standardized = self.process_transaction(raw_data)
+                if self.profiler is None:
+                    standardized = self._process_transaction(raw_data, format_profile, self.metrics, raw_transaction)
+                else:
+                    standardized = self._process_profiled_row(i, raw_data, format_profile, raw_transaction)
                 successful_transactions.append(standardized)
             except Exception as e:
                 failed_transactions.append({
                     'index': i,
-                    'original_data': raw_data,
+                    'original_data': original_row(raw_data),
                     'error': str(e),
                     'error_type': type(e).__name__
                 })
-        processing_summary = {
-            'total_transactions': len(raw_transactions),
-            'successful_count': len(successful_transactions),
-            'failed_count': len(failed_transactions),
-            'success_rate': len(successful_transactions) / len(raw_transactions) * 100 if raw_transactions else 0
+        return successful_transactions, failed_transactions
+    
+    def _process_profiled_row(self, index: int, raw_data: Any, format_profile: Optional[TableFormatProfile],
+                              raw_transaction: Optional[RawTransactionInput] = None) -> StandardizedTransaction:
+        row_metrics = MetricsRecorder()
+        started = row_metrics.clock()
+        try:
+            return self._process_transaction(raw_data, format_profile, row_metrics, raw_transaction)
+        finally:
+            seconds = row_metrics.clock() - started
+            snapshot = row_metrics.snapshot()
+            self.metrics.merge(snapshot)
+            if self.profiler.is_slow_row(seconds):
+                context = self._profiling_context
+                self.profiler.record_row(seconds, {
+                    'filename': getattr(context, 'filename', None),
+                    'index': getattr(context, 'offset', 0) + index,
+                    'input_size': sum(len(str(value)) for value in raw_data.values())
+                    if isinstance(raw_data, (dict, TableRow)) else len(str(raw_data)),
+                    'stages': {stage: totals['seconds'] for stage, totals in snapshot['stages'].items()}
+                })
+    
+    def process_parsed_file(self, parsed_file: ParsedFileResult) -> FileProcessingResult:
+        if not self.metrics.enabled:
+            return self._process_cached_file(parsed_file)
+        profile = None
+        if self.profiler is not None:
+            self._profiling_context.filename = parsed_file.filename
+            self._profiling_context.offset = 0
+            profile = self.profiler.new_profile()
+        before = self.metrics.snapshot()
+        started = self.metrics.clock()
+        try:
+            if profile is not None:
+                profile.enable()
+            file_result = self._process_cached_file(parsed_file)
+        finally:
+            if profile is not None:
+                profile.disable()
+            self._profiling_context.filename = None
+        self.metrics.observe('file', started)
+        file_metrics = diff_snapshots(self.metrics.snapshot(), before)
+        file_result.processing_summary['metrics'] = file_metrics
+        if self.profiler is not None:
+            self._record_slow_file(parsed_file, file_result, file_metrics, profile)
+        return file_result
+    
+    def _record_slow_file(self, parsed_file: ParsedFileResult, file_result: FileProcessingResult,
+                          file_metrics: Dict[str, Any], profile: Optional['cProfile.Profile'] = None) -> None:
+        stages = {stage: totals['seconds'] for stage, totals in file_metrics['stages'].items()}
+        seconds = stages.pop('file', 0.0)
+        record = {
+            'filename': parsed_file.filename,
+            'source_type': file_result.source_type,
+            'tables': len(parsed_file.extracted_tables),
+            'table_rows': sum(len(table) for table in parsed_file.extracted_tables),
+            'text_length': len(parsed_file.extracted_text),
+            'stages': stages
         }
-        return ProcessingResult(
-            successful_transactions=successful_transactions,
-            failed_transactions=failed_transactions,
-            processing_summary=processing_summary
+        if profile is not None and self.profiler.should_profile(seconds):
+            record['profile_path'] = self.profiler.write_profile(
+                parsed_file.filename, profile, parsed_file.model_dump_json()
+            )
+        self.profiler.record_file(seconds, record)
+    
+    def result_cache_key(self, parsed_file: ParsedFileResult) -> str:
+        return content_key(self._result_cache_namespace, parsed_file.model_dump_json())
+    
+    def _process_cached_file(self, parsed_file: ParsedFileResult) -> FileProcessingResult:
+        if self.result_cache is None:
+            return self._process_parsed_file(parsed_file)
+        # results with dates taken from today are valid only today, so they are never stored
+        return self.result_cache.get_or_compute(
+            self.result_cache_key(parsed_file), lambda: self._process_parsed_file(parsed_file),
+            lambda file_result: not file_result._today_dependent
         )
     
-    def process_parsed_file(self, parsed_file: ParsedFileResult) -> FileProcessingResult:
+    def _process_parsed_file(self, parsed_file: ParsedFileResult) -> FileProcessingResult:
         if parsed_file.error:
             return FileProcessingResult(
                 filename=parsed_file.filename,
@@ -104,22 +308,33 @@ class DataStandardizationService:
                     'failed_count': 0,
                     'success_rate': 0
                 },
-                original_error=parsed_file.error
+                original_error=parsed_file.error,
+                statistics=self._build_file_statistics("error", 0)
             )
-        all_raw_transactions = []
         source_type = "unknown"
+        batches = []
         if parsed_file.extracted_tables:
             source_type = "table"
             for table in parsed_file.extracted_tables:
-                all_raw_transactions.extend(table)
+                if isinstance(table, ColumnarTable):
+                    table = table.row_view()
+                profile = None
+                if self.processing_config.infer_table_formats and table:
+                    started = self.metrics.clock()
+                    profile = self.format_inferrer.infer(table)
+                    self.metrics.observe('format_inference', started)
+                batches.append((table, profile))
         if parsed_file.extracted_text:
+            started = self.metrics.clock()
             text_transactions = self.text_extractor.extract_transactions_from_text(
                 parsed_file.extracted_text
             )
+            self.metrics.observe('text_extraction', started)
             if text_transactions:
-                all_raw_transactions.extend(text_transactions)
+                batches.append((text_transactions, None))
                 source_type = "text" if source_type == "unknown" else "mixed"
-        if not all_raw_transactions:
+        total_transactions = sum(len(raw_transactions) for raw_transactions, _ in batches)
+        if not total_transactions:
             return FileProcessingResult(
                 filename=parsed_file.filename,
                 source_type=source_type,
@@ -131,112 +346,149 @@ class DataStandardizationService:
                     'failed_count': 0,
                     'success_rate': 0,
                     'warning': 'No transactions found in file'
-                }
+                },
+                statistics=self._build_file_statistics(source_type, 0)
             )
-        result = self.process_batch(all_raw_transactions)
-        return FileProcessingResult(
+        successful_transactions = self._new_transaction_list()
+        failed_transactions = []
+        format_profiles = []
+        statistics = self._build_file_statistics(source_type, total_transactions)
+        segment_starts = []
+        offset = 0
+        self.date_processor.reset_today_dependent()
+        for raw_transactions, profile in batches:
+            if self.profiler is not None:
+                self._profiling_context.offset = offset
+            result = self.process_batch(raw_transactions, profile)
+            segment_starts.append(len(successful_transactions))
+            successful_transactions.extend(result.successful_transactions)
+            statistics.add_transactions(result.successful_transactions)
+            for failed in result.failed_transactions:
+                failed['index'] += offset
+                failed_transactions.append(failed)
+            if profile is not None:
+                format_profiles.append(profile.model_dump())
+            offset += len(raw_transactions)
+        result = self._build_processing_result(total_transactions, successful_transactions, failed_transactions)
+        if format_profiles:
+            result.processing_summary['format_profiles'] = format_profiles
+        file_result = FileProcessingResult(
             filename=parsed_file.filename,
             source_type=source_type,
             successful_transactions=result.successful_transactions,
             failed_transactions=result.failed_transactions,
-            processing_summary=result.processing_summary
+            processing_summary=result.processing_summary,
+            statistics=statistics
         )
+        file_result._segment_starts = segment_starts
+        file_result._today_dependent = self.date_processor.today_dependent()
+        return file_result
     
-    def process_parsed_batch(self, parsed_batch: List[ParsedFileResult]) -> BatchProcessingResult:
-        file_results = []
-        total_transactions = 0
-        successful_transactions = 0
-        successful_files = 0
-        failed_files = 0
-        for parsed_file in parsed_batch:
-            file_result = self.process_parsed_file(parsed_file)
-            file_results.append(file_result)
-            file_total = file_result.processing_summary.get('total_transactions', 0)
-            file_successful = file_result.processing_summary.get('successful_count', 0)
-            total_transactions += file_total
-            successful_transactions += file_successful
-            if file_result.original_error:
-                failed_files += 1
-            else:
-                successful_files += 1
-        processing_summary = {
-            'total_files': len(parsed_batch),
-            'successful_files': successful_files,
-            'failed_files': failed_files,
-            'total_transactions': total_transactions,
-            'successful_transactions': successful_transactions,
-            'file_success_rate': (successful_files / len(parsed_batch) * 100) if parsed_batch else 0,
-            'transaction_success_rate': (successful_transactions / total_transactions * 100) if total_transactions else 0,
-            'source_type_distribution': self._get_source_type_distribution(file_results)
-        }
-        return BatchProcessingResult(
-            total_files=len(parsed_batch),
-            successful_files=successful_files,
-            failed_files=failed_files,
-            total_transactions=total_transactions,
-            successful_transactions=successful_transactions,
-            file_results=file_results,
-            processing_summary=processing_summary
+    def _build_file_statistics(self, source_type: str, total_transactions: int) -> ProcessingStatistics:
+        statistics = ProcessingStatistics()
+        statistics.add_file(source_type, total_transactions)
+        return statistics
+    
+    def new_accumulator(self, keep_results: bool = True) -> BatchResultAccumulator:
+        return BatchResultAccumulator(
+            keep_results, build_deduplicator(self.processing_config), build_fuzzy_detector(self.processing_config),
+            self.result_cache
         )
     
+    def process_parsed_batch(self, parsed_batch: List[ParsedFileResult]) -> BatchProcessingResult:
+        accumulator = self.new_accumulator()
+        if self.parallel_processor.should_parallelize(len(parsed_batch)):
+            for parsed_file, file_result in self._iter_parallel_results(parsed_batch):
+                if 'metrics' in file_result.processing_summary:
+                    self.metrics.merge(file_result.processing_summary['metrics'])
+                    if self.profiler is not None:
+                        self._record_slow_file(parsed_file, file_result, file_result.processing_summary['metrics'])
+                accumulator.add(file_result)
+        else:
+            for parsed_file in parsed_batch:
+                accumulator.add(self.process_parsed_file(parsed_file))
+        return accumulator.build()
+    
+    def _iter_parallel_results(self, parsed_batch: List[ParsedFileResult]
+                               ) -> Iterable[Tuple[ParsedFileResult, FileProcessingResult]]:
+        if self.result_cache is None:
+            yield from zip(parsed_batch, self.parallel_processor.iter_results(parsed_batch))
+            return
+        # workers run without a result cache; hits are served here and only misses are sent out
+        keys = [self.result_cache_key(parsed_file) for parsed_file in parsed_batch]
+        cached = [self.result_cache.get(key) for key in keys]
+        pending = [parsed_file for parsed_file, file_result in zip(parsed_batch, cached) if file_result is None]
+        computed = iter(self.parallel_processor.iter_results(pending) if pending else ())
+        for parsed_file, key, file_result in zip(parsed_batch, keys, cached):
+            if file_result is None:
+                file_result = next(computed)
+                # metrics describe this run only; a later hit must not replay them, same as the serial path
+                metrics = file_result.processing_summary.pop('metrics', None)
+                if not file_result._today_dependent:
+                    self.result_cache.store(key, file_result)
+                if metrics is not None:
+                    file_result.processing_summary['metrics'] = metrics
+            elif self.metrics.enabled:
+                file_result.processing_summary['metrics'] = MetricsRecorder().snapshot()
+            yield parsed_file, file_result
+    
     def process_json_input(self, json_data: List[Dict[str, Any]]) -> BatchProcessingResult:
-        parsed_files = []
-        for file_data in json_data:
-            try:
-                parsed_file = ParsedFileResult(**file_data)
-                parsed_files.append(parsed_file)
-            except Exception as e:
-                parsed_files.append(ParsedFileResult(
-                    filename=file_data.get('filename', 'unknown'),
-                    extracted_tables=[],
-                    extracted_text="",
-                    error=f"Invalid input format: {e}"
-                ))
-        return self.process_parsed_batch(parsed_files)
-    
-    def _get_source_type_distribution(self, file_results: List[FileProcessingResult]) -> Dict[str, int]:
-        distribution = {}
-        for result in file_results:
-            source_type = result.source_type
-            distribution[source_type] = distribution.get(source_type, 0) + 1
-        return distribution
+        return self.process_parsed_batch([self._parse_file_input(file_data) for file_data in json_data])
     
-    def get_processing_statistics(self, batch_result: BatchProcessingResult) -> Dict[str, Any]:
-        quality_flags_distribution = {}
-        transaction_types_distribution = {'DEBIT': 0, 'CREDIT': 0}
-        currency_distribution = {}
-        for file_result in batch_result.file_results:
-            for transaction in file_result.successful_transactions:
-                for flag in transaction.data_quality_flags:
-                    quality_flags_distribution[flag] = quality_flags_distribution.get(flag, 0) + 1
-                transaction_types_distribution[transaction.transaction_type.value] += 1
-                currency = transaction.currency
-                currency_distribution[currency] = currency_distribution.get(currency, 0) + 1
-        return {
-            'quality_flags_distribution': quality_flags_distribution,
-            'transaction_types_distribution': transaction_types_distribution,
-            'currency_distribution': currency_distribution,
-            'average_transactions_per_file': (
-                batch_result.total_transactions / batch_result.total_files 
-                if batch_result.total_files > 0 else 0
-            ),
-            'files_with_text_extraction': sum(
-                1 for result in batch_result.file_results 
-                if result.source_type in ['text', 'mixed']
-            ),
-            'files_with_table_data': sum(
-                1 for result in batch_result.file_results 
-                if result.source_type in ['table', 'mixed']
+    def process_json_stream(self, source: Union[str, os.PathLike, IO],
+                            on_file_result: Optional[Callable[[FileProcessingResult], None]] = None,
+                            keep_results: bool = False) -> BatchProcessingResult:
+        return self.process_json_documents(iter_json_documents(source), on_file_result, keep_results)
+    
+    def process_json_documents(self, documents: Iterable[Dict[str, Any]],
+                               on_file_result: Optional[Callable[[FileProcessingResult], None]] = None,
+                               keep_results: bool = False) -> BatchProcessingResult:
+        accumulator = self.new_accumulator(keep_results)
+        for file_data in documents:
+            file_result = self.process_parsed_file(self._parse_file_input(file_data))
+            accumulator.add(file_result)
+            if on_file_result is not None:
+                on_file_result(file_result)
+        return accumulator.build()
+    
+    def _parse_file_input(self, file_data: Any) -> ParsedFileResult:
+        try:
+            return ParsedFileResult(**file_data)
+        except Exception as e:
+            return ParsedFileResult(
+                filename=file_data.get('filename', 'unknown') if isinstance(file_data, dict) else 'unknown',
+                extracted_tables=[],
+                extracted_text="",
+                error=f"Invalid input format: {e}"
             )
-        }
+    
+    def get_processing_statistics(self, batch_result: BatchProcessingResult) -> Dict[str, Any]:
+        statistics = batch_result.statistics
+        if statistics.total_files != batch_result.total_files:
+            statistics = BatchResultAccumulator.collect_statistics(batch_result.file_results)
+        return statistics.to_report()
     
     def get_health_check(self) -> Dict[str, Any]:
         return {
             'status': 'healthy',
             'version': '1.0.0',
+            'engine': self.processing_config.engine,
+            'workers': self.parallel_processor.workers,
             'processors': {
                 'date_processor': 'ready',
                 'amount_processor': 'ready',
                 'text_processor': 'ready'
-            }
+            },
+            'cache': self.cache.stats(),
+            'metrics_enabled': self.metrics.enabled,
+            'result_cache': self.result_cache.stats() if self.result_cache is not None else None
         }
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        return self.metrics.snapshot()
+    
+    def get_prometheus_metrics(self) -> str:
+        return self.metrics.to_prometheus()
+    
+    def get_slow_inputs(self) -> Dict[str, Any]:
+        return self.profiler.report() if self.profiler is not None else {}
@@ -0,0 +1,61 @@
+import os
+import weakref
+from typing import List, Iterator, Optional, TYPE_CHECKING
+from src.models.parser_models import (
+    ParsedFileResult, FileProcessingResult, TransactionExtractionConfig, ProcessingConfig
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+_worker_service = None
+_worker_executors = weakref.WeakSet()
+
+
+def _init_worker(extraction_config: Optional[TransactionExtractionConfig],
+                 processing_config: ProcessingConfig) -> None:
+    global _worker_service
+    from src.processors.main_processor import DataStandardizationService
+    # slow inputs and cached results are handled by the parent from the returned file results
+    _worker_service = DataStandardizationService(extraction_config, processing_config.model_copy(update={
+        'workers': 1,
+        'profile_slow_inputs': False,
+        'result_cache_size': 0,
+        'result_cache_path': None,
+        'collect_metrics': processing_config.collect_metrics or processing_config.profile_slow_inputs
+    }))
+
+
+def _process_parsed_file(parsed_file: ParsedFileResult) -> FileProcessingResult:
+    return _worker_service.process_parsed_file(parsed_file)
+
+
+def is_worker_executor(executor: object) -> bool:
+    return executor in _worker_executors
+
+
+class ParallelBatchProcessor:
+    def __init__(self, extraction_config: Optional[TransactionExtractionConfig],
+                 processing_config: ProcessingConfig):
+        self.extraction_config = extraction_config
+        self.processing_config = processing_config
+        self.workers = processing_config.workers or os.cpu_count() or 1
+
+    def should_parallelize(self, file_count: int) -> bool:
+        return self.workers > 1 and file_count >= self.processing_config.parallel_min_files
+
+    def create_executor(self, max_workers: Optional[int] = None) -> 'ProcessPoolExecutor':
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers or self.workers,
+            initializer=_init_worker,
+            initargs=(self.extraction_config, self.processing_config)
+        )
+        _worker_executors.add(executor)
+        return executor
+
+    def iter_results(self, parsed_files: List[ParsedFileResult]) -> Iterator[FileProcessingResult]:
+        with self.create_executor(min(self.workers, len(parsed_files))) as executor:
+            yield from executor.map(
+                _process_parsed_file, parsed_files, chunksize=self.processing_config.parallel_chunk_size
+            )
@@ -1,138 +1,127 @@
 import re
-from typing import List, Dict, Any, Optional
+from collections import deque
+from itertools import islice
+from typing import List, Dict, Any, Optional, Iterator, Deque
 from src.models.parser_models import TransactionExtractionConfig
-from src.utils.constants import CURRENCY_MAPPING
+from src.processors.text_scanner import TextTokenScanner, ScannedLine, TextToken, first_token
+from src.utils.keyword_automaton import build_keyword_automaton
+from src.utils.line_stream import TextSource, iter_text_lines
+from src.utils.metrics import MetricsRecorder, NULL_METRICS
+
+CONTEXT_RADIUS = 2
 
 
 class TextTransactionExtractor:
-    def __init__(self, config: Optional[TransactionExtractionConfig] = None):
+    def __init__(self, config: Optional[TransactionExtractionConfig] = None,
+                 metrics: MetricsRecorder = NULL_METRICS):
         self.config = config or TransactionExtractionConfig()
-        self.date_patterns = [
-            r'\b\d{1,2}[./\-]\d{1,2}[./\-]\d{2,4}\b',
-            r'\b\d{4}[./\-]\d{1,2}[./\-]\d{1,2}\b',
-            r'\b\d{1,2}\s+(января|февраля|марта|апреля|мая|июня|июля|августа|сентября|октября|ноября|декабря)\s+\d{4}\b'
-        ]
-        self.amount_patterns = [
-            r'\b\d{1,3}(?:\s?\d{3})*(?:[.,]\d{1,2})?\s*(?:₸|тг|тенге|KZT|USD|EUR|RUB|\$|€|₽|руб)\b',
-            r'\b\d{1,3}(?:[,\s]\d{3})*(?:[.,]\d{1,2})?\b'
-        ]
-        self.debit_keywords = [
-            'оплата', 'покупка', 'расход', 'списание', 'перевод', 'платеж',
-            'оплачено', 'потрачено', 'снято', 'дебет', 'трата'
-        ]
-        self.credit_keywords = [
-            'поступление', 'доход', 'зачисление', 'получено', 'кредит',
-            'зарплата', 'возврат', 'пополнение', 'приход'
-        ]
+        self.metrics = metrics
+        self.debit_keywords = self.config.debit_keywords
+        self.credit_keywords = self.config.credit_keywords
+        self.keyword_automaton = build_keyword_automaton(
+            self.debit_keywords, self.credit_keywords, self.config.currency_aliases
+        )
+        self.scanner = TextTokenScanner(self.keyword_automaton, self.config.currency_aliases)
+        self.whitespace = re.compile(r'\s+')
 
     def extract_transactions_from_text(self, text: str) -> List[Dict[str, Any]]:
-        if not text or not self.config.extract_from_text:
+        if not text:
             return []
-        transactions = []
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-            dates = self._extract_dates(line)
-            amounts = self._extract_amounts(line)
-            if dates and amounts:
-                transaction = self._build_transaction_from_line(line, dates[0], amounts[0])
-                if transaction:
-                    transactions.append(transaction)
-            elif dates:
-                context_lines = self._get_context_lines(lines, i, 2)
-                context_amounts = self._extract_amounts(' '.join(context_lines))
-                if context_amounts:
-                    transaction = self._build_transaction_from_context(context_lines, dates[0], context_amounts[0])
-                    if transaction:
-                        transactions.append(transaction)
-        return self._deduplicate_transactions(transactions)
-
-    def _extract_dates(self, text: str) -> List[str]:
-        dates = []
-        for pattern in self.date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            dates.extend(matches)
-        return dates
+        return list(self.iter_transactions(text))
 
-    def _extract_amounts(self, text: str) -> List[str]:
-        amounts = []
-        for pattern in self.amount_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            amounts.extend(matches)
-        return amounts
+    def iter_transactions(self, source: TextSource) -> Iterator[Dict[str, Any]]:
+        # every line is scanned once; a date-only line waits until CONTEXT_RADIUS lines after it are
+        # scanned, so transactions are yielded in line order while only the window stays in memory
+        if not self.config.extract_from_text:
+            return
+        window = deque()
+        window_start = 0
+        next_line = 0
+        seen = set()
+        lines_scanned = 0
+        extracted = 0
+        scan = self.scanner.scan
+        try:
+            for text_line in iter_text_lines(source):
+                window.append(scan(text_line))
+                lines_scanned += 1
+                if lines_scanned - 1 - next_line < CONTEXT_RADIUS:
+                    continue
+                position = next_line - window_start
+                next_line += 1
+                if window[position].tokens:
+                    transaction = self._transaction_at(window, position, seen)
+                    if transaction is not None:
+                        extracted += 1
+                        yield transaction
+                if position >= CONTEXT_RADIUS:
+                    window.popleft()
+                    window_start += 1
+            for position in range(next_line - window_start, len(window)):
+                transaction = self._transaction_at(window, position, seen)
+                if transaction is not None:
+                    extracted += 1
+                    yield transaction
+        finally:
+            if self.metrics.enabled:
+                self.metrics.increment('text_lines_scanned', lines_scanned)
+                self.metrics.increment('text_transactions_extracted', extracted)
 
-    def _build_transaction_from_line(self, line: str, date: str, amount: str) -> Optional[Dict[str, Any]]:
-        transaction_type = self._determine_transaction_type(line)
-        description = self._extract_description(line, date, amount)
-        currency = self._extract_currency_from_amount(amount)
-        return {
-            'transaction_date': date,
-            'description': description,
-            'amount': amount if transaction_type == 'CREDIT' else None,
-            'debit': amount if transaction_type == 'DEBIT' else None,
-            'credit': amount if transaction_type == 'CREDIT' else None,
-            'currency': currency
-        }
+    def _transaction_at(self, window: Deque[ScannedLine], position: int, seen: set) -> Optional[Dict[str, Any]]:
+        line = window[position]
+        date = line.first('date')
+        if date is None:
+            return None
+        amount = line.first('amount')
+        if amount is not None:
+            transaction = self._build_transaction(line.text.strip(), [line], date, amount)
+        else:
+            # a neighbouring line with its own date belongs to another transaction, so context stops there
+            start = position
+            while start > max(0, position - CONTEXT_RADIUS) and window[start - 1].first('date') is None:
+                start -= 1
+            end = position + 1
+            while end < min(len(window), position + CONTEXT_RADIUS + 1) and window[end].first('date') is None:
+                end += 1
+            context = list(islice(window, start, end))
+            context_amount = first_token(
+                (token for context_line in context for token in context_line.tokens), 'amount'
+            )
+            if not context_amount:
+                return None
+            full_context = ' '.join(context_line.text for context_line in context)
+            transaction = self._build_transaction(full_context, context, date, context_amount)
+        key = (
+            transaction.get('transaction_date', ''),
+            transaction.get('description', ''),
+            transaction.get('amount', '') or transaction.get('debit', '') or transaction.get('credit', '')
+        )
+        if key in seen:
+            return None
+        seen.add(key)
+        return transaction
 
-    def _build_transaction_from_context(self, context_lines: List[str], date: str, amount: str) -> Optional[Dict[str, Any]]:
-        full_context = ' '.join(context_lines)
-        transaction_type = self._determine_transaction_type(full_context)
-        description = self._extract_description(full_context, date, amount)
-        currency = self._extract_currency_from_amount(amount)
+    def _build_transaction(self, text: str, lines: List[ScannedLine], date: TextToken,
+                           amount: TextToken) -> Optional[Dict[str, Any]]:
+        transaction_type = self._determine_transaction_type(text, lines)
+        description = self._extract_description(text, lines)
         return {
-            'transaction_date': date,
+            'transaction_date': date.value,
             'description': description,
-            'amount': amount if transaction_type == 'CREDIT' else None,
-            'debit': amount if transaction_type == 'DEBIT' else None,
-            'credit': amount if transaction_type == 'CREDIT' else None,
-            'currency': currency
+            'amount': amount.value if transaction_type == 'CREDIT' else None,
+            'debit': amount.value if transaction_type == 'DEBIT' else None,
+            'credit': amount.value if transaction_type == 'CREDIT' else None,
+            'currency': amount.currency
         }
 
-    def _determine_transaction_type(self, text: str) -> str:
-        text_lower = text.lower()
-        debit_score = sum(1 for keyword in self.debit_keywords if keyword in text_lower)
-        credit_score = sum(1 for keyword in self.credit_keywords if keyword in text_lower)
-        if '-' in text or 'минус' in text_lower:
+    def _determine_transaction_type(self, text: str, lines: List[ScannedLine]) -> str:
+        debit_score = len({keyword for line in lines for keyword in line.labels('debit')})
+        credit_score = len({keyword for line in lines for keyword in line.labels('credit')})
+        if '-' in text or any(line.labels('negation') for line in lines):
             debit_score += 2
         return 'DEBIT' if debit_score >= credit_score else 'CREDIT'
 
-    def _extract_description(self, text: str, date: str, amount: str) -> str:
-        description = text
-        for date_pattern in self.date_patterns:
-            description = re.sub(date_pattern, '', description, flags=re.IGNORECASE)
-        for amount_pattern in self.amount_patterns:
-            description = re.sub(amount_pattern, '', description, flags=re.IGNORECASE)
-        description = re.sub(r'\s+', ' ', description).strip()
+    def _extract_description(self, text: str, lines: List[ScannedLine]) -> str:
+        description = ' '.join(line.without_tokens() for line in lines)
+        description = self.whitespace.sub(' ', description).strip()
         return text if len(description) < self.config.min_description_length else description
-
-    def _extract_currency_from_amount(self, amount: str) -> Optional[str]:
-        amount_lower = amount.lower()
-        for symbol, currency in CURRENCY_MAPPING.items():
-            if symbol in amount_lower:
-                return currency
-        currency_codes = ['KZT', 'USD', 'EUR', 'RUB']
-        for code in currency_codes:
-            if code.lower() in amount_lower or code in amount:
-                return code
-        return None
-
-    def _get_context_lines(self, lines: List[str], index: int, radius: int) -> List[str]:
-        start = max(0, index - radius)
-        end = min(len(lines), index + radius + 1)
-        return lines[start:end]
-
-    def _deduplicate_transactions(self, transactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        seen = set()
-        unique_transactions = []
-        for transaction in transactions:
-            key = (
-                transaction.get('transaction_date', ''),
-                transaction.get('description', ''),
-                transaction.get('amount', '') or transaction.get('debit', '') or transaction.get('credit', '')
-            )
-            if key not in seen:
-                seen.add(key)
-                unique_transactions.append(transaction)
-        return unique_transactions
@@ -1,17 +1,29 @@
 import re
-from typing import Tuple, List
+from typing import Tuple, List, Optional
+from src.utils.cache import LRUCache
 
 
 class TextProcessor:
-    def __init__(self):
+    def __init__(self, cache: Optional[LRUCache] = None):
+        self.cache = cache
         self.excessive_whitespace = re.compile(r'\s+')
         self.control_chars = re.compile(r'[\x00-\x1f\x7f-\x9f]')
         self.special_chars = re.compile(r'[^\w\s\-.,!?()№]', re.UNICODE)
     
     def clean_description(self, description: str) -> Tuple[str, str, List[str]]:
-        quality_flags = []
         if not description:
             return "", "", ['missing_required_field']
+        if self.cache is None or not isinstance(description, str):
+            return self._clean_description(description)
+        cache_key = ('description', description)
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            cached = self._clean_description(description)
+            self.cache.put(cache_key, (cached[0], cached[1], tuple(cached[2])))
+        return cached[0], cached[1], list(cached[2])
+
+    def _clean_description(self, description: str) -> Tuple[str, str, List[str]]:
+        quality_flags = []
         description_raw = str(description)
         cleaned = description_raw.strip()
         if self.control_chars.search(cleaned):
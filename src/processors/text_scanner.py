@@ -0,0 +1,98 @@
+import re
+from typing import List, Dict, Optional, NamedTuple, Iterable
+from src.utils.constants import CURRENCY_MAPPING, SUPPORTED_CURRENCIES
+from src.utils.keyword_automaton import KeywordAutomaton, KeywordMatch
+
+DATE_PATTERNS = [
+    r'\b\d{1,2}[./\-]\d{1,2}[./\-]\d{2,4}\b',
+    r'\b\d{4}[./\-]\d{1,2}[./\-]\d{1,2}\b',
+    r'\b\d{1,2}\s+(?:января|февраля|марта|апреля|мая|июня|июля|августа|сентября|октября|ноября|декабря)\s+\d{4}\b'
+]
+
+AMOUNT_PATTERNS = [
+    r'\b\d{1,3}(?:[,\s]?\d{3})*(?:[.,]\d{1,2})?\s*(?P<currency>{currencies})\b',
+    r'\b\d{1,3}(?:[,\s]\d{3})*(?:[.,]\d{1,2})?\b'
+]
+
+
+class TextToken(NamedTuple):
+    kind: str
+    value: str
+    start: int
+    end: int
+    priority: int
+    currency: Optional[str] = None
+
+
+def first_token(tokens: Iterable[TextToken], kind: str) -> Optional[TextToken]:
+    best = None
+    for token in tokens:
+        if token.kind == kind and (best is None or token.priority < best.priority):
+            best = token
+    return best
+
+
+class ScannedLine:
+    __slots__ = ('text', 'tokens', '_scanner', '_keywords')
+
+    def __init__(self, text: str, tokens: List[TextToken], scanner: 'TextTokenScanner'):
+        self.text = text
+        self.tokens = tokens
+        self._scanner = scanner
+        self._keywords = None
+
+    def first(self, kind: str) -> Optional[TextToken]:
+        return first_token(self.tokens, kind)
+
+    def keywords(self) -> List[KeywordMatch]:
+        if self._keywords is None:
+            self._keywords = self._scanner.scan_keywords(self.text)
+        return self._keywords
+
+    def labels(self, category: str) -> List[str]:
+        return [value for match in self.keywords() for label, value in match.labels if label == category]
+
+    def without_tokens(self) -> str:
+        parts = []
+        position = 0
+        for token in self.tokens:
+            parts.append(self.text[position:token.start])
+            position = token.end
+        parts.append(self.text[position:])
+        return ''.join(parts)
+
+
+class TextTokenScanner:
+    def __init__(self, keyword_automaton: Optional[KeywordAutomaton] = None,
+                 currency_aliases: Optional[Dict[str, str]] = None):
+        self.keyword_automaton = keyword_automaton
+        self.currency_aliases = {alias.lower(): code for alias, code in (currency_aliases or CURRENCY_MAPPING).items()}
+        for code in SUPPORTED_CURRENCIES:
+            self.currency_aliases.setdefault(code.lower(), code)
+        currencies = '|'.join(
+            re.escape(alias) for alias in sorted(self.currency_aliases, key=len, reverse=True)
+        )
+        alternatives = []
+        self.group_kinds = {}
+        for kind, patterns in (('date', DATE_PATTERNS), ('amount', AMOUNT_PATTERNS)):
+            for priority, pattern in enumerate(patterns):
+                name = f'{kind}{priority}'
+                self.group_kinds[name] = (kind, priority)
+                alternatives.append(f'(?P<{name}>' + pattern.replace('{currencies}', currencies) + ')')
+        # every date and amount starts with a digit; the lookahead lets re skip other positions cheaply
+        self.pattern = re.compile(r'(?=\d)(?:' + '|'.join(alternatives) + ')', re.IGNORECASE)
+
+    def scan(self, line: str) -> ScannedLine:
+        tokens = []
+        for match in self.pattern.finditer(line):
+            kind, priority = self.group_kinds[match.lastgroup]
+            currency = None
+            if kind == 'amount' and match.group('currency'):
+                currency = self.currency_aliases.get(match.group('currency').lower())
+            tokens.append(TextToken(kind, match.group(), match.start(), match.end(), priority, currency))
+        return ScannedLine(line, tokens, self)
+
+    def scan_keywords(self, line: str) -> List[KeywordMatch]:
+        if self.keyword_automaton is None:
+            return []
+        return self.keyword_automaton.find_longest(line)
@@ -0,0 +1,51 @@
+from typing import Any, Dict, Optional, Tuple
+from src.models.transaction_models import RawTransactionInput
+from src.models.table_models import TableRow, original_row
+from src.utils.constants import VALIDATION_NOT_A_MAPPING, VALIDATION_MISSING_FIELD, VALIDATION_INVALID_TYPE
+
+REQUIRED_TEXT_FIELDS = ('transaction_date', 'description')
+AMOUNT_FIELDS = ('debit', 'credit', 'amount')
+REJECTED_TYPES = (int, float, list, dict)
+
+ValidationOutcome = Tuple[Optional[RawTransactionInput], Optional[str], Optional[str]]
+
+UNDECIDED = (None, None, None)
+
+
+def validate_raw_transaction(raw_data: Any) -> ValidationOutcome:
+    # returns (model, None, None) for valid rows and (None, code, field) for invalid ones without raising;
+    # UNDECIDED means the value needs pydantic coercion rules (bytes, Decimal, ...) to decide
+    if not isinstance(raw_data, (dict, TableRow)):
+        return None, VALIDATION_NOT_A_MAPPING, None
+    values = {}
+    for field in REQUIRED_TEXT_FIELDS:
+        value = raw_data.get(field)
+        if value is None:
+            return None, VALIDATION_MISSING_FIELD if field not in raw_data else VALIDATION_INVALID_TYPE, field
+        if type(value) is not str:
+            return (None, VALIDATION_INVALID_TYPE, field) if isinstance(value, REJECTED_TYPES) else UNDECIDED
+        values[field] = value
+    for field in AMOUNT_FIELDS:
+        value = raw_data.get(field)
+        value_type = type(value)
+        if value is None or value_type is str or value_type is float:
+            values[field] = value
+        elif value_type is int or value_type is bool:
+            values[field] = float(value)
+        elif isinstance(value, (list, dict)):
+            return None, VALIDATION_INVALID_TYPE, field
+        else:
+            return UNDECIDED
+    currency = raw_data.get('currency')
+    if currency is not None and type(currency) is not str:
+        return (None, VALIDATION_INVALID_TYPE, 'currency') if isinstance(currency, REJECTED_TYPES) else UNDECIDED
+    values['currency'] = currency
+    return RawTransactionInput.model_construct(**values), None, None
+
+
+def validation_failure(index: int, raw_data: Any, error_code: str, field: Optional[str]) -> Dict[str, Any]:
+    # the readable message is added when the result model is serialized, see serialize_failed_transactions
+    return {
+        'index': index, 'original_data': original_row(raw_data), 'error_code': error_code,
+        'error_field': field, 'error_type': 'ValueError'
+    }
@@ -0,0 +1,319 @@
+import argparse
+import io
+import json
+import queue
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+from src.api_interface import DataStandardizationAPI
+from src.models.parser_models import TransactionExtractionConfig, ProcessingConfig
+from src.utils.metrics import merge_snapshots, render_prometheus
+from src.utils.constants import (
+    SERVER_MAX_BODY_BYTES, SERVER_QUEUE_SIZE, SERVER_MAX_CONNECTIONS, SERVER_KEEP_ALIVE_TIMEOUT,
+    SERVER_CHUNK_SIZE
+)
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+JSON_CONTENT_TYPE = 'application/json; charset=utf-8'
+
+
+class ChunkedResponseWriter(io.RawIOBase):
+    def __init__(self, wfile, chunk_size: int = SERVER_CHUNK_SIZE):
+        self.wfile = wfile
+        self.chunk_size = chunk_size
+        self.buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.buffer += data
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+        return len(data)
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.wfile.write(b'%X\r\n%s\r\n' % (len(self.buffer), bytes(self.buffer)))
+            self.buffer.clear()
+        self.wfile.flush()
+
+    def finish(self) -> None:
+        self.flush()
+        self.wfile.write(b'0\r\n\r\n')
+        self.wfile.flush()
+
+
+class LimitedReader(io.RawIOBase):
+    def __init__(self, rfile, length: int):
+        self.rfile = rfile
+        self.remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self.remaining <= 0:
+            return 0
+        data = self.rfile.read(min(len(buffer), self.remaining))
+        self.remaining -= len(data)
+        buffer[:len(data)] = data
+        return len(data)
+
+    def drain(self) -> None:
+        while self.remaining > 0:
+            data = self.rfile.read(min(self.remaining, 1 << 16))
+            if not data:
+                break
+            self.remaining -= len(data)
+
+
+class StandardizationRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'DataStandardization/1.0'
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        self.timeout = self.server.keep_alive_timeout
+        super().setup()
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == '/health':
+            health = self.server.api_template.health_check()
+            health['server'] = self.server.stats()
+            self._send_json(HTTPStatus.OK, health)
+        elif path == '/formats':
+            self._send_json(HTTPStatus.OK, self.server.api_template.get_supported_formats())
+        elif path == '/metrics':
+            self._send_text(HTTPStatus.OK, self.server.prometheus_metrics(), 'text/plain; version=0.0.4')
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Неизвестный путь: {path}")
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        if url.path not in ('/process', '/process/file'):
+            self.close_connection = True
+            self._send_error(HTTPStatus.NOT_FOUND, f"Неизвестный путь: {url.path}")
+            return
+        length, error = self._content_length()
+        if error is not None:
+            self.close_connection = True
+            self._send_error(*error)
+            return
+        body = LimitedReader(self.rfile, length)
+        with self.server.admit() as api:
+            if api is None:
+                self.close_connection = True
+                self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, "Сервис перегружен, повторите позже",
+                                 {'Retry-After': '1'})
+                return
+            if url.path == '/process':
+                self._process_batch(api, body, parse_qs(url.query))
+            else:
+                self._process_file(api, body)
+        body.drain()
+
+    def _process_batch(self, api: DataStandardizationAPI, body: LimitedReader,
+                       query: Dict[str, Any]) -> None:
+        ndjson = query.get('format', [''])[0] == 'ndjson' or NDJSON_CONTENT_TYPE in (self.headers.get('Accept') or '')
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', NDJSON_CONTENT_TYPE if ndjson else JSON_CONTENT_TYPE)
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        writer = ChunkedResponseWriter(self.wfile)
+        api.write_parser_output(io.BufferedReader(body), writer, mode='ndjson' if ndjson else 'json')
+        writer.finish()
+
+    def _process_file(self, api: DataStandardizationAPI, body: LimitedReader) -> None:
+        try:
+            file_data = json.loads(body.read())
+        except ValueError as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, f"Некорректный JSON: {e}")
+            return
+        if not isinstance(file_data, dict):
+            self._send_error(HTTPStatus.BAD_REQUEST, "Ожидается JSON-объект файла")
+            return
+        self._send_json(HTTPStatus.OK, api.process_single_file(file_data))
+
+    def _content_length(self) -> Tuple[int, Optional[tuple]]:
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            return 0, (HTTPStatus.LENGTH_REQUIRED, "Требуется заголовок Content-Length")
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            return 0, (HTTPStatus.LENGTH_REQUIRED, "Требуется заголовок Content-Length")
+        if length < 0:
+            return 0, (HTTPStatus.BAD_REQUEST, "Некорректный Content-Length")
+        if length > self.server.max_body_bytes:
+            return 0, (HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                       f"Размер запроса превышает {self.server.max_body_bytes} байт")
+        return length, None
+
+    def _send_json(self, status: HTTPStatus, payload: Dict[str, Any],
+                   headers: Optional[Dict[str, str]] = None) -> None:
+        self._send_text(status, json.dumps(payload, ensure_ascii=False), JSON_CONTENT_TYPE, headers)
+
+    def _send_text(self, status: HTTPStatus, text: str, content_type: str,
+                   headers: Optional[Dict[str, str]] = None) -> None:
+        data = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, status: HTTPStatus, message: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send_json(status, {"status": "error", "error_message": message, "error_type": status.phrase}, headers)
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+
+class _Admission:
+    def __init__(self, server: 'StandardizationHTTPServer'):
+        self.server = server
+        self.api = None
+        self.admitted = False
+
+    def __enter__(self) -> Optional[DataStandardizationAPI]:
+        self.admitted = self.server._admission.acquire(blocking=False)
+        if not self.admitted:
+            with self.server._stats_lock:
+                self.server.rejected_requests += 1
+            return None
+        self.api = self.server._api_pool.get()
+        return self.api
+
+    def __exit__(self, *exc_info) -> None:
+        if self.api is not None:
+            self.server._api_pool.put(self.api)
+        if self.admitted:
+            self.server._admission.release()
+
+
+class StandardizationHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, server_address, extraction_config: Optional[TransactionExtractionConfig] = None,
+                 processing_config: Optional[ProcessingConfig] = None, workers: int = 4,
+                 queue_size: int = SERVER_QUEUE_SIZE, max_body_bytes: int = SERVER_MAX_BODY_BYTES,
+                 max_connections: int = SERVER_MAX_CONNECTIONS,
+                 keep_alive_timeout: float = SERVER_KEEP_ALIVE_TIMEOUT, access_log: bool = False):
+        if workers < 1:
+            raise ValueError("workers должен быть больше 0")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_body_bytes = max_body_bytes
+        self.max_connections = max_connections
+        self.keep_alive_timeout = keep_alive_timeout
+        self.access_log = access_log
+        self._api_pool = queue.Queue()
+        self.apis = [DataStandardizationAPI(extraction_config, processing_config) for _ in range(workers)]
+        for api in self.apis:
+            self._api_pool.put(api)
+        self.api_template = self.apis[0]
+        # one result cache for all workers, so concurrent retries of the same file are coalesced
+        for api in self.apis[1:]:
+            if api.service.result_cache is not None:
+                api.service.result_cache.close()
+                api.service.result_cache = self.api_template.service.result_cache
+        self._admission = threading.BoundedSemaphore(workers + queue_size)
+        self._stats_lock = threading.Lock()
+        self.active_connections = 0
+        self.rejected_requests = 0
+        self.rejected_connections = 0
+        super().__init__(server_address, StandardizationRequestHandler)
+
+    def admit(self) -> _Admission:
+        return _Admission(self)
+
+    def process_request(self, request, client_address) -> None:
+        with self._stats_lock:
+            accepted = self.active_connections < self.max_connections
+            if accepted:
+                self.active_connections += 1
+            else:
+                self.rejected_connections += 1
+        if not accepted:
+            try:
+                request.sendall(
+                    b'HTTP/1.1 503 Service Unavailable\r\nRetry-After: 1\r\n'
+                    b'Content-Length: 0\r\nConnection: close\r\n\r\n'
+                )
+            finally:
+                self.shutdown_request(request)
+            return
+        super().process_request(request, client_address)
+
+    def process_request_thread(self, request, client_address) -> None:
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            with self._stats_lock:
+                self.active_connections -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                'workers': self.workers,
+                'queue_size': self.queue_size,
+                'idle_workers': self._api_pool.qsize(),
+                'active_connections': self.active_connections,
+                'rejected_requests': self.rejected_requests,
+                'rejected_connections': self.rejected_connections,
+                'max_body_bytes': self.max_body_bytes
+            }
+
+    def prometheus_metrics(self) -> str:
+        snapshot = None
+        for api in self.apis:
+            snapshot = merge_snapshots(snapshot, api.service.get_metrics())
+        return render_prometheus(snapshot)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="HTTP-сервер стандартизации данных")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--queue-size', type=int, default=SERVER_QUEUE_SIZE)
+    parser.add_argument('--max-body-bytes', type=int, default=SERVER_MAX_BODY_BYTES)
+    parser.add_argument('--max-connections', type=int, default=SERVER_MAX_CONNECTIONS)
+    parser.add_argument('--engine', choices=['row', 'columnar'], default='row')
+    parser.add_argument('--metrics', action='store_true', help="собирать метрики этапов")
+    parser.add_argument('--access-log', action='store_true')
+    parser.add_argument('--result-cache-size', type=int, default=0, help="число результатов файлов в памяти")
+    parser.add_argument('--result-cache-path', help="файл SQLite для кэша результатов")
+    args = parser.parse_args(argv)
+    server = StandardizationHTTPServer(
+        (args.host, args.port),
+        processing_config=ProcessingConfig(
+            engine=args.engine, collect_metrics=args.metrics,
+            result_cache_size=args.result_cache_size, result_cache_path=args.result_cache_path
+        ),
+        workers=args.workers,
+        queue_size=args.queue_size,
+        max_body_bytes=args.max_body_bytes,
+        max_connections=args.max_connections,
+        access_log=args.access_log
+    )
+    print(f"Сервис стандартизации слушает http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
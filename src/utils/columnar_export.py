@@ -0,0 +1,190 @@
+import os
+from typing import Any, Iterable, Iterator, List, Literal, Optional, Tuple, Union, IO
+import numpy as np
+import pandas as pd
+from src.models.transaction_models import CompactTransactionBatch
+from src.utils.constants import DATA_QUALITY_FLAGS, EXPORT_ROW_GROUP_SIZE
+
+EXPORT_COLUMNS = [
+    'source_file', 'transaction_id', 'transaction_date', 'description_raw', 'description_clean',
+    'amount', 'amount_minor', 'currency', 'transaction_type', 'source_account', 'quality_flags_mask'
+]
+
+TRANSACTION_TYPE_CATEGORIES = ['DEBIT', 'CREDIT']
+
+FLAG_BITS = {flag: 1 << position for position, flag in enumerate(DATA_QUALITY_FLAGS)}
+
+EXPORT_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+ExportRow = Tuple[str, str, str, str, str, float, str, str, str, int]
+
+
+def flag_bitmask(flags: Iterable[str]) -> int:
+    mask = 0
+    for flag in flags:
+        mask |= FLAG_BITS.get(flag, 0)
+    return mask
+
+
+def decode_flag_bitmask(mask: int) -> List[str]:
+    return [flag for flag, bit in FLAG_BITS.items() if mask & bit]
+
+
+def iter_export_rows(file_result: Any) -> Iterator[ExportRow]:
+    filename = file_result.filename
+    transactions = file_result.successful_transactions
+    masks = {}
+    if isinstance(transactions, CompactTransactionBatch):
+        for record in transactions.iter_records():
+            flags = tuple(record['data_quality_flags'])
+            mask = masks.get(flags)
+            if mask is None:
+                mask = masks[flags] = flag_bitmask(flags)
+            yield (
+                filename, record['transaction_id'], record['transaction_date'], record['description_raw'],
+                record['description_clean'], record['amount'], record['currency'], record['transaction_type'],
+                record['source_account'], mask
+            )
+        return
+    for transaction in transactions:
+        yield (
+            filename, transaction.transaction_id, transaction.transaction_date, transaction.description_raw,
+            transaction.description_clean, transaction.amount, transaction.currency,
+            transaction.transaction_type.value, transaction.source_account,
+            flag_bitmask(transaction.data_quality_flags)
+        )
+
+
+def build_export_frame(rows: List[ExportRow]) -> pd.DataFrame:
+    (source_files, transaction_ids, dates, descriptions_raw, descriptions_clean, amounts, currencies,
+     transaction_types, accounts, masks) = zip(*rows) if rows else ([],) * 10
+    amounts = np.asarray(amounts, dtype='float64')
+    return pd.DataFrame({
+        'source_file': pd.Categorical(source_files),
+        'transaction_id': transaction_ids,
+        'transaction_date': pd.to_datetime(pd.Series(dates, dtype=object), format='ISO8601', utc=True),
+        'description_raw': descriptions_raw,
+        'description_clean': descriptions_clean,
+        'amount': amounts,
+        'amount_minor': np.round(amounts * 100).astype('int64'),
+        'currency': pd.Categorical(currencies),
+        'transaction_type': pd.Categorical(transaction_types, categories=TRANSACTION_TYPE_CATEGORIES),
+        'source_account': pd.Categorical(accounts),
+        'quality_flags_mask': np.asarray(masks, dtype='int64')
+    }, columns=EXPORT_COLUMNS)
+
+
+def transactions_frame(file_results: Iterable[Any]) -> pd.DataFrame:
+    return build_export_frame([row for file_result in file_results for row in iter_export_rows(file_result)])
+
+
+def _arrow_schema(pa):
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ('source_file', category),
+        ('transaction_id', pa.string()),
+        ('transaction_date', pa.timestamp('us', tz='UTC')),
+        ('description_raw', pa.string()),
+        ('description_clean', pa.string()),
+        ('amount', pa.float64()),
+        ('amount_minor', pa.int64()),
+        ('currency', category),
+        ('transaction_type', category),
+        ('source_account', category),
+        ('quality_flags_mask', pa.int64())
+    ])
+
+
+class ColumnarExportWriter:
+    # buffers at most one row group; each full group is converted to typed columns and written out
+    def __init__(self, output: Union[str, os.PathLike, IO], export_format: Literal["csv", "parquet"] = "parquet",
+                 row_group_size: int = EXPORT_ROW_GROUP_SIZE):
+        if export_format not in ("csv", "parquet"):
+            raise ValueError(f"Неподдерживаемый формат экспорта: {export_format}")
+        if row_group_size <= 0:
+            raise ValueError("Размер группы строк должен быть положительным")
+        self.output = output
+        self.export_format = export_format
+        self.row_group_size = row_group_size
+        self.rows = []
+        self.rows_written = 0
+        self.row_groups = 0
+        self.closed = False
+        self._handle = None
+        self._owns_handle = False
+        self._parquet_writer = None
+        self._arrow = None
+        if export_format == "parquet":
+            try:
+                import pyarrow
+                import pyarrow.parquet
+            except ImportError:
+                raise ImportError("Для экспорта в Parquet требуется пакет pyarrow") from None
+            self._arrow = (pyarrow, pyarrow.parquet)
+
+    def __enter__(self) -> 'ColumnarExportWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    def add_file(self, file_result: Any) -> None:
+        for row in iter_export_rows(file_result):
+            self.rows.append(row)
+            if len(self.rows) >= self.row_group_size:
+                self.flush()
+
+    def flush(self) -> None:
+        if not self.rows:
+            return
+        frame = build_export_frame(self.rows)
+        self.rows = []
+        if self.export_format == "csv":
+            self._write_csv(frame)
+        else:
+            self._write_parquet(frame)
+        self.rows_written += len(frame)
+        self.row_groups += 1
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self.flush()
+            if self.export_format == "csv" and self._handle is None:
+                self._write_csv(build_export_frame([]))
+            if self.export_format == "parquet":
+                if self._parquet_writer is None:
+                    self._write_parquet(build_export_frame([]))
+                self._parquet_writer.close()
+        finally:
+            if self._owns_handle:
+                self._handle.close()
+            self.closed = True
+
+    def _write_csv(self, frame: pd.DataFrame) -> None:
+        header = self._handle is None
+        if header:
+            if isinstance(self.output, (str, os.PathLike)):
+                self._handle = open(self.output, 'w', encoding='utf-8', newline='')
+                self._owns_handle = True
+            else:
+                self._handle = self.output
+        frame.to_csv(self._handle, index=False, header=header, date_format=EXPORT_DATE_FORMAT)
+
+    def _write_parquet(self, frame: pd.DataFrame) -> None:
+        pa, pq = self._arrow
+        schema = _arrow_schema(pa)
+        table = pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(self.output, schema)
+        self._parquet_writer.write_table(table, row_group_size=len(frame) or None)
+
+
+def export_transactions(file_results: Iterable[Any], output: Union[str, os.PathLike, IO],
+                        export_format: Literal["csv", "parquet"] = "parquet",
+                        row_group_size: Optional[int] = None) -> ColumnarExportWriter:
+    with ColumnarExportWriter(output, export_format, row_group_size or EXPORT_ROW_GROUP_SIZE) as writer:
+        for file_result in file_results:
+            writer.add_file(file_result)
+    return writer
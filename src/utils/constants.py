@@ -27,6 +27,16 @@ CURRENCY_MAPPING = {
 
 SUPPORTED_CURRENCIES = ['KZT', 'USD', 'EUR', 'RUB']
 
+DEBIT_KEYWORDS = [
+    'оплата', 'покупка', 'расход', 'списание', 'перевод', 'платеж',
+    'оплачено', 'потрачено', 'снято', 'дебет', 'трата'
+]
+
+CREDIT_KEYWORDS = [
+    'поступление', 'доход', 'зачисление', 'получено', 'кредит',
+    'зарплата', 'возврат', 'пополнение', 'приход'
+]
+
 NUMERIC_CLEANUP_CHARS = [' ', ',', '₸', 'тг', '$', '€', '₽', 'руб']
 
 TRANSACTION_TYPES = ['DEBIT', 'CREDIT']
@@ -36,5 +46,53 @@ DATA_QUALITY_FLAGS = [
     'amount_format_unclear',
     'currency_assumed',
     'description_contains_special_chars',
-    'missing_required_field'
+    'missing_required_field',
+    'duplicate_transaction',
+    'suspected_duplicate'
 ]
+
+VALIDATION_NOT_A_MAPPING = 'not_a_mapping'
+VALIDATION_MISSING_FIELD = 'missing_field'
+VALIDATION_INVALID_TYPE = 'invalid_type'
+
+VALIDATION_ERROR_MESSAGES = {
+    VALIDATION_NOT_A_MAPPING: 'строка транзакции должна быть объектом, получено {value_type}',
+    VALIDATION_MISSING_FIELD: 'отсутствует обязательное поле {field}',
+    VALIDATION_INVALID_TYPE: 'поле {field} имеет неверный тип {value_type}'
+}
+
+DEFAULT_CACHE_SIZE = 50000
+
+FORMAT_INFERENCE_SAMPLE_SIZE = 50
+
+FORMAT_INFERENCE_MIN_SHARE = 0.8
+
+PARALLEL_CHUNK_SIZE = 4
+
+PARALLEL_MIN_FILES = 32
+
+RESPONSE_MEMORY_BUDGET = 64 * 1024 * 1024
+
+EXPORT_ROW_GROUP_SIZE = 100000
+
+RESULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+PROFILE_TOP_N = 20
+
+DEDUP_BLOOM_THRESHOLD = 5000000
+
+DEDUP_FALSE_POSITIVE_RATE = 0.001
+
+FUZZY_SIMILARITY_THRESHOLD = 0.8
+
+FUZZY_BUCKET_LIMIT = 32
+
+SERVER_MAX_BODY_BYTES = 256 * 1024 * 1024
+
+SERVER_QUEUE_SIZE = 16
+
+SERVER_MAX_CONNECTIONS = 256
+
+SERVER_KEEP_ALIVE_TIMEOUT = 30
+
+SERVER_CHUNK_SIZE = 64 * 1024
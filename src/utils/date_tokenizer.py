@@ -0,0 +1,181 @@
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from src.utils.constants import DATE_FORMATS
+
+TOKEN_PATTERN = re.compile(r'[0-9]+|[^\W\d_]+|\S')
+
+DATE_SEPARATORS = './-'
+
+RUSSIAN_MONTH_FORMS = [
+    ('январ', ('ь', 'я', 'ю', 'е', 'ем', 'ём')),
+    ('феврал', ('ь', 'я', 'ю', 'е', 'ем', 'ём')),
+    ('март', ('', 'а', 'у', 'е', 'ом')),
+    ('апрел', ('ь', 'я', 'ю', 'е', 'ем')),
+    ('ма', ('й', 'я', 'ю', 'е', 'ем')),
+    ('июн', ('ь', 'я', 'ю', 'е', 'ем')),
+    ('июл', ('ь', 'я', 'ю', 'е', 'ем')),
+    ('август', ('', 'а', 'у', 'е', 'ом')),
+    ('сентябр', ('ь', 'я', 'ю', 'е', 'ем', 'ём')),
+    ('октябр', ('ь', 'я', 'ю', 'е', 'ем', 'ём')),
+    ('ноябр', ('ь', 'я', 'ю', 'е', 'ем', 'ём')),
+    ('декабр', ('ь', 'я', 'ю', 'е', 'ем', 'ём')),
+]
+
+MONTH_ABBREVIATIONS = {
+    'янв': 1, 'фев': 2, 'февр': 2, 'мар': 3, 'апр': 4, 'июн': 6, 'июл': 7, 'авг': 8,
+    'сен': 9, 'сент': 9, 'окт': 10, 'ноя': 11, 'нояб': 11, 'дек': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6, 'july': 7,
+    'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# Kazakh months take agglutinative case endings (маусымның, маусымда, ...), so they match by stem;
+# the second spelling of each month is the common keyboard transliteration without Kazakh letters
+KAZAKH_MONTH_STEMS = [
+    ('қаңтар', 1), ('кантар', 1), ('ақпан', 2), ('акпан', 2), ('наурыз', 3), ('сәуір', 4), ('сауир', 4),
+    ('мамыр', 5), ('маусым', 6), ('шілде', 7), ('шилде', 7), ('тамыз', 8), ('қыркүйек', 9),
+    ('кыркуйек', 9), ('қазан', 10), ('казан', 10), ('қараша', 11), ('караша', 11),
+    ('желтоқсан', 12), ('желтоксан', 12),
+]
+
+KAZAKH_MAX_SUFFIX = 6
+
+YEAR_WORDS = frozenset(('г', 'год', 'года', 'году', 'ж', 'жыл', 'жылы', 'жылғы', 'жылгы'))
+
+IGNORED_PUNCTUATION = frozenset(',.')
+
+DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+FORMAT_FIELDS = {'%d': 'd', '%m': 'm', '%Y': 'Y', '%y': 'y'}
+
+
+class DateParts(NamedTuple):
+    year: int
+    month: int
+    day: int
+    date_format: Optional[str] = None
+
+    def isoformat(self) -> str:
+        return f'{self.year:04d}-{self.month:02d}-{self.day:02d}T00:00:00Z'
+
+
+def build_month_names() -> Dict[str, int]:
+    names = dict(MONTH_ABBREVIATIONS)
+    for month, (stem, endings) in enumerate(RUSSIAN_MONTH_FORMS, start=1):
+        for ending in endings:
+            names[stem + ending] = month
+    return names
+
+
+def compile_numeric_formats(date_formats: Iterable[str]) -> Dict[Tuple[str, str], str]:
+    # '%d.%m.%Y' -> ('dmY', '.'); formats the tokenizer cannot express are left to strptime
+    layouts = {}
+    for date_format in date_formats:
+        separators = [char for char in DATE_SEPARATORS if char in date_format]
+        if len(separators) != 1:
+            continue
+        fields = date_format.split(separators[0])
+        if len(fields) != 3 or not all(field in FORMAT_FIELDS for field in fields):
+            continue
+        layout = ''.join(FORMAT_FIELDS[field] for field in fields)
+        if sorted(layout.replace('Y', 'y')) == ['d', 'm', 'y']:
+            layouts.setdefault((layout, separators[0]), date_format)
+    return layouts
+
+
+def is_number(token: str) -> bool:
+    return token.isascii() and token.isdigit()
+
+
+def is_valid_date(year: int, month: int, day: int) -> bool:
+    if year < 1 or not 1 <= month <= 12 or day < 1:
+        return False
+    if month == 2 and day == 29:
+        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    return day <= DAYS_IN_MONTH[month]
+
+
+class DateTokenizer:
+    def __init__(self, date_formats: Iterable[str] = DATE_FORMATS):
+        self.numeric_formats = compile_numeric_formats(date_formats)
+        self.formats = frozenset(self.numeric_formats.values())
+        self.month_names = build_month_names()
+
+    def parse(self, text: str) -> Optional[DateParts]:
+        tokens = TOKEN_PATTERN.findall(text)
+        if len(tokens) == 5 and sum(map(len, tokens)) == len(text):
+            parts = self._parse_numeric(tokens)
+            if parts is not None:
+                return parts
+        return self._parse_words(tokens)
+
+    def detect_format(self, text: str) -> Optional[str]:
+        tokens = TOKEN_PATTERN.findall(text)
+        if len(tokens) != 5 or sum(map(len, tokens)) != len(text):
+            return None
+        parts = self._parse_numeric(tokens)
+        return parts.date_format if parts is not None else None
+
+    def month(self, word: str) -> Optional[int]:
+        word = word.lower()
+        month = self.month_names.get(word)
+        if month is not None:
+            return month
+        for stem, month in KAZAKH_MONTH_STEMS:
+            if word.startswith(stem) and len(word) - len(stem) <= KAZAKH_MAX_SUFFIX:
+                return month
+        return None
+
+    def _parse_numeric(self, tokens: List[str]) -> Optional[DateParts]:
+        first, separator, second, other_separator, third = tokens
+        if separator != other_separator or separator not in DATE_SEPARATORS:
+            return None
+        if not (is_number(first) and is_number(second) and is_number(third)) or len(second) > 2:
+            return None
+        if len(first) == 4:
+            layout, year, day = 'Ymd', first, third
+        else:
+            layout, year, day = ('dmY' if len(third) == 4 else 'dmy'), third, first
+        if len(day) > 2 or len(year) not in (2, 4):
+            return None
+        date_format = self.numeric_formats.get((layout, separator))
+        if date_format is None:
+            return None
+        year_value = int(year)
+        if len(year) == 2:
+            year_value += 2000 if year_value < 69 else 1900
+        month_value, day_value = int(second), int(day)
+        if not is_valid_date(year_value, month_value, day_value):
+            return None
+        return DateParts(year_value, month_value, day_value, date_format)
+
+    def _parse_words(self, tokens: List[str]) -> Optional[DateParts]:
+        words = []
+        for token in tokens:
+            if token in IGNORED_PUNCTUATION:
+                continue
+            if not (is_number(token) or token.isalpha()):
+                return None
+            words.append(token)
+        if words and words[-1].lower() in YEAR_WORDS:
+            words.pop()
+        if len(words) == 4 and words[1].lower() in YEAR_WORDS:
+            del words[1]
+        if len(words) != 3:
+            return None
+        first, second, third = words
+        if is_number(first) and is_number(third) and not is_number(second):
+            day, month, year = first, self.month(second), third
+        elif is_number(second) and is_number(third) and not is_number(first):
+            day, month, year = second, self.month(first), third
+        elif is_number(first) and is_number(second) and not is_number(third):
+            day, month, year = second, self.month(third), first
+        else:
+            return None
+        if month is None or len(year) != 4 or len(day) > 2:
+            return None
+        year_value, day_value = int(year), int(day)
+        if not is_valid_date(year_value, month, day_value):
+            return None
+        return DateParts(year_value, month, day_value)
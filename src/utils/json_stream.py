@@ -0,0 +1,130 @@
+import bz2
+import gzip
+import io
+import json
+import lzma
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Union, IO
+
+JSON_STREAM_CHUNK_SIZE = 1 << 20
+
+COMPRESSION_MAGIC = [
+    (b'\x1f\x8b', lambda fileobj: gzip.GzipFile(fileobj=fileobj)),
+    (b'BZh', bz2.BZ2File),
+    (b'\xfd7zXZ\x00', lzma.LZMAFile),
+]
+
+Source = Union[str, os.PathLike, IO]
+
+
+class JSONStreamError(ValueError):
+    pass
+
+
+@contextmanager
+def open_text_stream(source: Source) -> Iterator[IO[str]]:
+    if isinstance(source, io.TextIOBase):
+        yield source
+        return
+    owns_source = isinstance(source, (str, os.PathLike))
+    binary = open(source, 'rb') if owns_source else source
+    buffered = decompressed = None
+    if not hasattr(binary, 'peek'):
+        binary = buffered = io.BufferedReader(binary)
+    head = binary.peek(6)[:6]
+    for magic, opener in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            binary = decompressed = opener(binary)
+            break
+    stream = io.TextIOWrapper(binary, encoding='utf-8')
+    try:
+        yield stream
+    finally:
+        if owns_source:
+            stream.close()
+        else:
+            # the caller's stream stays open: only the layers added here are released
+            stream.detach()
+            if decompressed is not None:
+                decompressed.close()
+            if buffered is not None:
+                buffered.detach()
+
+
+def iter_json_documents(source: Source, chunk_size: int = JSON_STREAM_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    with open_text_stream(source) as stream:
+        yield from _JSONStreamReader(stream, chunk_size).iter_values()
+
+
+class _JSONStreamReader:
+    def __init__(self, stream: IO[str], chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.eof = False
+
+    def iter_values(self) -> Iterator[Any]:
+        if self._peek() == '[':
+            self.position += 1
+            yield from self._iter_array()
+        else:
+            while self._peek() is not None:
+                yield self._decode_value()
+
+    def _iter_array(self) -> Iterator[Any]:
+        expect_value = True
+        while True:
+            char = self._peek()
+            if char is None:
+                raise JSONStreamError("Unexpected end of input inside top-level array")
+            if char == ']':
+                self.position += 1
+                if self._peek() is not None:
+                    raise JSONStreamError("Unexpected data after top-level array")
+                return
+            if not expect_value:
+                if char != ',':
+                    raise JSONStreamError(f"Expected ',' or ']' at offset {self.position}")
+                self.position += 1
+                expect_value = True
+                continue
+            yield self._decode_value()
+            expect_value = False
+
+    def _peek(self) -> Any:
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in ' \t\r\n':
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if self.eof:
+                return None
+            self._fill()
+
+    def _decode_value(self) -> Any:
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise JSONStreamError(str(e)) from e
+                self._fill()
+                continue
+            # a number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and not self.eof:
+                self._fill()
+                continue
+            self.position = end
+            return value
+
+    def _fill(self) -> None:
+        self.buffer = self.buffer[self.position:]
+        self.position = 0
+        # grow reads with the pending value so decoding a large value stays linear
+        chunk = self.stream.read(max(self.chunk_size, len(self.buffer)))
+        if not chunk:
+            self.eof = True
+        self.buffer += chunk
@@ -0,0 +1,109 @@
+import re
+import threading
+from typing import List, Dict, Tuple, Iterable, Optional, NamedTuple, FrozenSet
+
+Label = Tuple[str, str]
+
+
+class KeywordMatch(NamedTuple):
+    start: int
+    end: int
+    keyword: str
+    labels: Tuple[Label, ...]
+
+
+class KeywordAutomaton:
+    def __init__(self, keywords: Dict[str, Iterable[Label]]):
+        self.labels = {}
+        for keyword, labels in keywords.items():
+            keyword = keyword.lower()
+            if keyword:
+                self.labels.setdefault(keyword, set()).update(labels)
+        self.labels = {keyword: tuple(sorted(labels)) for keyword, labels in self.labels.items()}
+        self._patterns = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def find_longest(self, text: str, categories: Optional[Iterable[str]] = None) -> List[KeywordMatch]:
+        pattern = self._pattern(frozenset(categories) if categories is not None else None)
+        if pattern is None:
+            return []
+        labels = self.labels
+        return [
+            KeywordMatch(match.start(), match.end(), match.group(), labels[match.group()])
+            for match in pattern.finditer(text.lower())
+        ]
+
+    def first(self, text: str, category: str) -> Optional[str]:
+        pattern = self._pattern(frozenset((category,)))
+        if pattern is None:
+            return None
+        match = pattern.search(text.lower())
+        if match is None:
+            return None
+        for label_category, value in self.labels[match.group()]:
+            if label_category == category:
+                return value
+        return None
+
+    def _pattern(self, categories: Optional[FrozenSet[str]]) -> Optional['re.Pattern']:
+        if categories in self._patterns:
+            return self._patterns[categories]
+        keywords = [
+            keyword for keyword, labels in self.labels.items()
+            if categories is None or any(category in categories for category, _ in labels)
+        ]
+        pattern = re.compile(_trie_pattern(keywords)) if keywords else None
+        with self._lock:
+            return self._patterns.setdefault(categories, pattern)
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    # the keyword trie is compiled into a regex so the state machine runs inside the re engine:
+    # one pass over the text, cost independent of the number of keywords, greedy branches give
+    # leftmost-longest non-overlapping matches
+    root = {}
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            body = '(?:' + body + ')?'
+        return body
+
+    return build(root)
+
+
+_AUTOMATA = {}
+_AUTOMATA_LOCK = threading.Lock()
+
+
+def build_keyword_automaton(debit_keywords: Iterable[str], credit_keywords: Iterable[str],
+                            currency_aliases: Dict[str, str],
+                            negation_keywords: Iterable[str] = ('минус',)) -> KeywordAutomaton:
+    cache_key = (
+        tuple(debit_keywords), tuple(credit_keywords),
+        tuple(currency_aliases.items()), tuple(negation_keywords)
+    )
+    with _AUTOMATA_LOCK:
+        automaton = _AUTOMATA.get(cache_key)
+    if automaton is not None:
+        return automaton
+    keywords = {}
+    for category, values in (('debit', debit_keywords), ('credit', credit_keywords), ('negation', negation_keywords)):
+        for keyword in values:
+            keywords.setdefault(keyword.lower(), set()).add((category, keyword.lower()))
+    for alias, code in currency_aliases.items():
+        keywords.setdefault(alias.lower(), set()).add(('currency', code))
+    automaton = KeywordAutomaton(keywords)
+    with _AUTOMATA_LOCK:
+        return _AUTOMATA.setdefault(cache_key, automaton)
@@ -0,0 +1,54 @@
+import codecs
+import mmap
+from typing import Iterable, Iterator, Union
+from src.utils.json_stream import Source, open_text_stream
+
+LINE_STREAM_CHUNK_SIZE = 1 << 16
+
+TextSource = Union[Source, bytes, bytearray, memoryview, mmap.mmap]
+
+
+def iter_text_lines(source: TextSource, chunk_size: int = LINE_STREAM_CHUNK_SIZE) -> Iterator[str]:
+    # a str is the text itself, not a path; lines follow str.split('\n') semantics
+    if isinstance(source, str):
+        yield from _iter_string_lines(source)
+        return
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        yield from _iter_chunk_lines(_iter_buffer_chunks(source, chunk_size))
+        return
+    with open_text_stream(source) as stream:
+        yield from _iter_chunk_lines(iter(lambda: stream.read(chunk_size), ''))
+
+
+def _iter_string_lines(text: str) -> Iterator[str]:
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _iter_buffer_chunks(buffer, chunk_size: int) -> Iterator[str]:
+    view = memoryview(buffer)
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for offset in range(0, len(view), chunk_size):
+            yield decoder.decode(view[offset:offset + chunk_size])
+        yield decoder.decode(b'', final=True)
+    finally:
+        view.release()
+
+
+def _iter_chunk_lines(chunks: Iterable[str]) -> Iterator[str]:
+    pending = ''
+    for chunk in chunks:
+        if '\n' not in chunk:
+            pending += chunk
+            continue
+        lines = (pending + chunk).split('\n')
+        pending = lines.pop()
+        yield from lines
+    yield pending
@@ -0,0 +1,137 @@
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+class MetricsRecorder:
+    enabled = True
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def clock(self) -> float:
+        return time.perf_counter()
+
+    def observe(self, stage: str, started: float, calls: int = 1) -> None:
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            totals = self.stages.get(stage)
+            if totals is None:
+                self.stages[stage] = [calls, elapsed]
+            else:
+                totals[0] += calls
+                totals[1] += elapsed
+
+    def lap(self, stage: str, started: float) -> float:
+        now = time.perf_counter()
+        with self._lock:
+            totals = self.stages.get(stage)
+            if totals is None:
+                self.stages[stage] = [1, now - started]
+            else:
+                totals[0] += 1
+                totals[1] += now - started
+        return now
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        with self._lock:
+            for stage, totals in snapshot['stages'].items():
+                merged = self.stages.setdefault(stage, [0, 0.0])
+                merged[0] += totals['calls']
+                merged[1] += totals['seconds']
+            for counter, value in snapshot['counters'].items():
+                self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'stages': {stage: {'calls': calls, 'seconds': seconds} for stage, (calls, seconds) in self.stages.items()},
+                'counters': dict(self.counters)
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stages = {}
+            self.counters = {}
+
+    def to_prometheus(self, prefix: str = 'standardization') -> str:
+        return render_prometheus(self.snapshot(), prefix)
+
+
+class NullMetricsRecorder(MetricsRecorder):
+    enabled = False
+
+    def clock(self) -> float:
+        return 0.0
+
+    def observe(self, stage: str, started: float, calls: int = 1) -> None:
+        pass
+
+    def lap(self, stage: str, started: float) -> float:
+        return 0.0
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        pass
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        pass
+
+
+NULL_METRICS = NullMetricsRecorder()
+
+
+def diff_snapshots(after: Dict[str, Any], before: Dict[str, Any]) -> Dict[str, Any]:
+    stages = {}
+    for stage, totals in after['stages'].items():
+        previous = before['stages'].get(stage, {'calls': 0, 'seconds': 0.0})
+        if totals['calls'] != previous['calls']:
+            stages[stage] = {
+                'calls': totals['calls'] - previous['calls'],
+                'seconds': totals['seconds'] - previous['seconds']
+            }
+    counters = {
+        counter: value - before['counters'].get(counter, 0)
+        for counter, value in after['counters'].items()
+        if value != before['counters'].get(counter, 0)
+    }
+    return {'stages': stages, 'counters': counters}
+
+
+def merge_snapshots(target: Optional[Dict[str, Any]], source: Dict[str, Any]) -> Dict[str, Any]:
+    if target is None:
+        target = {'stages': {}, 'counters': {}}
+    for stage, totals in source['stages'].items():
+        merged = target['stages'].setdefault(stage, {'calls': 0, 'seconds': 0.0})
+        merged['calls'] += totals['calls']
+        merged['seconds'] += totals['seconds']
+    for counter, value in source['counters'].items():
+        target['counters'][counter] = target['counters'].get(counter, 0) + value
+    return target
+
+
+def render_prometheus(snapshot: Dict[str, Any], prefix: str = 'standardization') -> str:
+    lines = [
+        f'# HELP {prefix}_stage_seconds_total Wall time spent in a processing stage.',
+        f'# TYPE {prefix}_stage_seconds_total counter'
+    ]
+    stages = sorted(snapshot['stages'].items())
+    lines.extend(f'{prefix}_stage_seconds_total{{stage="{stage}"}} {totals["seconds"]:.6f}' for stage, totals in stages)
+    lines.extend([
+        f'# HELP {prefix}_stage_calls_total Number of times a processing stage ran.',
+        f'# TYPE {prefix}_stage_calls_total counter'
+    ])
+    lines.extend(f'{prefix}_stage_calls_total{{stage="{stage}"}} {totals["calls"]}' for stage, totals in stages)
+    lines.extend([
+        f'# HELP {prefix}_events_total Processing events such as parser fallbacks and scanned lines.',
+        f'# TYPE {prefix}_events_total counter'
+    ])
+    lines.extend(
+        f'{prefix}_events_total{{event="{counter}"}} {value}' for counter, value in sorted(snapshot['counters'].items())
+    )
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,93 @@
+import cProfile
+import heapq
+import itertools
+import os
+import re
+import threading
+from typing import List, Dict, Any, Optional
+
+UNSAFE_FILENAME_CHARS = re.compile(r'[^\w.\-]+')
+
+
+class SlowInputProfiler:
+    def __init__(self, top_n: int = 20, profile_threshold_seconds: Optional[float] = None,
+                 profile_output_dir: Optional[str] = None):
+        self.top_n = top_n
+        self.profile_threshold_seconds = profile_threshold_seconds
+        self.profile_output_dir = profile_output_dir
+        self._files = []
+        self._rows = []
+        self._sequence = itertools.count()
+        self._profiles_written = 0
+        self._lock = threading.Lock()
+
+    def record_file(self, seconds: float, record: Dict[str, Any]) -> None:
+        self._push('_files', seconds, record)
+
+    def record_row(self, seconds: float, record: Dict[str, Any]) -> None:
+        self._push('_rows', seconds, record)
+
+    def is_slow_row(self, seconds: float) -> bool:
+        rows = self._rows
+        return self.top_n > 0 and (len(rows) < self.top_n or seconds > rows[0][0])
+
+    def should_profile(self, seconds: float) -> bool:
+        return (
+            self.profile_output_dir is not None
+            and self.profile_threshold_seconds is not None
+            and seconds >= self.profile_threshold_seconds
+        )
+
+    def new_profile(self) -> Optional[cProfile.Profile]:
+        # the profile wraps the real run; it is written out only if the file turns out to be slow
+        if self.profile_output_dir is None or self.profile_threshold_seconds is None:
+            return None
+        return cProfile.Profile()
+
+    def write_profile(self, filename: str, profile: cProfile.Profile, input_json: str) -> str:
+        os.makedirs(self.profile_output_dir, exist_ok=True)
+        with self._lock:
+            number = self._profiles_written
+            self._profiles_written += 1
+        base_path = os.path.join(
+            self.profile_output_dir, f"{number:04d}_{UNSAFE_FILENAME_CHARS.sub('_', filename)}"
+        )
+        profile.dump_stats(base_path + '.prof')
+        with open(base_path + '.json', 'w', encoding='utf-8') as f:
+            f.write(input_json)
+        return base_path + '.prof'
+
+    def slowest_files(self) -> List[Dict[str, Any]]:
+        return self._sorted(self._files)
+
+    def slowest_rows(self) -> List[Dict[str, Any]]:
+        return self._sorted(self._rows)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'slowest_files': self.slowest_files(),
+            'slowest_rows': self.slowest_rows(),
+            'profiles_written': self._profiles_written
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._files = []
+            self._rows = []
+
+    def _push(self, heap_name: str, seconds: float, record: Dict[str, Any]) -> None:
+        if self.top_n <= 0:
+            return
+        record['seconds'] = seconds
+        item = (seconds, next(self._sequence), record)
+        with self._lock:
+            heap = getattr(self, heap_name)
+            if len(heap) < self.top_n:
+                heapq.heappush(heap, item)
+            elif seconds > heap[0][0]:
+                heapq.heapreplace(heap, item)
+
+    def _sorted(self, heap: list) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = sorted(heap, key=lambda item: (-item[0], item[1]))
+        return [dict(record) for _, _, record in items]
@@ -0,0 +1,128 @@
+import io
+import json
+import tempfile
+from typing import Any, Dict, Iterable, List, IO, Literal
+from src.utils.constants import RESPONSE_MEMORY_BUDGET
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+class _SpillableBuffer:
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+        self.shards = []
+        self.count = 0
+
+    def append(self, text: str) -> None:
+        self.chunks.append(text)
+        self.size += len(text)
+        self.count += 1
+
+    def spill(self) -> None:
+        if not self.chunks:
+            return
+        shard = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+        shard.write(','.join(self.chunks))
+        self.shards.append(shard)
+        self.chunks = []
+        self.size = 0
+
+    def write_to(self, write) -> None:
+        first = True
+        for shard in self.shards:
+            shard.seek(0)
+            if not first:
+                write(',')
+            while True:
+                block = shard.read(1 << 20)
+                if not block:
+                    break
+                write(block)
+            first = False
+        if self.chunks:
+            if not first:
+                write(',')
+            write(','.join(self.chunks))
+
+    def close(self) -> None:
+        for shard in self.shards:
+            shard.close()
+        self.shards = []
+        self.chunks = []
+
+
+class ResponseStreamWriter:
+    # json mode writes transactions as soon as a file is done and keeps only the small per-file
+    # entries, so status and summary come last: {"standardized_transactions", "file_results", "status", "summary"}
+    def __init__(self, output: IO, mode: Literal["json", "ndjson"] = "json",
+                 memory_budget: int = RESPONSE_MEMORY_BUDGET):
+        if mode not in ("json", "ndjson"):
+            raise ValueError(f"Неподдерживаемый формат вывода: {mode}")
+        self.output = output
+        self.mode = mode
+        self.memory_budget = memory_budget
+        self.binary = not isinstance(output, io.TextIOBase)
+        self.file_results = _SpillableBuffer()
+        self.transactions_written = 0
+        self.spilled_shards = 0
+        self.started = False
+        self.closed = False
+
+    def add_file(self, file_data: Dict[str, Any], transactions: Iterable[Dict[str, Any]]) -> None:
+        if self.mode == "ndjson":
+            for transaction in transactions:
+                self._write(_dumps({"record_type": "transaction", **transaction}) + '\n')
+            self._write(_dumps({"record_type": "file_result", **file_data}) + '\n')
+            return
+        self._start()
+        for transaction in transactions:
+            self._write((',' if self.transactions_written else '') + _dumps(transaction))
+            self.transactions_written += 1
+        self.file_results.append(_dumps(file_data))
+        if self.file_results.size > self.memory_budget:
+            self.file_results.spill()
+            self.spilled_shards += 1
+
+    def finish(self, summary: Dict[str, Any]) -> None:
+        if self.mode == "ndjson":
+            self._write(_dumps({"record_type": "summary", "status": "success", "summary": summary}) + '\n')
+        else:
+            self._write_tail({"status": "success", "summary": summary})
+        self.close()
+
+    def fail(self, error: Dict[str, Any]) -> None:
+        if self.mode == "ndjson":
+            self._write(_dumps({"record_type": "error", **error}) + '\n')
+        elif self.started:
+            # transactions are already on the wire, so the error closes the same object
+            self._write_tail(error)
+        else:
+            self._write(_dumps(error))
+        self.close()
+
+    def close(self) -> None:
+        if not self.closed:
+            self.file_results.close()
+            self.closed = True
+            if hasattr(self.output, 'flush'):
+                self.output.flush()
+
+    def _start(self) -> None:
+        if not self.started:
+            self._write('{"standardized_transactions": [')
+            self.started = True
+
+    def _write_tail(self, fields: Dict[str, Any]) -> None:
+        self._start()
+        self._write('], "file_results": [')
+        self.file_results.write_to(self._write)
+        self._write(']')
+        for key, value in fields.items():
+            self._write(', ' + _dumps(key) + ': ' + _dumps(value))
+        self._write('}')
+
+    def _write(self, text: str) -> None:
+        self.output.write(text.encode('utf-8') if self.binary else text)
@@ -0,0 +1,192 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+from src.utils.cache import LRUCache
+from src.utils.constants import RESULT_CACHE_MAX_BYTES
+
+RESULT_CACHE_COUNTERS = ('memory_hits', 'disk_hits', 'coalesced', 'misses')
+
+
+def content_key(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        encoded = part.encode('utf-8')
+        digest.update(len(encoded).to_bytes(8, 'little'))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class SQLiteResultStore:
+    def __init__(self, path: str, max_bytes: int = RESULT_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS results '
+            '(key TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+        # running total, so a put never scans the table; writes from other processes sharing the
+        # file are only seen after the store is reopened
+        self.total_bytes = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connection.execute('SELECT payload FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute('UPDATE results SET accessed = ? WHERE key = ?', (time.time(), key))
+            return row[0]
+
+    def put(self, key: str, payload: bytes) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            row = self._connection.execute('SELECT size FROM results WHERE key = ?', (key,)).fetchone()
+            self._connection.execute(
+                'INSERT OR REPLACE INTO results (key, payload, size, accessed) VALUES (?, ?, ?, ?)',
+                (key, payload, len(payload), time.time())
+            )
+            self.total_bytes += len(payload) - (row[0] if row else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        total = self.total_bytes
+        evicted = []
+        cursor = self._connection.execute('SELECT key, size FROM results ORDER BY accessed')
+        for key, size in cursor:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        cursor.close()
+        self._connection.executemany('DELETE FROM results WHERE key = ?', evicted)
+        self.total_bytes = total
+        self.evictions += len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._connection.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results'
+            ).fetchone()
+        return {
+            'path': self.path, 'entries': entries, 'bytes': size,
+            'max_bytes': self.max_bytes, 'evictions': self.evictions
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class ResultCache:
+    # values are stored pickled, so every caller gets its own copy and may mutate it freely
+    def __init__(self, capacity: int, path: Optional[str] = None, max_bytes: int = RESULT_CACHE_MAX_BYTES):
+        self.memory = LRUCache(capacity)
+        self.disk = SQLiteResultStore(path, max_bytes) if path else None
+        self.counters = dict.fromkeys(RESULT_CACHE_COUNTERS, 0)
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any],
+                       cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        payload = self._lookup(key)
+        if payload is not None:
+            return pickle.loads(payload)
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.counters['coalesced'] += 1
+        if not leader:
+            return pickle.loads(future.result())
+        try:
+            # another leader may have finished between the first lookup and the registration above
+            payload = self._lookup(key)
+            if payload is not None:
+                future.set_result(payload)
+                return pickle.loads(payload)
+            self._count('misses')
+            value = compute()
+            payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            if cacheable is None or cacheable(value):
+                self.put(key, payload)
+            future.set_result(payload)
+            return value
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def get(self, key: str) -> Optional[Any]:
+        payload = self._lookup(key)
+        if payload is None:
+            self._count('misses')
+            return None
+        return pickle.loads(payload)
+
+    def put(self, key: str, payload: bytes) -> None:
+        self.memory.put(key, payload)
+        if self.disk is not None:
+            self.disk.put(key, payload)
+
+    def store(self, key: str, value: Any) -> None:
+        self.put(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+    def _lookup(self, key: str) -> Optional[bytes]:
+        payload = self.memory.get(key)
+        if payload is not None:
+            self._count('memory_hits')
+            return payload
+        if self.disk is None:
+            return None
+        payload = self.disk.get(key)
+        if payload is not None:
+            self.memory.put(key, payload)
+            self._count('disk_hits')
+        return payload
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self.counters[counter] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters)
+
+    def summary(self, since: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        counters = self.snapshot()
+        if since is not None:
+            counters = {name: value - since.get(name, 0) for name, value in counters.items()}
+        lookups = sum(counters.values())
+        summary = dict(counters, lookups=lookups)
+        summary['hit_rate'] = (lookups - counters['misses']) / lookups * 100 if lookups else 0
+        summary['memory_hit_rate'] = counters['memory_hits'] / lookups * 100 if lookups else 0
+        summary['disk_hit_rate'] = counters['disk_hits'] / lookups * 100 if lookups else 0
+        return summary
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.summary()
+        stats['memory'] = self.memory.stats()
+        if self.disk is not None:
+            stats['disk'] = self.disk.stats()
+        return stats
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
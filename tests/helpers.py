@@ -0,0 +1,32 @@
+from src.models.parser_models import ParsedFileResult
+
+
+def golden_view(transaction):
+    data = transaction.model_dump(exclude={'transaction_id'})
+    data['data_quality_flags'] = sorted(data['data_quality_flags'])
+    return data
+
+
+def make_parsed_batch(count):
+    batch = []
+    for i in range(count):
+        batch.append(ParsedFileResult(
+            filename=f"statement_{i}.csv",
+            extracted_tables=[[
+                {"transaction_date": "19.06.2025", "description": f"Оплата {i}",
+                 "debit": f"{i + 1} 000 тг", "credit": None},
+                {"transaction_date": 20250619, "description": "Ошибка", "debit": "100"}
+            ]],
+            extracted_text="20.06.2025 Перевод 2 500 тг" if i % 3 == 0 else ""
+        ))
+    batch.append(ParsedFileResult(filename="broken.pdf", error="Parse error"))
+    return batch
+
+
+def file_view(file_result):
+    return (
+        file_result.filename,
+        [t.model_dump(exclude={'transaction_id'}) for t in file_result.successful_transactions],
+        file_result.failed_transactions,
+        file_result.processing_summary
+    )
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from src.api_interface import DataStandardizationAPI
+from src.async_api_interface import AsyncDataStandardizationAPI
+
+
+def make_parser_output(count):
+    return [
+        {
+            "filename": f"statement_{i}.csv",
+            "extracted_tables": [[
+                {"transaction_date": "19.06.2025", "description": f"Оплата {i}",
+                 "debit": "1000 тг", "credit": None, "currency": "KZT"}
+            ]],
+            "extracted_text": "",
+            "error": None
+        }
+        for i in range(count)
+    ]
+
+
+class TestAsyncAPI(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.api = AsyncDataStandardizationAPI(max_concurrent_files=2)
+
+    async def asyncTearDown(self):
+        self.api.close()
+
+    async def test_same_response_as_sync_api(self):
+        parser_output = make_parser_output(5)
+        response = await self.api.process_parser_output(parser_output)
+        expected = DataStandardizationAPI().process_parser_output(parser_output)
+        self.assertEqual(response["status"], "success")
+        self.assertEqual(response["summary"], expected["summary"])
+        self.assertEqual(
+            [t["description_clean"] for t in response["standardized_transactions"]],
+            [t["description_clean"] for t in expected["standardized_transactions"]]
+        )
+
+    async def test_concurrency_is_bounded(self):
+        original = self.api.service.process_parsed_file
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def tracked(parsed_file):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return original(parsed_file)
+
+        self.api.service.process_parsed_file = tracked
+        response = await self.api.process_parser_output(make_parser_output(8))
+        self.assertEqual(response["summary"]["total_files"], 8)
+        self.assertLessEqual(state["peak"], 2)
+
+    async def test_timeout_returns_error(self):
+        original = self.api.service.process_parsed_file
+
+        def slow(parsed_file):
+            time.sleep(0.2)
+            return original(parsed_file)
+
+        self.api.service.process_parsed_file = slow
+        response = await self.api.process_single_file(make_parser_output(1)[0], timeout=0.01)
+        self.assertEqual(response["status"], "error")
+        self.assertEqual(response["error_type"], "TimeoutError")
+
+    async def test_timed_out_file_keeps_its_slot(self):
+        api = AsyncDataStandardizationAPI(max_concurrent_files=1)
+        self.addCleanup(api.close)
+        original = api.service.process_parsed_file
+        release = threading.Event()
+
+        def blocked(parsed_file):
+            release.wait(5)
+            return original(parsed_file)
+
+        api.service.process_parsed_file = blocked
+        response = await api.process_single_file(make_parser_output(1)[0], timeout=0.01)
+        self.assertEqual(response["error_type"], "TimeoutError")
+        semaphore = api._semaphores[asyncio.get_running_loop()]
+        self.assertTrue(semaphore.locked())
+        release.set()
+        for _ in range(500):
+            if not semaphore.locked():
+                break
+            await asyncio.sleep(0.01)
+        self.assertFalse(semaphore.locked())
+        api.service.process_parsed_file = original
+        response = await api.process_parser_output(make_parser_output(2))
+        self.assertEqual(response["summary"]["total_files"], 2)
+
+    async def test_cpu_work_runs_off_the_event_loop(self):
+        loop_thread = threading.current_thread()
+        threads = []
+        parse = self.api.service._parse_file_input
+        build = self.api.api._build_response
+
+        def tracked_parse(file_data):
+            threads.append(threading.current_thread())
+            return parse(file_data)
+
+        def tracked_build(result):
+            threads.append(threading.current_thread())
+            return build(result)
+
+        self.api.service._parse_file_input = tracked_parse
+        self.api.api._build_response = tracked_build
+        response = await self.api.process_parser_output(make_parser_output(3))
+        self.assertEqual(response["status"], "success")
+        self.assertEqual(len(threads), 4)
+        self.assertNotIn(loop_thread, threads)
+
+    async def test_process_pool_needs_worker_initializer(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(ValueError):
+                AsyncDataStandardizationAPI(executor=executor)
+        executor = self.api.service.parallel_processor.create_executor(1)
+        with executor:
+            api = AsyncDataStandardizationAPI(executor=executor)
+            response = await api.process_parser_output(make_parser_output(2))
+        self.assertEqual(response["summary"]["total_files"], 2)
+
+    async def test_health_check(self):
+        health = await self.api.health_check()
+        self.assertEqual(health["status"], "healthy")
+        self.assertEqual(health["service_info"]["async"]["max_concurrent_files"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
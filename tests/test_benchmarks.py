@@ -0,0 +1,36 @@
+import unittest
+from benchmarks.generator import ParserOutputGenerator
+from benchmarks.runner import BenchmarkSuite, compare_results, percentile
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_generator_is_seeded(self):
+        first = ParserOutputGenerator(7).generate(files=60, rows_per_table=10)
+        self.assertEqual(first, ParserOutputGenerator(7).generate(files=60, rows_per_table=10))
+        self.assertNotEqual(first, ParserOutputGenerator(8).generate(files=60, rows_per_table=10))
+        self.assertTrue(any(file_data['error'] for file_data in first))
+        self.assertTrue(any(file_data['extracted_text'] for file_data in first))
+
+    def test_suite_reports_metrics(self):
+        results = BenchmarkSuite(files=6, rows_per_table=5, seed=3, repeat=1).run()
+        self.assertEqual(results['meta']['seed'], 3)
+        for metrics in results['benchmarks'].values():
+            for key in ('rows', 'rows_per_sec', 'p50_ms', 'p99_ms', 'peak_memory_mb'):
+                self.assertIn(key, metrics)
+        self.assertEqual(compare_results(results, results), [])
+
+    def test_compare_detects_regressions(self):
+        baseline = {'benchmarks': {'end_to_end': {'rows_per_sec': 1000.0, 'p99_ms': 10.0, 'p50_ms': 0.01}}}
+        current = {'benchmarks': {'end_to_end': {'rows_per_sec': 600.0, 'p99_ms': 12.0, 'p50_ms': 0.05}}}
+        regressions = compare_results(current, baseline, tolerance=0.3)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith('end_to_end.rows_per_sec'))
+        self.assertEqual(compare_results({'benchmarks': {}}, baseline), ['end_to_end: missing from current run'])
+
+    def test_percentile(self):
+        self.assertEqual(percentile([3.0, 1.0, 2.0], 0.5), 2.0)
+        self.assertEqual(percentile([], 0.99), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from src.utils.cache import LRUCache
+from src.processors.main_processor import DataStandardizationService
+from src.processors.date_processor import DateProcessor
+from src.processors.amount_processor import AmountProcessor
+from src.models.parser_models import ProcessingConfig
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(capacity=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        stats = cache.stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+
+    def test_zero_capacity_disables_storage(self):
+        cache = LRUCache(capacity=0)
+        cache.put('a', 1)
+        self.assertEqual(len(cache), 0)
+
+
+class TestProcessorCaching(unittest.TestCase):
+    def test_cached_results_are_independent_copies(self):
+        processor = AmountProcessor(LRUCache(capacity=10))
+        _, flags = processor.clean_amount("abc")
+        flags.append('mutated')
+        _, flags = processor.clean_amount("abc")
+        self.assertEqual(flags, ['amount_format_unclear'])
+        self.assertEqual(processor.cache.hits, 1)
+
+    def test_current_date_fallback_is_not_cached(self):
+        cache = LRUCache(capacity=10)
+        processor = DateProcessor(cache)
+        processor.standardize_date("invalid_date")
+        processor.standardize_date("invalid_date")
+        self.assertEqual(len(cache), 0)
+        processor.standardize_date("19.06.2025")
+        result, flags = processor.standardize_date("19.06.2025")
+        self.assertEqual(result, "2025-06-19T00:00:00Z")
+        self.assertEqual(cache.hits, 1)
+
+    def test_date_cache_is_keyed_by_format(self):
+        processor = DateProcessor(LRUCache(10))
+        self.assertEqual(processor.standardize_date('02/01/2025', '%m/%d/%Y')[0], '2025-02-01T00:00:00Z')
+        self.assertEqual(processor.standardize_date('02/01/2025')[0], '2025-01-02T00:00:00Z')
+        self.assertEqual(processor.standardize_date('02/01/2025', '%m/%d/%Y')[0], '2025-02-01T00:00:00Z')
+
+    def test_health_check_reports_cache_counters(self):
+        service = DataStandardizationService(processing_config=ProcessingConfig(cache_size=100))
+        raw_data = {"transaction_date": "19.06.2025", "description": "Тест", "debit": "1000 тг"}
+        service.process_batch([raw_data, raw_data])
+        cache_stats = service.get_health_check()['cache']
+        self.assertEqual(cache_stats['capacity'], 100)
+        self.assertGreater(cache_stats['hits'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.cli import run, find_input_files, output_path_for, MANIFEST_NAME
+
+PARSER_OUTPUT = [
+    {
+        "filename": "statement.csv",
+        "extracted_tables": [[
+            {"transaction_date": "19.06.2025", "description": "Оплата", "debit": "15 000 тг", "credit": None},
+            {"transaction_date": "20.06.2025", "description": "Зарплата", "debit": None, "credit": "500000"}
+        ]],
+        "extracted_text": "",
+        "error": None
+    },
+    {"filename": "broken.pdf", "extracted_tables": [], "extracted_text": "", "error": "Parse error"}
+]
+
+
+class TestBatchCLI(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_dir = os.path.join(self.temp_dir.name, 'input')
+        self.output_dir = os.path.join(self.temp_dir.name, 'output')
+        os.makedirs(os.path.join(self.input_dir, 'nested'))
+        with open(os.path.join(self.input_dir, 'day1.json'), 'w', encoding='utf-8') as f:
+            json.dump(PARSER_OUTPUT, f, ensure_ascii=False)
+        with gzip.open(os.path.join(self.input_dir, 'nested', 'day2.ndjson.gz'), 'wt', encoding='utf-8') as f:
+            f.write('\n'.join(json.dumps(item, ensure_ascii=False) for item in PARSER_OUTPUT))
+        with open(os.path.join(self.input_dir, 'notes.txt'), 'w') as f:
+            f.write('ignored')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_cli(self, **kwargs):
+        stream = io.StringIO()
+        code = run(self.input_dir, self.output_dir, stream=stream, **kwargs)
+        return code, stream.getvalue()
+
+    def test_writes_golden_records_and_resumes(self):
+        self.assertEqual(find_input_files(self.input_dir), ['day1.json', os.path.join('nested', 'day2.ndjson.gz')])
+        code, log = self.run_cli()
+        self.assertEqual(code, 0)
+        self.assertIn('[2/2]', log)
+        output_path = output_path_for(self.output_dir, os.path.join('nested', 'day2.ndjson.gz'))
+        self.assertTrue(output_path.endswith(os.path.join('nested', 'day2.golden.ndjson')))
+        with open(output_path, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r['record_type'] for r in records].count('transaction'), 2)
+        with open(os.path.join(self.output_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            manifest = json.load(f)['files']
+        self.assertEqual(manifest['day1.json']['successful_transactions'], 2)
+        modified = os.path.getmtime(output_path)
+        code, log = self.run_cli()
+        self.assertEqual(code, 0)
+        self.assertIn('к обработке: 0, уже обработано: 2', log)
+        self.assertEqual(os.path.getmtime(output_path), modified)
+
+    def test_output_inside_input_is_not_read_back(self):
+        self.output_dir = os.path.join(self.input_dir, 'golden')
+        self.assertEqual(self.run_cli()[0], 0)
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, MANIFEST_NAME)))
+        self.assertEqual(find_input_files(self.input_dir, self.output_dir),
+                         ['day1.json', os.path.join('nested', 'day2.ndjson.gz')])
+        code, log = self.run_cli()
+        self.assertEqual(code, 0)
+        self.assertIn('к обработке: 0, уже обработано: 2', log)
+
+    def test_failure_rate_exit_code_and_parallel_workers(self):
+        with open(os.path.join(self.input_dir, 'truncated.json'), 'w', encoding='utf-8') as f:
+            f.write('[{"filename": "a.csv"},')
+        code, log = self.run_cli(workers=2)
+        self.assertEqual(code, 1)
+        self.assertIn('Ошибка в truncated.json', log)
+        self.assertFalse(os.path.exists(output_path_for(self.output_dir, 'truncated.json') + '.part'))
+        code, log = self.run_cli(max_failure_rate=0.5)
+        self.assertEqual(code, 0)
+        self.assertIn('к обработке: 1', log)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import importlib.util
+import io
+import os
+import tempfile
+import unittest
+import pandas as pd
+from src.api_interface import DataStandardizationAPI
+from src.processors.main_processor import DataStandardizationService
+from src.models.parser_models import ProcessingConfig
+from src.utils.columnar_export import (
+    ColumnarExportWriter, EXPORT_COLUMNS, decode_flag_bitmask, flag_bitmask
+)
+
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+PARSER_OUTPUT = [
+    {"filename": "a.csv", "extracted_tables": [[
+        {"transaction_date": "19.06.2025", "description": "Оплата за хостинг", "debit": "15 000 тг"},
+        {"transaction_date": "20.06.2025", "description": "Зарплата", "credit": "500000,50 ₸"},
+        {"transaction_date": "19/06/25", "description": "Кофе @ кафе", "debit": "1,500.50", "currency": "usd"},
+    ]]},
+    {"filename": "b.pdf", "extracted_text": "21.06.2025 Покупка в магазине 4600 тг"},
+]
+
+
+class TestColumnarExport(unittest.TestCase):
+    def process(self, **config):
+        service = DataStandardizationService(processing_config=ProcessingConfig(**config))
+        return service.process_json_input(PARSER_OUTPUT)
+
+    def test_typed_columns(self):
+        frame = self.process().to_dataframe()
+        self.assertEqual(list(frame.columns), EXPORT_COLUMNS)
+        self.assertEqual(len(frame), 4)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(frame['transaction_date']))
+        self.assertEqual(frame['amount'].dtype, 'float64')
+        self.assertEqual(frame['amount_minor'].dtype, 'int64')
+        self.assertEqual(frame['quality_flags_mask'].dtype, 'int64')
+        for column in ('source_file', 'currency', 'transaction_type', 'source_account'):
+            self.assertIsInstance(frame[column].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(frame['transaction_type'].cat.categories), ['DEBIT', 'CREDIT'])
+        self.assertEqual(frame['amount_minor'].tolist(), [1500000, 50000050, 150050, 460000])
+        self.assertEqual(frame['transaction_date'].iloc[0], pd.Timestamp('2025-06-19', tz='UTC'))
+
+    def test_flags_bitmask_round_trip(self):
+        result = self.process()
+        frame = result.to_dataframe()
+        transactions = [t for file_result in result.file_results for t in file_result.successful_transactions]
+        for transaction, mask in zip(transactions, frame['quality_flags_mask']):
+            self.assertEqual(sorted(decode_flag_bitmask(mask)), sorted(transaction.data_quality_flags))
+        self.assertEqual(flag_bitmask([]), 0)
+        self.assertEqual(decode_flag_bitmask(flag_bitmask(['currency_assumed', 'amount_format_unclear'])),
+                         ['amount_format_unclear', 'currency_assumed'])
+
+    def test_compact_results_export_the_same_frame(self):
+        frame = self.process(deterministic_ids=True).to_dataframe()
+        compact = self.process(deterministic_ids=True, compact_results=True).to_dataframe()
+        pd.testing.assert_frame_equal(frame, compact)
+
+    def test_csv_is_written_in_row_groups(self):
+        result = self.process()
+        output = io.StringIO()
+        with ColumnarExportWriter(output, "csv", row_group_size=3) as writer:
+            for file_result in result.file_results:
+                writer.add_file(file_result)
+        self.assertEqual((writer.rows_written, writer.row_groups), (4, 2))
+        written = pd.read_csv(io.StringIO(output.getvalue()))
+        frame = result.to_dataframe()
+        self.assertEqual(list(written.columns), EXPORT_COLUMNS)
+        self.assertEqual(written['transaction_id'].tolist(), frame['transaction_id'].tolist())
+        self.assertEqual(written['transaction_date'].iloc[0], '2025-06-19T00:00:00Z')
+        self.assertEqual(written['quality_flags_mask'].tolist(), frame['quality_flags_mask'].tolist())
+
+    def test_empty_csv_has_header(self):
+        output = io.StringIO()
+        ColumnarExportWriter(output, "csv").close()
+        self.assertEqual(output.getvalue().strip(), ','.join(EXPORT_COLUMNS))
+
+    def test_api_streams_export_to_file(self):
+        api = DataStandardizationAPI()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'golden.csv')
+            response = api.export_parser_output(PARSER_OUTPUT, path, "csv", row_group_size=2)
+            self.assertEqual(response['status'], 'success')
+            self.assertEqual((response['rows_written'], response['row_groups']), (4, 2))
+            self.assertEqual(len(pd.read_csv(path)), 4)
+        self.assertEqual(api.export_parser_output(PARSER_OUTPUT, io.StringIO(), "xlsx")['status'], 'error')
+
+    @unittest.skipIf(HAS_PYARROW, "pyarrow установлен")
+    def test_parquet_requires_pyarrow(self):
+        with self.assertRaises(ImportError):
+            ColumnarExportWriter(io.BytesIO(), "parquet")
+
+    @unittest.skipUnless(HAS_PYARROW, "нужен pyarrow")
+    def test_parquet_round_trip(self):
+        result = self.process()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'golden.parquet')
+            self.assertEqual(result.to_parquet(path, row_group_size=3), 4)
+            import pyarrow.parquet as pq
+            self.assertEqual(pq.ParquetFile(path).num_row_groups, 2)
+            written = pd.read_parquet(path)
+        self.assertEqual(written['transaction_id'].tolist(), result.to_dataframe()['transaction_id'].tolist())
+        self.assertEqual(written['amount_minor'].tolist(), [1500000, 50000050, 150050, 460000])
+
+
+if __name__ == '__main__':
+    unittest.main()
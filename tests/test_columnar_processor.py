@@ -0,0 +1,63 @@
+import unittest
+from src.processors.main_processor import DataStandardizationService
+from src.models.parser_models import ProcessingConfig
+from tests.helpers import golden_view
+
+
+class TestColumnarEngine(unittest.TestCase):
+    def setUp(self):
+        self.row_service = DataStandardizationService()
+        self.columnar_service = DataStandardizationService(
+            processing_config=ProcessingConfig(engine="columnar")
+        )
+        self.raw_transactions = [
+            {"transaction_date": "19.06.2025", "description": "Оплата за хостинг PS.KZ ",
+             "debit": "15 000 тг", "credit": None, "currency": "KZT"},
+            {"transaction_date": "20.06.2025", "description": "Получение зарплаты",
+             "debit": None, "credit": "500000 ₸", "currency": "KZT"},
+            {"transaction_date": "22.06.2025", "description": "Платеж поставщику",
+             "amount": "-75000", "currency": "KZT"},
+            {"transaction_date": "2025-06-19", "description": "Тест\tс\nсимволами",
+             "debit": "1.500,50", "credit": None},
+            {"transaction_date": "19/06/25", "description": "Кофе @ кафе",
+             "debit": "1,500.50", "credit": "200", "currency": "usd"},
+            {"transaction_date": "1.6.2025", "description": "", "debit": None, "credit": None},
+            {"transaction_date": "June 19 2025", "description": "Refund",
+             "amount": 125.5, "currency": "€"},
+            {"transaction_date": "19.06.2025", "description": "Комиссия",
+             "debit": "abc", "credit": None, "currency": "  "},
+            {"transaction_date": "19.06.2025", "description": "Без валюты",
+             "credit": "100 руб", "debit": 0},
+            {"transaction_date": "19.06.2025", "description": "Null",
+             "amount": "null", "currency": "XYZ"},
+            {"transaction_date": 20250619, "description": "Неверная дата", "debit": "100"},
+            {"description": "Нет даты", "debit": "100"},
+            {"transaction_date": "19.06.2025", "description": "Целое", "debit": 300, "credit": None},
+        ]
+
+    def test_same_golden_records_as_row_engine(self):
+        row_result = self.row_service.process_batch(self.raw_transactions)
+        columnar_result = self.columnar_service.process_batch(self.raw_transactions)
+        self.assertEqual(
+            [golden_view(t) for t in columnar_result.successful_transactions],
+            [golden_view(t) for t in row_result.successful_transactions]
+        )
+        self.assertEqual(columnar_result.processing_summary, row_result.processing_summary)
+
+    def test_failed_transactions_keep_original_indices(self):
+        row_result = self.row_service.process_batch(self.raw_transactions)
+        columnar_result = self.columnar_service.process_batch(self.raw_transactions)
+        self.assertEqual(
+            [(f['index'], f['error_type']) for f in columnar_result.failed_transactions],
+            [(f['index'], f['error_type']) for f in row_result.failed_transactions]
+        )
+        self.assertEqual([f['index'] for f in columnar_result.failed_transactions], [10, 11])
+
+    def test_empty_batch(self):
+        result = self.columnar_service.process_batch([])
+        self.assertEqual(result.successful_transactions, [])
+        self.assertEqual(result.processing_summary['total_transactions'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import pickle
+import unittest
+from src.processors.main_processor import DataStandardizationService
+from src.models.parser_models import ParsedFileResult, ProcessingConfig
+from src.models.table_models import ColumnarTable
+from tests.helpers import golden_view
+
+COLUMNS = ['transaction_date', 'description', 'debit', 'credit', 'amount', 'currency']
+
+ROWS = [
+    ["19.06.2025", "Оплата за хостинг PS.KZ ", "15 000 тг", None, None, "KZT"],
+    ["20.06.2025", "Получение зарплаты", None, "500000 ₸", None, "KZT"],
+    ["22.06.2025", "Платеж поставщику", None, None, "-75000", "KZT"],
+    ["19/06/25", "Кофе @ кафе", "1,500.50", "200", None, "usd"],
+    ["June 19 2025", "Refund", None, None, 125.5, "€"],
+    [20250619, "Неверная дата", "100", None, None, None],
+    ["19.06.2025", "Целое", 300, None, None, None],
+    [None, "Нет даты", "100", None, None, None],
+]
+
+
+def dict_table():
+    return [dict(zip(COLUMNS, row)) for row in ROWS]
+
+
+def column_data():
+    return [list(values) for values in zip(*ROWS)]
+
+
+class TestColumnarTables(unittest.TestCase):
+    def process(self, table, **config):
+        service = DataStandardizationService(processing_config=ProcessingConfig(**config))
+        return service.process_parsed_file(ParsedFileResult(filename="statement.csv", extracted_tables=[table]))
+
+    def assert_same_results(self, **config):
+        expected = self.process(dict_table(), **config)
+        for table in ({"columns": COLUMNS, "data": column_data()}, {"columns": COLUMNS, "rows": ROWS}):
+            result = self.process(table, **config)
+            self.assertEqual(
+                [golden_view(t) for t in result.successful_transactions],
+                [golden_view(t) for t in expected.successful_transactions]
+            )
+            self.assertEqual(result.processing_summary, expected.processing_summary)
+            self.assertEqual(result.failed_transactions, expected.failed_transactions)
+
+    def test_row_engine_matches_dict_tables(self):
+        self.assert_same_results()
+
+    def test_columnar_engine_matches_dict_tables(self):
+        self.assert_same_results(engine="columnar")
+
+    def test_validation_codes_match_dict_tables(self):
+        self.assert_same_results(validation_mode="codes")
+        self.assert_same_results(engine="columnar", validation_mode="codes")
+
+    def test_failed_rows_are_plain_dicts(self):
+        result = self.process({"columns": COLUMNS, "rows": ROWS}, engine="columnar")
+        self.assertEqual([f['index'] for f in result.failed_transactions], [5, 7])
+        self.assertEqual(result.failed_transactions[0]['original_data'], dict_table()[5])
+        self.assertIs(type(result.failed_transactions[0]['original_data']), dict)
+        json.loads(result.model_dump_json())
+        pickle.loads(pickle.dumps(result))
+
+    def test_json_input_accepts_both_forms(self):
+        service = DataStandardizationService()
+        result = service.process_json_input([
+            {"filename": "a.csv", "extracted_tables": [dict_table(), {"columns": COLUMNS, "data": column_data()}]}
+        ])
+        self.assertEqual(result.total_transactions, 2 * len(ROWS))
+        file_result = result.file_results[0]
+        self.assertEqual(file_result.processing_summary['successful_count'], 2 * (len(ROWS) - 2))
+        self.assertEqual([f['index'] for f in file_result.failed_transactions], [5, 7, 13, 15])
+
+    def test_missing_columns_read_as_null(self):
+        table = ColumnarTable(columns=['transaction_date', 'description', 'amount'],
+                              data=[["19.06.2025"], ["Оплата"], ["1000 тг"]])
+        for engine in ("row", "columnar"):
+            result = self.process(table, engine=engine)
+            self.assertEqual(result.processing_summary['successful_count'], 1)
+            self.assertEqual(result.successful_transactions[0].amount, 1000.0)
+
+    def test_invalid_shapes_are_rejected(self):
+        invalid = [
+            {"columns": COLUMNS},
+            {"columns": COLUMNS, "data": column_data(), "rows": ROWS},
+            {"columns": COLUMNS, "data": column_data()[:-1]},
+            {"columns": COLUMNS, "data": column_data()[:-1] + [["KZT"]]},
+            {"columns": COLUMNS, "rows": [ROWS[0][:-1]]},
+            {"columns": ['description', 'description'], "rows": [["a", "b"]]},
+        ]
+        service = DataStandardizationService()
+        for table in invalid:
+            with self.subTest(table=table):
+                result = service.process_json_input([{"filename": "bad.csv", "extracted_tables": [table]}])
+                self.assertEqual(result.file_results[0].source_type, "error")
+
+    def test_table_length(self):
+        self.assertEqual(len(ColumnarTable(columns=COLUMNS, rows=ROWS)), len(ROWS))
+        self.assertEqual(len(ColumnarTable(columns=COLUMNS, data=column_data())), len(ROWS))
+        self.assertEqual(len(ColumnarTable(columns=COLUMNS, rows=[]).row_view()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
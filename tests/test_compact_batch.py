@@ -0,0 +1,77 @@
+import pickle
+import unittest
+from src.api_interface import DataStandardizationAPI
+from src.models.parser_models import ProcessingConfig, FileProcessingResult
+from src.models.transaction_models import StandardizedTransaction, CompactTransactionBatch, TransactionType
+from src.processors.main_processor import DataStandardizationService
+
+
+def make_transaction(i, amount=1500.5, transaction_id=None):
+    return StandardizedTransaction(
+        transaction_id=transaction_id or f"gen_uuid_{i:08x}",
+        transaction_date="2025-06-19T00:00:00Z",
+        description_raw=f"Оплата {i}",
+        description_clean=f"оплата {i}",
+        amount=amount,
+        currency="KZT",
+        transaction_type=TransactionType.CREDIT if i % 2 else TransactionType.DEBIT,
+        data_quality_flags=["currency_defaulted"] if i % 3 else []
+    )
+
+
+class TestCompactTransactionBatch(unittest.TestCase):
+    def test_lazy_models_round_trip(self):
+        transactions = [make_transaction(i) for i in range(6)]
+        transactions.append(make_transaction(6, amount=0.125, transaction_id="custom-id"))
+        transactions.append(make_transaction(7, amount=float('nan')))
+        batch = CompactTransactionBatch(transactions)
+        self.assertEqual(len(batch), 8)
+        for expected, actual in zip(transactions[:7], batch):
+            self.assertEqual(actual.model_dump(), expected.model_dump())
+        self.assertNotEqual(batch[7].amount, batch[7].amount)
+        self.assertEqual(batch[-2].transaction_id, "custom-id")
+        self.assertEqual(batch[1:3], transactions[1:3])
+        self.assertIs(batch._flags[1], batch._flags[2])
+        self.assertEqual(pickle.loads(pickle.dumps(batch[:7])), transactions[:7])
+
+    def test_extend_and_serialization(self):
+        batch = CompactTransactionBatch([make_transaction(0)])
+        batch.extend(CompactTransactionBatch([make_transaction(1), make_transaction(2)]))
+        file_result = FileProcessingResult(filename="a.csv", source_type="table", successful_transactions=batch)
+        self.assertIs(file_result.successful_transactions, batch)
+        dumped = file_result.model_dump()['successful_transactions']
+        self.assertEqual(dumped, [make_transaction(i).model_dump() for i in range(3)])
+        self.assertIn('"transaction_type":"CREDIT"', file_result.model_dump_json())
+
+    def test_services_produce_same_results(self):
+        parser_output = [{
+            "filename": "statement.csv",
+            "extracted_tables": [[
+                {"transaction_date": "19.06.2025", "description": "Оплата", "debit": "15 000 тг", "credit": None},
+                {"transaction_date": "20.06.2025", "description": "Зарплата", "debit": None, "credit": "1,5"},
+                {"transaction_date": "нет", "description": "Ошибка", "amount": "abc"}
+            ]],
+            "extracted_text": "21.06.2025 Перевод 2 500 тг"
+        }]
+        for engine in ("row", "columnar"):
+            regular = DataStandardizationAPI(processing_config=ProcessingConfig(engine=engine))
+            compact = DataStandardizationAPI(processing_config=ProcessingConfig(engine=engine, compact_results=True))
+            expected = regular.process_parser_output(parser_output)
+            actual = compact.process_parser_output(parser_output)
+            strip = lambda response: [
+                {k: v for k, v in t.items() if k != 'transaction_id'} for t in response["standardized_transactions"]
+            ]
+            self.assertEqual(strip(actual), strip(expected))
+            self.assertEqual(actual["summary"], expected["summary"])
+
+    def test_compact_batch_is_used(self):
+        service = DataStandardizationService(processing_config=ProcessingConfig(compact_results=True))
+        result = service.process_batch([
+            {"transaction_date": "19.06.2025", "description": "Оплата", "debit": "100", "credit": None}
+        ])
+        self.assertIsInstance(result.successful_transactions, CompactTransactionBatch)
+        self.assertEqual(result.successful_transactions[0].amount, 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import itertools
+import unittest
+from datetime import datetime
+from src.processors.date_processor import DateProcessor
+from src.utils.constants import DATE_FORMATS
+from src.utils.date_tokenizer import DateTokenizer
+
+
+def strptime_reference(value):
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).strftime('%Y-%m-%dT00:00:00Z'), date_format
+        except ValueError:
+            continue
+    return None
+
+
+class TestDateTokenizer(unittest.TestCase):
+    def setUp(self):
+        self.tokenizer = DateTokenizer()
+
+    def test_matches_strptime_on_numeric_formats(self):
+        days = ['1', '01', '9', '19', '29', '30', '31', '00', '0', '32', '123']
+        months = ['1', '02', '06', '12', '13', '00', '006']
+        years = ['2024', '2023', '1900', '2000', '25', '69', '68', '0000', '202', '20250']
+        values = []
+        for day, month, year in itertools.product(days, months, years):
+            for separator in './-':
+                values.append(separator.join((day, month, year)))
+                values.append(separator.join((year, month, day)))
+        values += ['19.06/2025', '19 .06.2025', '١٩.٠٦.٢٠٢٥', '2025/06/19', '2025.06.19']
+        for value in values:
+            parts = self.tokenizer.parse(value)
+            expected = strptime_reference(value)
+            with self.subTest(value=value):
+                if expected is None:
+                    self.assertTrue(parts is None or parts.date_format is None)
+                else:
+                    self.assertEqual((parts.isoformat(), parts.date_format), expected)
+
+    def test_russian_and_kazakh_month_names(self):
+        cases = {
+            '19 июня 2025': '2025-06-19',
+            '1 мая 2025 г.': '2025-05-01',
+            '3 Марта 2024 года': '2024-03-03',
+            '31 дек. 2024': '2024-12-31',
+            '19 маусым 2025': '2025-06-19',
+            '2025 жылғы 19 маусым': '2025-06-19',
+            '5 қаңтардағы 2025': '2025-01-05',
+            '12 желтоксан 2025 ж.': '2025-12-12',
+            'June 19, 2025': '2025-06-19',
+            '19 Jun 2025': '2025-06-19',
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(self.tokenizer.parse(value).isoformat(), expected + 'T00:00:00Z')
+
+    def test_rejects_impossible_and_partial_dates(self):
+        for value in ('30 февраля 2025', '19 июня', 'июнь 2025', '19 марка 2025', '19 июня 25', 'invalid'):
+            with self.subTest(value=value):
+                self.assertIsNone(self.tokenizer.parse(value))
+
+
+class TestDateProcessorFallback(unittest.TestCase):
+    def test_month_names_do_not_reach_dateutil(self):
+        processor = DateProcessor()
+        result, flags = processor.standardize_date('19 июня 2025')
+        self.assertEqual((result, flags), ('2025-06-19T00:00:00Z', []))
+        self.assertEqual(processor.standardize_date('2025/06/19')[0], '2025-06-19T00:00:00Z')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from src.api_interface import DataStandardizationAPI
+from src.processors.main_processor import DataStandardizationService
+from src.processors.deduplication import (
+    BloomFilterIndex, HashSetIndex, AdaptiveDedupIndex, transaction_digest, deterministic_transaction_id
+)
+from src.models.parser_models import ProcessingConfig
+
+
+def statement(filename, rows):
+    return {"filename": filename, "extracted_tables": [rows], "extracted_text": "", "error": None}
+
+
+ROWS = [
+    {"transaction_date": "19.06.2025", "description": "Кофе", "debit": "1500", "currency": "KZT"},
+    {"transaction_date": "19.06.2025", "description": "Кофе", "debit": "1500", "currency": "KZT"},
+    {"transaction_date": "20.06.2025", "description": "Зарплата", "credit": "500000", "currency": "KZT"},
+]
+
+
+class TestDeterministicIds(unittest.TestCase):
+    def test_ids_are_stable_across_services_and_engines(self):
+        ids = []
+        for config in (ProcessingConfig(deterministic_ids=True),
+                       ProcessingConfig(deterministic_ids=True, engine="columnar", compact_results=True)):
+            result = DataStandardizationService(processing_config=config).process_batch(ROWS)
+            ids.append([t.transaction_id for t in result.successful_transactions])
+        self.assertEqual(ids[0], ids[1])
+        self.assertEqual(len(set(ids[0])), 3)
+        self.assertTrue(ids[0][0].startswith('txn_'))
+
+
+class TestCrossFileDeduplication(unittest.TestCase):
+    def test_drop_removes_reuploaded_statement(self):
+        service = DataStandardizationService(processing_config=ProcessingConfig(deduplicate="drop"))
+        result = service.process_json_input([statement("a.xlsx", ROWS), statement("b.xlsx", ROWS)])
+        self.assertEqual(len(result.file_results[0].successful_transactions), 3)
+        self.assertEqual(len(result.file_results[1].successful_transactions), 0)
+        self.assertEqual(result.file_results[1].processing_summary['duplicate_count'], 3)
+        self.assertEqual(result.processing_summary['duplicate_transactions'], 3)
+        self.assertEqual(result.statistics.amount_statistics['KZT'].total, 503000)
+        self.assertEqual(result.statistics.successful_transactions, 3)
+        self.assertEqual((result.total_transactions, result.successful_transactions), (3, 3))
+        self.assertEqual(result.processing_summary['transaction_success_rate'], 100)
+        summary = result.file_results[1].processing_summary
+        self.assertEqual((summary['total_transactions'], summary['successful_count'], summary['success_rate']), (0, 0, 0))
+        response = DataStandardizationAPI(processing_config=ProcessingConfig(deduplicate="drop")).process_parser_output(
+            [statement("a.xlsx", ROWS), statement("b.xlsx", ROWS)]
+        )
+        self.assertEqual(len(response['standardized_transactions']), response['summary']['successful_transactions'])
+        self.assertEqual(response['file_results'][1]['transaction_count'], 0)
+
+    def test_flag_keeps_duplicates_marked(self):
+        service = DataStandardizationService(
+            processing_config=ProcessingConfig(deduplicate="flag", compact_results=True)
+        )
+        result = service.process_json_input([statement("a.xlsx", ROWS), statement("b.xlsx", ROWS[:1])])
+        duplicate = result.file_results[1].successful_transactions[0]
+        self.assertIn('duplicate_transaction', duplicate.data_quality_flags)
+        self.assertNotIn('duplicate_transaction', result.file_results[0].successful_transactions[0].data_quality_flags)
+        report = service.get_processing_statistics(result)
+        self.assertEqual(report['quality_flags_distribution']['duplicate_transaction'], 1)
+
+
+class TestDedupIndexes(unittest.TestCase):
+    def test_bloom_filter_matches_hash_set_without_false_negatives(self):
+        digests = [transaction_digest(deterministic_transaction_id(str(i))) for i in range(2000)]
+        bloom = BloomFilterIndex(2000, 0.001)
+        hashed = HashSetIndex()
+        for digest in digests:
+            self.assertEqual(bloom.add(digest), hashed.add(digest))
+        self.assertTrue(all(not bloom.add(digest) for digest in digests))
+
+    def test_adaptive_index_switches_to_bloom(self):
+        index = AdaptiveDedupIndex(10, 100, 0.01)
+        for i in range(20):
+            index.add(transaction_digest(str(i)))
+        self.assertEqual(index.kind, 'bloom')
+        self.assertFalse(index.add(transaction_digest('3')))
+
+
+class TestFuzzyDeduplication(unittest.TestCase):
+    def setUp(self):
+        self.service = DataStandardizationService(processing_config=ProcessingConfig(fuzzy_deduplicate=True))
+
+    def test_text_line_matching_table_row_is_suspected(self):
+        mixed = {
+            "filename": "mixed.pdf",
+            "extracted_tables": [[{"transaction_date": "19.06.2025", "description": "Возврат товара",
+                                   "credit": "2500", "currency": "KZT"}]],
+            "extracted_text": "19.06.2025 Возврaт товара 2500 тенге"
+        }
+        result = self.service.process_json_input([mixed])
+        table_row, text_row = result.file_results[0].successful_transactions
+        self.assertNotIn('suspected_duplicate', table_row.data_quality_flags)
+        self.assertIn('suspected_duplicate', text_row.data_quality_flags)
+        self.assertEqual(result.processing_summary['suspected_duplicates'], 1)
+
+    def test_repeated_rows_of_one_table_and_other_amounts_are_kept(self):
+        other = [dict(row, debit="1600") if row.get("debit") else row for row in ROWS[:1]]
+        result = self.service.process_json_input([statement("a.xlsx", ROWS), statement("b.xlsx", other)])
+        flags = [t.data_quality_flags for f in result.file_results for t in f.successful_transactions]
+        self.assertFalse(any('suspected_duplicate' in f for f in flags))
+
+    def test_reuploaded_file_is_suspected(self):
+        noisy = [dict(ROWS[2], description="Зарплата.")]
+        result = self.service.process_json_input([statement("a.xlsx", ROWS), statement("b.xlsx", noisy)])
+        self.assertIn('suspected_duplicate', result.file_results[1].successful_transactions[0].data_quality_flags)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from src.processors.format_inference import TableFormatInferrer
+from src.processors.main_processor import DataStandardizationService
+from src.models.parser_models import ParsedFileResult, ProcessingConfig, TransactionExtractionConfig
+from tests.helpers import golden_view
+
+
+class TestTableFormatInferrer(unittest.TestCase):
+    def setUp(self):
+        self.inferrer = TableFormatInferrer()
+
+    def test_infers_european_convention(self):
+        table = [
+            {"transaction_date": "19.06.2025", "description": "A", "debit": "1.500,50", "currency": "EUR"},
+            {"transaction_date": "20.06.2025", "description": "B", "debit": "2.000.000", "currency": "€"},
+            {"transaction_date": "21.06.2025", "description": "C", "debit": "1.500"},
+        ]
+        profile = self.inferrer.infer(table)
+        self.assertEqual(profile.date_format, '%d.%m.%Y')
+        self.assertEqual(profile.decimal_separator, ',')
+        self.assertEqual(profile.thousands_separator, '.')
+        self.assertEqual(profile.default_currency, 'EUR')
+        self.assertEqual(profile.sample_size, 3)
+
+    def test_no_evidence_leaves_fields_empty(self):
+        profile = self.inferrer.infer([{"transaction_date": "invalid", "description": "A", "debit": "1500"}])
+        self.assertIsNone(profile.date_format)
+        self.assertIsNone(profile.decimal_separator)
+        self.assertIsNone(profile.default_currency)
+
+
+class TestProfiledTableProcessing(unittest.TestCase):
+    def setUp(self):
+        self.parsed_file = ParsedFileResult(
+            filename="statement.csv",
+            extracted_tables=[[
+                {"transaction_date": "19.06.2025", "description": "A", "debit": "1.500,50", "currency": "EUR"},
+                {"transaction_date": "20.06.2025", "description": "B", "debit": "2.000.000", "currency": "EUR"},
+                {"transaction_date": "21.06.2025", "description": "C", "debit": "1.500"},
+                {"transaction_date": "2025-06-22", "description": "D", "debit": "7,25"},
+                {"transaction_date": 5, "description": "E", "debit": "1"},
+            ]],
+            extracted_text="23.06.2025 - Возврат товара 2500 тенге"
+        )
+
+    def test_table_uses_inferred_profile(self):
+        service = DataStandardizationService()
+        result = service.process_parsed_file(self.parsed_file)
+        by_description = {t.description_raw: t for t in result.successful_transactions}
+        self.assertEqual(by_description["C"].amount, 1500.0)
+        self.assertEqual(by_description["C"].currency, "EUR")
+        self.assertIn('currency_assumed', by_description["C"].data_quality_flags)
+        self.assertEqual(by_description["D"].transaction_date, "2025-06-22T00:00:00Z")
+        self.assertEqual(by_description["D"].amount, 7.25)
+        self.assertEqual([f['index'] for f in result.failed_transactions], [4])
+        self.assertEqual(result.processing_summary['total_transactions'], 6)
+        profiles = result.processing_summary['format_profiles']
+        self.assertEqual(profiles[0]['decimal_separator'], ',')
+
+    def test_columnar_engine_matches_row_engine_with_profile(self):
+        row_result = DataStandardizationService().process_parsed_file(self.parsed_file)
+        columnar_result = DataStandardizationService(
+            processing_config=ProcessingConfig(engine="columnar")
+        ).process_parsed_file(self.parsed_file)
+        self.assertEqual(
+            [golden_view(t) for t in columnar_result.successful_transactions],
+            [golden_view(t) for t in row_result.successful_transactions]
+        )
+
+    def test_configured_currency_aliases_count_as_votes(self):
+        aliases = {"бакс": "USD", "зеленые": "USD"}
+        service = DataStandardizationService(TransactionExtractionConfig(currency_aliases=aliases))
+        table = [
+            {"transaction_date": "19.06.2025", "description": "A", "debit": "100", "currency": "бакс"},
+            {"transaction_date": "20.06.2025", "description": "B", "debit": "200", "currency": "Зеленые"},
+            {"transaction_date": "21.06.2025", "description": "C", "debit": "300"},
+        ]
+        self.assertEqual(service.format_inferrer.infer(table).default_currency, "USD")
+        result = service.process_parsed_file(ParsedFileResult(filename="usd.csv", extracted_tables=[table]))
+        self.assertEqual([t.currency for t in result.successful_transactions], ["USD"] * 3)
+        self.assertIsNone(TableFormatInferrer().infer(table).default_currency)
+
+    def test_inference_can_be_disabled(self):
+        service = DataStandardizationService(processing_config=ProcessingConfig(infer_table_formats=False))
+        result = service.process_parsed_file(self.parsed_file)
+        by_description = {t.description_raw: t for t in result.successful_transactions}
+        self.assertEqual(by_description["C"].amount, 1.5)
+        self.assertNotIn('format_profiles', result.processing_summary)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import bz2
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.processors.main_processor import DataStandardizationService
+from src.utils.json_stream import iter_json_documents, JSONStreamError
+
+
+def make_parser_output(count):
+    files = []
+    for i in range(count):
+        files.append({
+            "filename": f"statement_{i}.csv",
+            "extracted_tables": [[
+                {"transaction_date": "19.06.2025", "description": f"Оплата {i}",
+                 "debit": "15 000 тг", "credit": None},
+                {"transaction_date": "20.06.2025", "description": "Зарплата",
+                 "debit": None, "credit": "500 000"}
+            ]],
+            "extracted_text": "",
+            "error": None
+        })
+    files.append({"filename": "broken.pdf", "extracted_tables": [], "extracted_text": "", "error": "Parse error"})
+    files.append({"filename": "invalid.csv", "extracted_tables": "not a table"})
+    return files
+
+
+class TestJSONStream(unittest.TestCase):
+    def setUp(self):
+        self.service = DataStandardizationService()
+        self.parser_output = make_parser_output(5)
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name, data, opener=open):
+        path = os.path.join(self.temp_dir.name, name)
+        with opener(path, 'wb') as f:
+            f.write(data.encode('utf-8'))
+        return path
+
+    def test_array_and_ndjson_inputs(self):
+        array = json.dumps(self.parser_output, ensure_ascii=False, indent=2)
+        ndjson = '\n'.join(json.dumps(item, ensure_ascii=False) for item in self.parser_output) + '\n'
+        for source in (io.StringIO(array), io.BytesIO(ndjson.encode('utf-8'))):
+            self.assertEqual(list(iter_json_documents(source, chunk_size=7)), self.parser_output)
+
+    def test_compressed_files(self):
+        array = json.dumps(self.parser_output, ensure_ascii=False)
+        for name, opener in (('out.json.gz', gzip.open), ('out.json.bz2', bz2.open)):
+            path = self.write(name, array, opener)
+            self.assertEqual(list(iter_json_documents(path)), self.parser_output)
+
+    def test_caller_streams_stay_open(self):
+        array = json.dumps(self.parser_output, ensure_ascii=False).encode('utf-8')
+        sources = [io.BytesIO(array), io.BytesIO(gzip.compress(array)), io.StringIO(array.decode('utf-8'))]
+        with open(self.write('out.json', array.decode('utf-8')), 'rb', buffering=0) as raw:
+            sources.append(raw)
+            for source in sources:
+                self.assertEqual(list(iter_json_documents(source)), self.parser_output)
+                self.assertFalse(source.closed)
+
+    def test_truncated_array_raises(self):
+        with self.assertRaises(JSONStreamError):
+            list(iter_json_documents(io.StringIO('[{"a": 1}, {"b": ')))
+
+    def test_totals_match_process_json_input(self):
+        path = self.write('out.json', json.dumps(self.parser_output, ensure_ascii=False))
+        seen = []
+        streamed = self.service.process_json_stream(path, on_file_result=lambda r: seen.append(r.filename))
+        expected = self.service.process_json_input(self.parser_output)
+        self.assertEqual(streamed.processing_summary, expected.processing_summary)
+        self.assertEqual(streamed.total_transactions, 10)
+        self.assertEqual(streamed.file_results, [])
+        self.assertEqual(seen, [item["filename"] for item in self.parser_output])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from src.utils.keyword_automaton import KeywordAutomaton, build_keyword_automaton
+from src.utils.constants import CURRENCY_MAPPING
+from src.processors.amount_processor import AmountProcessor
+from src.processors.main_processor import DataStandardizationService
+from src.models.parser_models import TransactionExtractionConfig, ParsedFileResult
+
+
+class TestKeywordAutomaton(unittest.TestCase):
+    def test_longest_match_wins(self):
+        automaton = KeywordAutomaton({
+            'руб': [('currency', 'RUB')],
+            'рубль': [('currency', 'RUB')],
+            'кредит': [('credit', 'кредит')],
+            'кредитная карта': [('debit', 'кредитная карта')],
+        })
+        matches = automaton.find_longest("Оплата кредитная карта 100 рубль")
+        self.assertEqual([m.keyword for m in matches], ['кредитная карта', 'рубль'])
+
+    def test_first_is_leftmost_within_category(self):
+        automaton = build_keyword_automaton(['оплата'], ['возврат'], CURRENCY_MAPPING)
+        self.assertEqual(automaton.first("$100 тг", 'currency'), 'USD')
+        self.assertEqual(automaton.first("возврат 100", 'debit'), None)
+
+    def test_automaton_is_built_once_per_config(self):
+        first = build_keyword_automaton(['оплата'], ['возврат'], CURRENCY_MAPPING)
+        second = build_keyword_automaton(['оплата'], ['возврат'], dict(CURRENCY_MAPPING))
+        self.assertIs(first, second)
+
+
+class TestSharedAutomaton(unittest.TestCase):
+    def test_amount_processor_no_longer_depends_on_mapping_order(self):
+        processor = AmountProcessor()
+        self.assertEqual(processor.standardize_currency(None, "100 рубль"), ('RUB', ['currency_assumed']))
+
+    def test_config_aliases_reach_extractor_and_amount_processor(self):
+        aliases = dict(CURRENCY_MAPPING, сом='KGS')
+        config = TransactionExtractionConfig(currency_aliases=aliases, credit_keywords=['кэшбэк'])
+        service = DataStandardizationService(config)
+        self.assertIs(service.amount_processor.keyword_automaton, service.text_extractor.keyword_automaton)
+        result = service.process_parsed_file(ParsedFileResult(
+            filename="kg.pdf",
+            extracted_text="19.06.2025 Кэшбэк 1 200 сом"
+        ))
+        transaction = result.successful_transactions[0]
+        self.assertEqual(transaction.currency, 'KGS')
+        self.assertEqual(transaction.transaction_type.value, 'CREDIT')
+
+
+if __name__ == '__main__':
+    unittest.main()
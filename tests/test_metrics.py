@@ -0,0 +1,73 @@
+import unittest
+from src.api_interface import DataStandardizationAPI
+from src.models.parser_models import ParsedFileResult, ProcessingConfig
+from src.processors.main_processor import DataStandardizationService
+from src.utils.metrics import MetricsRecorder, NULL_METRICS, diff_snapshots
+
+
+def make_parsed_batch():
+    return [
+        ParsedFileResult(filename="a.csv", extracted_tables=[[
+            {"transaction_date": "19.06.2025", "description": "Оплата", "debit": "15 000 тг", "credit": None},
+            {"transaction_date": "June 20 2025", "description": "Refund", "debit": None, "credit": "10"},
+            {"transaction_date": "нет даты", "description": "Ошибка", "debit": "100"}
+        ]]),
+        ParsedFileResult(filename="b.pdf", extracted_text="Чек\n20.07.2025 Перевод 2 500 тг\nСпасибо")
+    ]
+
+
+class TestMetrics(unittest.TestCase):
+    def test_stage_timings_and_counters_in_summary(self):
+        service = DataStandardizationService(processing_config=ProcessingConfig(collect_metrics=True))
+        result = service.process_parsed_batch(make_parsed_batch())
+        metrics = result.processing_summary['metrics']
+        for stage in ('validation', 'date', 'description', 'amount', 'currency', 'model',
+                      'row_batch', 'format_inference', 'text_extraction', 'file'):
+            self.assertIn(stage, metrics['stages'])
+        self.assertEqual(metrics['stages']['file']['calls'], 2)
+        self.assertEqual(metrics['counters']['date_dateutil_fallback'], 1)
+        self.assertEqual(metrics['counters']['date_now_fallback'], 1)
+        self.assertEqual(metrics['counters']['text_lines_scanned'], 3)
+        self.assertEqual(metrics['counters']['text_transactions_extracted'], 1)
+        self.assertEqual(metrics['counters']['rows_processed'], 4)
+        file_metrics = result.file_results[1].processing_summary['metrics']
+        self.assertEqual(file_metrics['counters']['text_lines_scanned'], 3)
+        self.assertEqual(service.get_metrics()['counters'], metrics['counters'])
+
+    def test_prometheus_snapshot(self):
+        api = DataStandardizationAPI(processing_config=ProcessingConfig(collect_metrics=True))
+        api.process_parser_output([f.model_dump() for f in make_parsed_batch()])
+        text = api.service.get_prometheus_metrics()
+        self.assertIn('# TYPE standardization_stage_seconds_total counter', text)
+        self.assertIn('standardization_stage_calls_total{stage="response_building"} 1', text)
+        self.assertIn('standardization_events_total{event="rows_processed"} 4', text)
+
+    def test_parallel_workers_report_metrics(self):
+        service = DataStandardizationService(processing_config=ProcessingConfig(
+            collect_metrics=True, workers=2, parallel_min_files=1
+        ))
+        result = service.process_parsed_batch(make_parsed_batch())
+        self.assertEqual(result.processing_summary['metrics']['counters']['rows_processed'], 4)
+        self.assertEqual(service.get_metrics()['counters']['rows_processed'], 4)
+
+    def test_disabled_by_default(self):
+        service = DataStandardizationService()
+        self.assertIs(service.metrics, NULL_METRICS)
+        result = service.process_parsed_batch(make_parsed_batch())
+        self.assertNotIn('metrics', result.processing_summary)
+        self.assertEqual(service.get_metrics(), {'stages': {}, 'counters': {}})
+
+    def test_diff_snapshots(self):
+        recorder = MetricsRecorder()
+        recorder.increment('a')
+        before = recorder.snapshot()
+        recorder.increment('a', 2)
+        recorder.increment('b')
+        recorder.observe('stage', recorder.clock())
+        diff = diff_snapshots(recorder.snapshot(), before)
+        self.assertEqual(diff['counters'], {'a': 2, 'b': 1})
+        self.assertEqual(diff['stages']['stage']['calls'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
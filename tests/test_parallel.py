@@ -0,0 +1,27 @@
+import unittest
+from src.processors.main_processor import DataStandardizationService
+from src.models.parser_models import ProcessingConfig
+from tests.helpers import file_view, make_parsed_batch
+
+
+class TestParallelBatch(unittest.TestCase):
+    def test_parallel_matches_serial_in_input_order(self):
+        batch = make_parsed_batch(9)
+        serial = DataStandardizationService().process_parsed_batch(batch)
+        parallel_service = DataStandardizationService(processing_config=ProcessingConfig(
+            workers=2, parallel_chunk_size=2, parallel_min_files=2
+        ))
+        self.assertTrue(parallel_service.parallel_processor.should_parallelize(len(batch)))
+        parallel = parallel_service.process_parsed_batch(batch)
+        self.assertEqual(parallel.processing_summary, serial.processing_summary)
+        self.assertEqual([file_view(r) for r in parallel.file_results],
+                         [file_view(r) for r in serial.file_results])
+
+    def test_small_batches_stay_serial(self):
+        service = DataStandardizationService(processing_config=ProcessingConfig(workers=4))
+        self.assertFalse(service.parallel_processor.should_parallelize(3))
+        self.assertFalse(DataStandardizationService().parallel_processor.should_parallelize(1000))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import json
+import os
+import pstats
+import tempfile
+import unittest
+from src.models.parser_models import ParsedFileResult, ProcessingConfig
+from src.processors.main_processor import DataStandardizationService
+from src.utils.profiler import SlowInputProfiler
+
+
+def make_parsed_batch():
+    return [
+        ParsedFileResult(filename=f"statement_{i}.csv", extracted_tables=[[
+            {"transaction_date": "19.06.2025", "description": "Оплата " * (i + 1), "debit": "15 000 тг"}
+            for _ in range(i + 1)
+        ]])
+        for i in range(4)
+    ] + [ParsedFileResult(filename="scan/receipt 1.pdf", extracted_text="20.07.2025 Перевод 2 500 тг")]
+
+
+class TestSlowInputProfiler(unittest.TestCase):
+    def test_keeps_top_n(self):
+        profiler = SlowInputProfiler(top_n=2)
+        for seconds in (0.3, 0.1, 0.5, 0.2):
+            profiler.record_file(seconds, {'filename': str(seconds)})
+        self.assertEqual([record['filename'] for record in profiler.slowest_files()], ['0.5', '0.3'])
+        self.assertTrue(profiler.is_slow_row(0.1))
+        profiler.record_row(0.2, {'index': 0})
+        profiler.record_row(0.4, {'index': 1})
+        self.assertFalse(profiler.is_slow_row(0.1))
+        self.assertTrue(profiler.is_slow_row(0.3))
+
+    def test_service_records_slow_files_and_rows(self):
+        service = DataStandardizationService(processing_config=ProcessingConfig(
+            profile_slow_inputs=True, profile_top_n=3
+        ))
+        service.process_parsed_batch(make_parsed_batch())
+        report = service.get_slow_inputs()
+        self.assertEqual(len(report['slowest_files']), 3)
+        self.assertEqual(len(report['slowest_rows']), 3)
+        seconds = [record['seconds'] for record in report['slowest_files']]
+        self.assertEqual(seconds, sorted(seconds, reverse=True))
+        row = report['slowest_rows'][0]
+        self.assertIn(row['filename'], {f"statement_{i}.csv" for i in range(4)} | {"scan/receipt 1.pdf"})
+        self.assertIn('date', row['stages'])
+        self.assertGreater(row['input_size'], 0)
+        file_record = report['slowest_files'][0]
+        self.assertIn('table_rows', file_record)
+        self.assertNotIn('file', file_record['stages'])
+        self.assertEqual(report['profiles_written'], 0)
+
+    def test_writes_cprofile_stats_above_threshold(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            service = DataStandardizationService(processing_config=ProcessingConfig(
+                profile_slow_inputs=True, profile_threshold_seconds=1e-9, profile_output_dir=output_dir
+            ))
+            batch = make_parsed_batch()
+            service.process_parsed_batch(batch)
+            report = service.get_slow_inputs()
+            self.assertEqual(report['profiles_written'], len(batch))
+            profile_path = [r for r in report['slowest_files'] if r['filename'] == "scan/receipt 1.pdf"][0]['profile_path']
+            self.assertTrue(os.path.basename(profile_path).endswith('scan_receipt_1.pdf.prof'))
+            pstats.Stats(profile_path)
+            with open(profile_path[:-len('.prof')] + '.json', encoding='utf-8') as f:
+                self.assertEqual(ParsedFileResult(**json.load(f)), batch[-1])
+
+    def test_profile_covers_the_real_run(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            service = DataStandardizationService(processing_config=ProcessingConfig(
+                profile_slow_inputs=True, profile_threshold_seconds=1e-9, profile_output_dir=output_dir
+            ))
+            original = service._process_parsed_file
+            calls = []
+
+            def counted(parsed_file):
+                calls.append(parsed_file.filename)
+                return original(parsed_file)
+
+            service._process_parsed_file = counted
+            batch = make_parsed_batch()
+            service.process_parsed_batch(batch)
+            self.assertEqual(calls, [parsed_file.filename for parsed_file in batch])
+            profile_path = service.get_slow_inputs()['slowest_files'][0]['profile_path']
+            functions = {(os.path.basename(path), name) for path, _, name in pstats.Stats(profile_path).stats}
+            self.assertIn(('main_processor.py', '_process_parsed_file'), functions)
+            self.assertNotIn(('main_processor.py', '__init__'), functions)
+
+    def test_disabled_by_default(self):
+        service = DataStandardizationService()
+        self.assertIsNone(service.profiler)
+        self.assertEqual(service.get_slow_inputs(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import io
+import json
+import unittest
+from src.api_interface import DataStandardizationAPI
+from src.utils.response_writer import ResponseStreamWriter
+
+
+def make_parser_output(count):
+    return [
+        {
+            "filename": f"statement_{i}.csv",
+            "extracted_tables": [[
+                {"transaction_date": "19.06.2025", "description": f"Оплата {i}",
+                 "debit": "1000 тг", "credit": None},
+                {"transaction_date": "20.06.2025", "description": "Зарплата",
+                 "debit": None, "credit": "500 000"}
+            ]],
+            "extracted_text": "",
+            "error": "Parse error" if i == 2 else None
+        }
+        for i in range(4)
+    ]
+
+
+def without_ids(response):
+    for transaction in response["standardized_transactions"]:
+        transaction.pop("transaction_id")
+    return response
+
+
+class TestResponseStreamWriter(unittest.TestCase):
+    def setUp(self):
+        self.api = DataStandardizationAPI()
+        self.parser_output = make_parser_output(4)
+        self.expected = without_ids(self.api.process_parser_output(self.parser_output))
+
+    def test_json_mode_matches_response(self):
+        output = io.StringIO()
+        result = self.api.write_parser_output(self.parser_output, output)
+        self.assertEqual(without_ids(json.loads(output.getvalue())), self.expected)
+        self.assertEqual(result["summary"], self.expected["summary"])
+        self.assertEqual(result["spilled_shards"], 0)
+
+    def test_spills_to_shards_over_budget(self):
+        output = io.BytesIO()
+        source = io.StringIO(json.dumps(self.parser_output))
+        result = self.api.write_parser_output(source, output, memory_budget=100)
+        self.assertEqual(result["spilled_shards"], 4)
+        self.assertEqual(without_ids(json.loads(output.getvalue().decode('utf-8'))), self.expected)
+
+    def test_json_mode_streams_transactions_before_summary(self):
+        output = io.StringIO()
+        writer = ResponseStreamWriter(output)
+        writer.add_file({"filename": "a.csv"}, [{"amount": 1.0}, {"amount": 2.0}])
+        self.assertEqual(output.getvalue(), '{"standardized_transactions": [{"amount": 1.0},{"amount": 2.0}')
+        writer.add_file({"filename": "b.csv"}, [{"amount": 3.0}])
+        writer.finish({"total_files": 2})
+        response = json.loads(output.getvalue())
+        self.assertEqual(list(response), ["standardized_transactions", "file_results", "status", "summary"])
+        self.assertEqual([t["amount"] for t in response["standardized_transactions"]], [1.0, 2.0, 3.0])
+        self.assertEqual(response["file_results"], [{"filename": "a.csv"}, {"filename": "b.csv"}])
+
+    def test_failure_after_streaming_keeps_valid_json(self):
+        output = io.StringIO()
+        source = io.StringIO(json.dumps(self.parser_output)[:-1] + ',')
+        result = self.api.write_parser_output(source, output)
+        self.assertEqual(result["status"], "error")
+        response = json.loads(output.getvalue())
+        self.assertEqual(response["status"], "error")
+        self.assertEqual(len(response["standardized_transactions"]), 6)
+        self.assertEqual(len(response["file_results"]), 4)
+
+    def test_ndjson_mode(self):
+        output = io.StringIO()
+        self.api.write_parser_output(self.parser_output, output, mode="ndjson")
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        record_types = [record.pop("record_type") for record in records]
+        self.assertEqual(record_types.count("transaction"), 6)
+        self.assertEqual(record_types.count("file_result"), 4)
+        self.assertEqual(record_types[-1], "summary")
+        self.assertEqual(records[-1]["summary"], self.expected["summary"])
+        transactions = [record for record, kind in zip(records, record_types) if kind == "transaction"]
+        for transaction in transactions:
+            transaction.pop("transaction_id")
+        self.assertEqual(transactions, self.expected["standardized_transactions"])
+
+    def test_invalid_stream_writes_error(self):
+        output = io.StringIO()
+        result = self.api.write_parser_output(io.StringIO('[{"filename": "a.csv"},'), output)
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(json.loads(output.getvalue())["status"], "error")
+
+
+if __name__ == '__main__':
+    unittest.main()
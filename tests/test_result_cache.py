@@ -0,0 +1,200 @@
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from unittest import mock
+from src.processors.main_processor import DataStandardizationService
+from src.models.parser_models import ParsedFileResult, ProcessingConfig, TransactionExtractionConfig
+from src.utils.result_cache import ResultCache, SQLiteResultStore
+from tests.helpers import file_view, make_parsed_batch
+
+
+def fake_datetime(day):
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2030, 1, day)
+
+    return FakeDatetime
+
+
+class TestResultCache(unittest.TestCase):
+    def test_repeated_files_are_served_from_memory(self):
+        batch = make_parsed_batch(3)
+        service = DataStandardizationService(processing_config=ProcessingConfig(result_cache_size=16))
+        first = service.process_parsed_batch(batch)
+        second = service.process_parsed_batch(batch)
+        self.assertEqual(first.processing_summary['result_cache']['misses'], 4)
+        summary = second.processing_summary['result_cache']
+        self.assertEqual((summary['memory_hits'], summary['misses'], summary['hit_rate']), (4, 0, 100.0))
+        self.assertEqual([file_view(r) for r in second.file_results], [file_view(r) for r in first.file_results])
+        self.assertEqual(
+            [r._segment_starts for r in second.file_results], [r._segment_starts for r in first.file_results]
+        )
+
+    def test_cached_results_are_copies(self):
+        batch = make_parsed_batch(1)
+        service = DataStandardizationService(processing_config=ProcessingConfig(result_cache_size=16))
+        first = service.process_parsed_file(batch[0])
+        expected = len(first.successful_transactions)
+        first.successful_transactions.clear()
+        second = service.process_parsed_file(batch[0])
+        self.assertEqual(len(second.successful_transactions), expected)
+        self.assertGreater(expected, 0)
+
+    def test_key_depends_on_content_and_config(self):
+        parsed_file = make_parsed_batch(1)[0]
+        service = DataStandardizationService(processing_config=ProcessingConfig(result_cache_size=16))
+        key = service.result_cache_key(parsed_file)
+        self.assertEqual(key, service.result_cache_key(parsed_file.model_copy()))
+        self.assertNotEqual(key, service.result_cache_key(parsed_file.model_copy(update={'filename': 'other.csv'})))
+        other_extraction = DataStandardizationService(
+            TransactionExtractionConfig(min_description_length=5), ProcessingConfig(result_cache_size=16)
+        )
+        self.assertNotEqual(key, other_extraction.result_cache_key(parsed_file))
+        other_engine = DataStandardizationService(processing_config=ProcessingConfig(
+            result_cache_size=16, engine="columnar"
+        ))
+        self.assertNotEqual(key, other_engine.result_cache_key(parsed_file))
+        more_workers = DataStandardizationService(processing_config=ProcessingConfig(result_cache_size=16, workers=4))
+        self.assertEqual(key, more_workers.result_cache_key(parsed_file))
+
+    def test_disk_tier_survives_restart(self):
+        batch = make_parsed_batch(2)
+        with tempfile.TemporaryDirectory() as directory:
+            config = ProcessingConfig(result_cache_path=os.path.join(directory, 'results.sqlite'))
+            first_service = DataStandardizationService(processing_config=config)
+            first = first_service.process_parsed_batch(batch)
+            first_service.result_cache.close()
+            service = DataStandardizationService(processing_config=config)
+            second = service.process_parsed_batch(batch)
+            self.assertEqual(second.processing_summary['result_cache']['disk_hits'], 3)
+            self.assertEqual(service.get_health_check()['result_cache']['disk']['entries'], 3)
+            service.result_cache.close()
+        self.assertEqual([file_view(r) for r in second.file_results], [file_view(r) for r in first.file_results])
+
+    def test_dates_taken_from_today_are_not_cached(self):
+        parsed_file = ParsedFileResult(filename="undated.csv", extracted_tables=[[
+            {"transaction_date": "нет даты", "description": "Оплата", "debit": "100"}
+        ]])
+        stable_file = make_parsed_batch(1)[0]
+        with tempfile.TemporaryDirectory() as directory:
+            config = ProcessingConfig(result_cache_size=16, result_cache_path=os.path.join(directory, 'results.sqlite'))
+            dates = []
+            for day in (1, 2):
+                with mock.patch('src.processors.date_processor.datetime', fake_datetime(day)):
+                    service = DataStandardizationService(processing_config=config)
+                    result = service.process_parsed_batch([parsed_file, stable_file])
+                    dates.append(result.file_results[0].successful_transactions[0].transaction_date)
+                    summary = result.processing_summary['result_cache']
+                    self.assertEqual(service.result_cache.disk.stats()['entries'], 1)
+                    service.result_cache.close()
+            self.assertEqual(dates, ['2030-01-01T00:00:00Z', '2030-01-02T00:00:00Z'])
+            self.assertEqual((summary['disk_hits'], summary['misses']), (1, 1))
+
+    def test_disk_tier_evicts_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = SQLiteResultStore(os.path.join(directory, 'results.sqlite'), max_bytes=250)
+            store.put('a', b'a' * 100)
+            store.put('b', b'b' * 100)
+            store.get('a')
+            store.put('c', b'c' * 100)
+            store.put('huge', b'h' * 300)
+            self.assertEqual(store.get('a'), b'a' * 100)
+            self.assertIsNone(store.get('b'))
+            self.assertIsNone(store.get('huge'))
+            self.assertEqual((store.stats()['entries'], store.evictions), (2, 1))
+            self.assertEqual(store.total_bytes, store.stats()['bytes'])
+            store.put('a', b'a' * 50)
+            self.assertEqual(store.total_bytes, 150)
+            store.close()
+            reopened = SQLiteResultStore(os.path.join(directory, 'results.sqlite'), max_bytes=250)
+            self.assertEqual(reopened.total_bytes, 150)
+            reopened.close()
+
+    def test_concurrent_requests_are_coalesced(self):
+        cache = ResultCache(16)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {'value': 42}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('key', compute)))
+                   for _ in range(4)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        while cache.snapshot()['coalesced'] < 3:
+            pass
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'value': 42}] * 4)
+        self.assertEqual(cache.summary()['hit_rate'], 75.0)
+
+    def test_failures_are_not_cached(self):
+        cache = ResultCache(16)
+
+        def fail():
+            raise ValueError("сбой")
+
+        with self.assertRaises(ValueError):
+            cache.get_or_compute('key', fail)
+        self.assertEqual(cache.get_or_compute('key', lambda: 1), 1)
+        self.assertEqual(cache.snapshot()['misses'], 2)
+
+    def test_parallel_batch_uses_parent_cache(self):
+        batch = make_parsed_batch(4)
+        service = DataStandardizationService(processing_config=ProcessingConfig(
+            workers=2, parallel_min_files=2, result_cache_size=16
+        ))
+        first = service.process_parsed_batch(batch)
+        second = service.process_parsed_batch(batch)
+        self.assertEqual(first.processing_summary['result_cache']['misses'], 5)
+        self.assertEqual(second.processing_summary['result_cache']['memory_hits'], 5)
+        self.assertEqual([file_view(r) for r in second.file_results], [file_view(r) for r in first.file_results])
+
+    def test_cache_hits_do_not_replay_metrics(self):
+        batch = make_parsed_batch(4)
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                service = DataStandardizationService(processing_config=ProcessingConfig(
+                    workers=workers, parallel_min_files=2, collect_metrics=True, result_cache_size=100
+                ))
+                first = service.process_parsed_batch(batch)
+                self.assertGreater(first.processing_summary['metrics']['counters']['rows_processed'], 0)
+                counters = service.get_metrics()['counters']
+                second = service.process_parsed_batch(batch)
+                self.assertEqual(second.processing_summary['metrics']['counters'], {})
+                for file_result in second.file_results:
+                    self.assertEqual(file_result.processing_summary['metrics']['counters'], {})
+                self.assertEqual(service.get_metrics()['counters'], counters)
+
+    def test_server_workers_share_one_cache(self):
+        from src.server import StandardizationHTTPServer
+        server = StandardizationHTTPServer(
+            ('127.0.0.1', 0), processing_config=ProcessingConfig(result_cache_size=16), workers=3
+        )
+        try:
+            caches = {id(api.service.result_cache) for api in server.apis}
+            self.assertEqual(len(caches), 1)
+        finally:
+            server.server_close()
+
+    def test_disabled_by_default(self):
+        service = DataStandardizationService()
+        self.assertIsNone(service.result_cache)
+        self.assertNotIn('result_cache', service.process_parsed_batch(make_parsed_batch(1)).processing_summary)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import http.client
+import json
+import threading
+import unittest
+from src.server import StandardizationHTTPServer
+
+PARSER_OUTPUT = [
+    {
+        "filename": "statement.csv",
+        "extracted_tables": [[
+            {"transaction_date": "19.06.2025", "description": "Оплата", "debit": "15 000 тг", "credit": None},
+            {"transaction_date": "20.06.2025", "description": "Зарплата", "debit": None, "credit": "500000"}
+        ]],
+        "extracted_text": "",
+        "error": None
+    },
+    {"filename": "broken.pdf", "extracted_tables": [], "extracted_text": "", "error": "Parse error"}
+]
+
+
+class TestStandardizationHTTPServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StandardizationHTTPServer(('127.0.0.1', 0), workers=1, queue_size=0, max_body_bytes=4096)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.connection = http.client.HTTPConnection('127.0.0.1', self.server.server_address[1], timeout=10)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def request(self, method, path, body=None, headers=None):
+        self.connection.request(method, path, body=body, headers=headers or {})
+        response = self.connection.getresponse()
+        return response, response.read()
+
+    def test_batch_is_streamed_over_keep_alive(self):
+        body = json.dumps(PARSER_OUTPUT).encode('utf-8')
+        first_socket = None
+        for _ in range(2):
+            response, data = self.request('POST', '/process', body)
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.getheader('Transfer-Encoding'), 'chunked')
+            result = json.loads(data)
+            self.assertEqual(result["status"], "success")
+            self.assertEqual(result["summary"]["total_files"], 2)
+            self.assertEqual(len(result["standardized_transactions"]), 2)
+            first_socket = first_socket or self.connection.sock
+            self.assertIs(self.connection.sock, first_socket)
+
+    def test_ndjson_output_and_single_file(self):
+        body = '\n'.join(json.dumps(item) for item in PARSER_OUTPUT).encode('utf-8')
+        response, data = self.request('POST', '/process?format=ndjson', body)
+        records = [json.loads(line) for line in data.decode('utf-8').splitlines()]
+        self.assertEqual(records[-1]["record_type"], "summary")
+        response, data = self.request('POST', '/process/file', json.dumps(PARSER_OUTPUT[0]).encode('utf-8'))
+        self.assertEqual(response.status, 200)
+        self.assertEqual(json.loads(data)["summary"]["successful_transactions"], 2)
+        response, data = self.request('POST', '/process/file', b'{not json')
+        self.assertEqual(response.status, 400)
+
+    def test_limits_and_overload(self):
+        response, _ = self.request('POST', '/process', b'[' + b' ' * 5000 + b']')
+        self.assertEqual(response.status, 413)
+        self.connection.close()
+        self.assertTrue(self.server._admission.acquire(blocking=False))
+        try:
+            response, data = self.request('POST', '/process', b'[]')
+            self.assertEqual(response.status, 503)
+            self.assertEqual(response.getheader('Retry-After'), '1')
+        finally:
+            self.server._admission.release()
+        self.connection.close()
+        response, _ = self.request('POST', '/process', b'[]')
+        self.assertEqual(response.status, 200)
+
+    def test_health_formats_and_unknown_path(self):
+        response, data = self.request('GET', '/health')
+        health = json.loads(data)
+        self.assertEqual(health["status"], "healthy")
+        self.assertEqual(health["server"]["workers"], 1)
+        response, data = self.request('GET', '/formats')
+        self.assertIn("input_formats", json.loads(data))
+        response, _ = self.request('GET', '/metrics')
+        self.assertEqual(response.status, 200)
+        response, _ = self.request('GET', '/missing')
+        self.assertEqual(response.status, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
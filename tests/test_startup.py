@@ -0,0 +1,13 @@
+import unittest
+from benchmarks.startup import measure_startup
+
+
+class TestColdStart(unittest.TestCase):
+    def test_row_engine_does_not_import_heavy_dependencies(self):
+        result = measure_startup(runs=1)
+        self.assertEqual(result['loaded_modules'], [])
+        self.assertGreater(result['first_result_ms'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from src.models.parser_models import ParsedFileResult, ProcessingConfig, BatchProcessingResult
+from src.processors.main_processor import DataStandardizationService
+
+
+def make_parsed_batch():
+    return [
+        ParsedFileResult(filename="a.csv", extracted_tables=[[
+            {"transaction_date": "19.06.2025", "description": "Оплата", "debit": "15 000 тг", "credit": None},
+            {"transaction_date": "01.05.2025", "description": "Зарплата", "debit": None, "credit": "500 000", "currency": "KZT"},
+            {"transaction_date": "02.05.2025", "description": "Покупка", "amount": "-20,50", "currency": "USD"}
+        ]]),
+        ParsedFileResult(filename="b.pdf", extracted_text="20.07.2025 Перевод 2 500 тг"),
+        ParsedFileResult(filename="c.pdf", error="Parse error"),
+        ParsedFileResult(filename="d.csv", extracted_tables=[[
+            {"transaction_date": "03.05.2025", "description": "Кофе", "debit": "10.25", "currency": "USD"}
+        ]])
+    ]
+
+
+def legacy_statistics(batch_result):
+    flags, types, currencies = {}, {'DEBIT': 0, 'CREDIT': 0}, {}
+    for file_result in batch_result.file_results:
+        for transaction in file_result.successful_transactions:
+            for flag in transaction.data_quality_flags:
+                flags[flag] = flags.get(flag, 0) + 1
+            types[transaction.transaction_type.value] += 1
+            currencies[transaction.currency] = currencies.get(transaction.currency, 0) + 1
+    return flags, types, currencies
+
+
+class TestProcessingStatistics(unittest.TestCase):
+    def setUp(self):
+        self.service = DataStandardizationService()
+        self.batch = make_parsed_batch()
+
+    def test_report_matches_full_walk(self):
+        result = self.service.process_parsed_batch(self.batch)
+        report = self.service.get_processing_statistics(result)
+        flags, types, currencies = legacy_statistics(result)
+        self.assertEqual(report['quality_flags_distribution'], flags)
+        self.assertEqual(report['transaction_types_distribution'], types)
+        self.assertEqual(report['currency_distribution'], currencies)
+        self.assertEqual(report['files_with_text_extraction'], 1)
+        self.assertEqual(report['files_with_table_data'], 2)
+        self.assertEqual(report['average_transactions_per_file'], 5 / 4)
+        self.assertEqual(report['amount_statistics']['USD'], {'count': 2, 'total': 30.75, 'min': 10.25, 'max': 20.5})
+        self.assertEqual(report['date_range'], {'min': '2025-05-01T00:00:00Z', 'max': '2025-07-20T00:00:00Z'})
+        self.assertEqual(result.processing_summary['source_type_distribution'],
+                         {'table': 2, 'text': 1, 'error': 1})
+
+    def test_merged_chunks_equal_whole_batch(self):
+        whole = self.service.process_parsed_batch(self.batch).statistics
+        merged = self.service.process_parsed_batch(self.batch[:2]).statistics
+        merged.merge(self.service.process_parsed_batch(self.batch[2:]).statistics)
+        self.assertEqual(merged, whole)
+        parallel_service = DataStandardizationService(processing_config=ProcessingConfig(
+            workers=2, parallel_min_files=1, compact_results=True
+        ))
+        self.assertEqual(parallel_service.process_parsed_batch(self.batch).statistics, whole)
+
+    def test_streamed_batch_keeps_statistics(self):
+        result = self.service.process_json_documents([f.model_dump() for f in self.batch])
+        self.assertEqual(result.file_results, [])
+        self.assertEqual(result.statistics.successful_transactions, 5)
+
+    def test_external_results_are_recomputed(self):
+        result = self.service.process_parsed_batch(self.batch)
+        external = BatchProcessingResult(**result.model_dump(exclude={'statistics'}))
+        self.assertEqual(
+            self.service.get_processing_statistics(external),
+            self.service.get_processing_statistics(result)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
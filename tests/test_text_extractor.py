@@ -0,0 +1,121 @@
+import gzip
+import io
+import mmap
+import tempfile
+import unittest
+from src.processors.text_extractor import TextTransactionExtractor
+from src.processors.text_scanner import TextTokenScanner
+from src.utils.keyword_automaton import build_keyword_automaton
+from src.utils.constants import CURRENCY_MAPPING
+
+
+class TestTextTokenScanner(unittest.TestCase):
+    def setUp(self):
+        automaton = build_keyword_automaton(['оплата'], ['возврат'], CURRENCY_MAPPING)
+        self.scanner = TextTokenScanner(automaton)
+
+    def test_emits_typed_tokens_with_spans(self):
+        line = self.scanner.scan("21.06.2025 Покупка в магазине METRO 4600 тг")
+        self.assertEqual([(t.kind, t.value) for t in line.tokens], [('date', '21.06.2025'), ('amount', '4600 тг')])
+        amount = line.first('amount')
+        self.assertEqual(amount.currency, 'KZT')
+        self.assertEqual(line.text[amount.start:amount.end], '4600 тг')
+
+    def test_dates_are_not_reported_as_amounts(self):
+        line = self.scanner.scan("Дата: 21.06.2025")
+        self.assertIsNone(line.first('amount'))
+
+    def test_comma_thousands_amount_with_currency(self):
+        amount = self.scanner.scan("2024-01-05 Зачисление 1,234.56 USD").first('amount')
+        self.assertEqual((amount.value, amount.currency), ('1,234.56 USD', 'USD'))
+
+    def test_month_name_dates_keep_full_text(self):
+        line = self.scanner.scan("19 июня 2025 Оплата 1 500 USD")
+        self.assertEqual(line.first('date').value, '19 июня 2025')
+        self.assertEqual(line.first('amount').currency, 'USD')
+        self.assertEqual(line.labels('debit'), ['оплата'])
+
+
+class TestTextTransactionExtractor(unittest.TestCase):
+    def setUp(self):
+        self.extractor = TextTransactionExtractor()
+
+    def test_extracts_line_transaction(self):
+        transactions = self.extractor.extract_transactions_from_text(
+            "21.06.2025 Покупка в магазине METRO 4600 тг"
+        )
+        self.assertEqual(transactions, [{
+            'transaction_date': '21.06.2025',
+            'description': 'Покупка в магазине METRO',
+            'amount': None,
+            'debit': '4600 тг',
+            'credit': None,
+            'currency': 'KZT'
+        }])
+
+    def test_date_line_uses_amount_from_context(self):
+        transactions = self.extractor.extract_transactions_from_text(
+            "Дата 19.06.2025\nЗачисление зарплаты\n500 000 тг"
+        )
+        self.assertEqual(len(transactions), 1)
+        self.assertEqual(transactions[0]['credit'], '500 000 тг')
+        self.assertEqual(transactions[0]['description'], 'Дата Зачисление зарплаты')
+
+    def test_context_stops_at_lines_with_their_own_date(self):
+        transactions = self.extractor.extract_transactions_from_text(
+            "01.06.2025 Оплата аренды 5000 тг\n02.06.2025 Перевод между счетами\nКомментарий к переводу"
+        )
+        self.assertEqual(len(transactions), 1)
+        self.assertEqual(transactions[0]['transaction_date'], '01.06.2025')
+        self.assertEqual(transactions[0]['description'], 'Оплата аренды')
+        transactions = self.extractor.extract_transactions_from_text(
+            "01.06.2025 Перевод между счетами\n02.06.2025 Оплата аренды 5000 тг"
+        )
+        self.assertEqual([t['transaction_date'] for t in transactions], ['02.06.2025'])
+
+    def test_comma_thousands_amount_keeps_its_currency(self):
+        transactions = self.extractor.extract_transactions_from_text("2024-01-05 Зачисление 1,234.56 USD")
+        self.assertEqual(len(transactions), 1)
+        transaction = transactions[0]
+        self.assertEqual(transaction['currency'], 'USD')
+        self.assertEqual(transaction['description'], 'Зачисление')
+        self.assertEqual(transaction['debit'] or transaction['credit'], '1,234.56 USD')
+
+    def test_duplicate_lines_are_removed(self):
+        text = "23.06.2025 - Возврат товара 2500 тенге\n23.06.2025 - Возврат товара 2500 тенге"
+        self.assertEqual(len(self.extractor.extract_transactions_from_text(text)), 1)
+
+
+class TestStreamingTextExtractor(unittest.TestCase):
+    def setUp(self):
+        self.extractor = TextTransactionExtractor()
+        self.text = "\n".join([
+            "Выписка",
+            "Дата 19.06.2025",
+            "Зачисление зарплаты",
+            "500 000 тг",
+            "21.06.2025 Покупка в магазине METRO 4600 тг",
+            "21.06.2025 Покупка в магазине METRO 4600 тг",
+            "22.06.2025 Перевод",
+        ])
+
+    def test_stream_sources_match_string_result(self):
+        expected = self.extractor.extract_transactions_from_text(self.text)
+        self.assertEqual(len(expected), 2)
+        data = self.text.encode('utf-8')
+        self.assertEqual(list(self.extractor.iter_transactions(io.BytesIO(gzip.compress(data)))), expected)
+        with tempfile.TemporaryFile() as f:
+            f.write(data)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(list(self.extractor.iter_transactions(mapped)), expected)
+
+    def test_transactions_are_yielded_before_input_is_exhausted(self):
+        stream = io.StringIO(self.text + "\n" + "шум\n" * 100000)
+        transactions = self.extractor.iter_transactions(stream)
+        self.assertEqual(next(transactions)['credit'], '500 000 тг')
+        self.assertLess(stream.tell(), len(stream.getvalue()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from decimal import Decimal
+from src.processors.main_processor import DataStandardizationService
+from src.processors.validation import validate_raw_transaction
+from src.models.parser_models import ProcessingConfig
+from tests.helpers import golden_view
+
+ROWS = [
+    {"transaction_date": "19.06.2025", "description": "Кофе", "debit": "1500", "currency": "KZT"},
+    {"description": "Нет даты", "debit": "100"},
+    {"transaction_date": "19.06.2025", "description": None, "debit": "100"},
+    5,
+    {"transaction_date": "19.06.2025", "description": "Целое", "debit": 300, "credit": True},
+    {"transaction_date": "19.06.2025", "description": "Список", "debit": [1]},
+    {"transaction_date": "19.06.2025", "description": "Decimal", "amount": Decimal("10.5")},
+    {"transaction_date": 20250619, "description": "Неверная дата", "debit": "100"},
+]
+
+
+class TestCodeValidation(unittest.TestCase):
+    def test_same_results_as_exception_mode(self):
+        for engine in ("row", "columnar"):
+            with self.subTest(engine=engine):
+                expected = DataStandardizationService(
+                    processing_config=ProcessingConfig(engine=engine)
+                ).process_batch(ROWS)
+                result = DataStandardizationService(
+                    processing_config=ProcessingConfig(engine=engine, validation_mode="codes")
+                ).process_batch(ROWS)
+                self.assertEqual(
+                    [golden_view(t) for t in result.successful_transactions],
+                    [golden_view(t) for t in expected.successful_transactions]
+                )
+                self.assertEqual(
+                    [(f['index'], f['error_type']) for f in result.failed_transactions],
+                    [(f['index'], f['error_type']) for f in expected.failed_transactions]
+                )
+
+    def test_failures_carry_codes_and_lazy_messages(self):
+        service = DataStandardizationService(processing_config=ProcessingConfig(validation_mode="codes"))
+        result = service.process_batch(ROWS)
+        codes = [(f['index'], f['error_code'], f['error_field']) for f in result.failed_transactions]
+        self.assertEqual(codes, [
+            (1, 'missing_field', 'transaction_date'),
+            (2, 'invalid_type', 'description'),
+            (3, 'not_a_mapping', None),
+            (5, 'invalid_type', 'debit'),
+            (7, 'invalid_type', 'transaction_date'),
+        ])
+        self.assertNotIn('error', result.failed_transactions[0])
+        dumped = result.model_dump()['failed_transactions']
+        self.assertEqual(dumped[0]['error'], "Неверный формат входных данных: отсутствует обязательное поле transaction_date")
+        self.assertIn('int', dumped[4]['error'])
+
+    def test_undecided_values_fall_back_to_pydantic(self):
+        self.assertEqual(validate_raw_transaction(ROWS[6]), (None, None, None))
+        self.assertEqual(validate_raw_transaction({"transaction_date": b"19.06.2025", "description": "x"}),
+                         (None, None, None))
+
+
+if __name__ == '__main__':
+    unittest.main()